@@ -1 +1,32 @@
+import sys
+
 from ppb_vector.vector2 import Vector2  # noqa
+
+TYPE_CHECKING = False
+# Modules can't have __getattr__ before Python 3.7 (PEP 562)
+if TYPE_CHECKING or sys.version_info < (3, 7):
+    from ppb_vector.batch import Vector2Batch, Vector2BatchView  # noqa
+    from ppb_vector.polar import PolarVector2  # noqa
+
+# The other classes are imported on first use: their modules take a sizeable
+#  share of the time to import ppb_vector, and many users only need Vector2.
+_lazy_classes = {
+    'PolarVector2': 'ppb_vector.polar',
+    'Vector2Batch': 'ppb_vector.batch',
+    'Vector2BatchView': 'ppb_vector.batch',
+}
+
+
+def __getattr__(name):
+    try:
+        module = _lazy_classes[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    from importlib import import_module
+    value = globals()[name] = getattr(import_module(module), name)
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_lazy_classes})
@@ -0,0 +1,97 @@
+"""Faster, approximate versions of some :py:class:`Vector2 <ppb_vector.Vector2>` operations.
+
+The functions in this module trade some accuracy for throughput, and are
+meant for computations, such as visual effects, that do not need the care
+taken by :py:class:`Vector2 <ppb_vector.Vector2>` to limit rounding errors:
+
+>>> from ppb_vector import Vector2, approx
+>>> approx.rotate(Vector2(1, 0), 90).isclose(Vector2(0, 1))
+True
+
+They only accept instances of :py:class:`Vector2 <ppb_vector.Vector2>` (and
+its subclasses, which are preserved), not vector-likes, and the bounds on
+their errors assume that squaring the coordinates neither overflows nor
+underflows: they hold for vectors whose length lies between ``1e-150`` and
+``1e150``. Outside of that range, :py:func:`length` may return ``0`` or
+``inf``.
+"""
+from math import cos, radians, sin, sqrt
+
+from ppb_vector.vector2 import _make_vector, Vector2
+
+__all__ = ('length', 'normalize', 'rotate', 'scale_to')
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing  # noqa: I300
+
+    from ppb_vector.vector2 import Vector
+
+
+def length(vector: Vector2) -> float:
+    """Compute the length of a vector.
+
+    The relative error, compared to :py:attr:`Vector2.length`, is below
+    ``5e-16``.
+
+    >>> length(Vector2(3, 4))
+    5.0
+    """
+    x, y = vector.x, vector.y
+    return sqrt(x * x + y * y)
+
+
+def normalize(vector: 'Vector') -> 'Vector':
+    """Return a vector with the same direction and unit length.
+
+    The length of the result differs from 1 by less than ``1e-15``, and its
+    direction is that of ``vector`` to within ``1e-15`` radians.
+
+    >>> normalize(Vector2(3, 4))
+    Vector2(0.6000000000000001, 0.8)
+
+    Like :py:meth:`Vector2.normalize`, it raises :py:exc:`ZeroDivisionError`
+    for the zero vector.
+    """
+    x, y = vector.x, vector.y
+    inverse = 1 / sqrt(x * x + y * y)
+    return _make_vector(type(vector), x * inverse, y * inverse)
+
+
+def scale_to(vector: 'Vector', length: 'typing.SupportsFloat') -> 'Vector':
+    """Scale a vector to a given length.
+
+    The relative error on the length of the result is below ``1e-15``, and its
+    direction is that of ``vector`` to within ``1e-15`` radians.
+
+    >>> scale_to(Vector2(3, 4), 10)
+    Vector2(6.0, 8.0)
+    """
+    length = float(length)
+    if length < 0:
+        raise ValueError("scale_to takes non-negative lengths.")
+
+    x, y = vector.x, vector.y
+    if length == 0:
+        return _make_vector(type(vector), 0.0, 0.0)
+
+    ratio = length / sqrt(x * x + y * y)
+    return _make_vector(type(vector), x * ratio, y * ratio)
+
+
+def rotate(vector: 'Vector', angle: 'typing.SupportsFloat') -> 'Vector':
+    """Rotate a vector, counter-clockwise, by an angle in degrees.
+
+    For angles between -360° and 360°, the length of the result differs from
+    that of ``vector`` by less than ``1e-15`` (relative), and its direction
+    is within ``4e-15`` radians of the exact rotation. Unlike
+    :py:meth:`Vector2.rotate`, rotating repeatedly can let the length of a
+    vector drift, by up to ``1e-15`` (relative) per rotation.
+
+    >>> rotate(Vector2(3, 4), 180)
+    Vector2(-3.0000000000000004, -3.9999999999999996)
+    """
+    r = radians(angle)
+    r_cos, r_sin = cos(r), sin(r)
+    x, y = vector.x, vector.y
+    return _make_vector(type(vector), x * r_cos - y * r_sin, x * r_sin + y * r_cos)
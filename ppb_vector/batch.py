@@ -0,0 +1,457 @@
+from array import array
+from collections.abc import MutableSequence, Sequence
+from functools import partial
+from operator import index as as_index
+
+from ppb_vector.vector2 import _find_lowest_vector, _make_vector, Vector2
+
+__all__ = ('Vector2Batch', 'Vector2BatchView')
+
+#: Typecodes of the arrays which batches can store coordinates in
+_TYPECODES = ('d', 'f')
+
+# Selects all the vectors of a batch
+_ALL = slice(None)
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing  # noqa: I300
+
+    from ppb_vector.vector2 import VectorLike
+
+    # Vector2Batch or subclass
+    Batch = typing.TypeVar('Batch', bound='Vector2Batch')
+    # A slice, or indices
+    Selection = typing.Union[slice, typing.Iterable[int]]
+    # Makes a vector from float coordinates
+    Factory = typing.Callable[[float, float], Vector2]
+
+
+def _factory(cls: 'typing.Type[Vector2]') -> 'Factory':
+    """Get a function making instances of a vector class from float coordinates."""
+    if not (isinstance(cls, type) and issubclass(cls, Vector2)):
+        raise TypeError(f"Expected Vector2 or a subclass, got {cls!r}")
+    if cls.__new__ is Vector2.__new__ and cls.__init__ is Vector2.__init__:
+        # The constructor would only convert the coordinates to floats
+        return partial(_make_vector, cls)
+    return cls
+
+
+class Vector2Batch(MutableSequence):
+    """A mutable sequence of vectors, stored as packed arrays of coordinates.
+
+    :py:class:`Vector2Batch` holds many vectors in two :py:class:`arrays
+    <array.array>` of floats, :py:attr:`xs` and :py:attr:`ys`, which take about
+    16 bytes per vector instead of over 100 for a list of
+    :py:class:`Vector2`. Functions operating on many vectors at once can work
+    directly on those arrays, without creating any :py:class:`Vector2`.
+
+    >>> from ppb_vector import Vector2, Vector2Batch
+    >>> batch = Vector2Batch([(1, 2), Vector2(3, 4)])
+    >>> batch
+    Vector2Batch([Vector2(1.0, 2.0), Vector2(3.0, 4.0)])
+    >>> batch.xs
+    array('d', [1.0, 3.0])
+
+    Elements are converted to :py:class:`Vector2` when they are accessed:
+
+    >>> batch[1]
+    Vector2(3.0, 4.0)
+    >>> batch.append({'x': 5, 'y': 6})
+    >>> list(batch)
+    [Vector2(1.0, 2.0), Vector2(3.0, 4.0), Vector2(5.0, 6.0)]
+
+    **Element type**
+
+    Elements are made as instances of :py:attr:`element_type`, which is
+    :py:class:`Vector2` by default, and may be any of its subclasses:
+
+    >>> class Position(Vector2): pass
+    >>> positions = Vector2Batch([(1, 2)], element_type=Position)
+    >>> positions[0]
+    Position(1.0, 2.0)
+
+    It costs nothing more than making instances of a subclass. Slices, copies
+    and views of a batch keep its element type, and functions making batches
+    out of vectors and batches, such as :py:func:`ppb_vector.masks.where`,
+    pick the element type of their result as :py:meth:`Vector2.__add__`
+    does. Elements are made without calling the constructor of their class,
+    unless it defines ``__new__`` or ``__init__``.
+
+    **Single precision**
+
+    Coordinates are stored as double precision floats by default, like those
+    of :py:class:`Vector2`. Passing ``typecode='f'`` stores them as single
+    precision floats instead, in 8 bytes per vector:
+
+    >>> small = Vector2Batch([(0.1, 2)], typecode='f')
+    >>> small
+    Vector2Batch([Vector2(0.10000000149011612, 2.0)], typecode='f')
+
+    Elements are still accessed as double precision :py:class:`Vector2`, and
+    all operations on them are computed in double precision; only storing a
+    vector rounds its coordinates. Conversions between precisions are
+    explicit, with :py:meth:`astype`.
+
+    With ``u = 2 ** -24``, about ``6e-8``, the error budget is:
+
+    - storing a coordinate ``x`` changes it by at most ``u * abs(x)``, if
+      ``abs(x)`` is between about ``1e-38`` and ``3.4e38``; smaller
+      coordinates change by at most ``2 ** -150``, larger ones become
+      infinite. A stored vector ``v`` thus moves by at most ``u * v.length``:
+      under ``0.001`` within 10 000 units of the origin;
+    - :py:attr:`Vector2.length`, :py:meth:`Vector2.scale_by`, ``*`` and ``/``
+      by a scalar, and :py:meth:`Vector2.rotate`, which preserve relative
+      errors, are within ``u`` of the result on the original vectors, relative
+      to its length;
+    - :py:meth:`Vector2.normalize`, :py:meth:`Vector2.scale_to` and
+      :py:meth:`Vector2.truncate` are off in direction by at most ``u``
+      radians;
+    - ``a + b`` and ``a - b`` are within ``u * (a.length + b.length)``, and
+      :py:meth:`Vector2.dot` within ``2 * u * a.length * b.length``;
+    - :py:meth:`Vector2.angle` is within ``2 * u`` radians, about ``7e-6``
+      degrees;
+    - :py:meth:`Vector2.reflect` is within ``3 * u`` of the reflected
+      vector's length; as it requires normals of length 1 to within ``1e-9``,
+      stored normals must be normalized again before use;
+    - storing a result back adds at most ``u`` of its length.
+
+    Those bounds hold up to terms in ``u ** 2``, and the usual double
+    precision rounding. They exceed the default tolerance of
+    :py:meth:`Vector2.isclose`, so compare stored vectors with ``rel_tol``
+    of at least ``u`` times the number of roundings involved.
+    """
+    #: The X coordinates of the vectors
+    xs: 'array[float]'
+    #: The Y coordinates of the vectors
+    ys: 'array[float]'
+    _element_type: 'typing.Type[Vector2]'
+    _make: 'Factory'
+
+    __slots__ = ('xs', 'ys', '_element_type', '_make')
+
+    def __init__(self, vectors: 'typing.Iterable[VectorLike]' = (), *,
+                 typecode: str = 'd', element_type: 'typing.Type[Vector2]' = Vector2) -> None:
+        """Make a batch from an iterable of vector-likes.
+
+        ``typecode`` is the :py:mod:`array` typecode of the coordinates, either
+        ``'d'`` for double precision or ``'f'`` for single precision;
+        :py:exc:`ValueError` is raised for any other typecode.
+
+        ``element_type`` is the class of the elements, :py:class:`Vector2` or
+        a subclass; :py:exc:`TypeError` is raised for any other class.
+        """
+        if typecode not in _TYPECODES:
+            raise ValueError(f"Unsupported typecode {typecode!r}, expected 'd' or 'f'")
+        self.element_type = element_type
+        self.xs, self.ys = array(typecode), array(typecode)
+        self.extend(vectors)
+
+    @classmethod
+    def from_arrays(cls: 'typing.Type[Batch]', xs: 'typing.Iterable[float]',
+                    ys: 'typing.Iterable[float]', *, typecode: str = 'd',
+                    element_type: 'typing.Type[Vector2]' = Vector2) -> 'Batch':
+        """Make a batch from iterables of X and Y coordinates.
+
+        >>> Vector2Batch.from_arrays([1, 2], [3, 4])
+        Vector2Batch([Vector2(1.0, 3.0), Vector2(2.0, 4.0)])
+        """
+        self = cls(typecode=typecode, element_type=element_type)
+        self.xs, self.ys = array(typecode, xs), array(typecode, ys)
+        if len(self.xs) != len(self.ys):
+            raise ValueError(f"Got {len(self.xs)} X coordinates and {len(self.ys)} Y coordinates")
+        return self
+
+    @property
+    def typecode(self) -> str:
+        """The :py:mod:`array` typecode of the coordinates, ``'d'`` or ``'f'``."""
+        return self.xs.typecode
+
+    @property
+    def element_type(self) -> 'typing.Type[Vector2]':
+        """The class of the elements, :py:class:`Vector2` or a subclass.
+
+        Setting it changes the class of the elements without copying them.
+        """
+        return self._element_type
+
+    @element_type.setter
+    def element_type(self, element_type: 'typing.Type[Vector2]') -> None:
+        self._make = _factory(element_type)
+        self._element_type = element_type
+
+    def astype(self: 'Batch', typecode: str) -> 'Batch':
+        """Make a copy of the batch, with coordinates stored as ``typecode``.
+
+        Converting to single precision rounds coordinates, and converting back
+        is exact:
+
+        >>> Vector2Batch([(0.1, 0.5)]).astype('f').astype('d')
+        Vector2Batch([Vector2(0.10000000149011612, 0.5)])
+        """
+        return type(self).from_arrays(
+            self.xs, self.ys, typecode=typecode, element_type=self.element_type,
+        )
+
+    def view(self, item: 'Selection' = _ALL) -> 'Vector2BatchView':
+        """Make a view of some of the vectors of the batch, without copying them.
+
+        ``item`` is either a slice, or an iterable of indices; see
+        :py:class:`Vector2BatchView`.
+        """
+        return Vector2BatchView._select(self.xs, self.ys, item, self.element_type)
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return type(self).from_arrays(
+                self.xs[item], self.ys[item],
+                typecode=self.typecode, element_type=self.element_type,
+            )
+        return self._make(self.xs[item], self.ys[item])
+
+    def __setitem__(self, item, value) -> None:
+        if isinstance(item, slice):
+            values = value
+            if not isinstance(value, Vector2Batch) or value.typecode != self.typecode:
+                values = Vector2Batch(value, typecode=self.typecode)
+            self.xs[item], self.ys[item] = values.xs, values.ys
+        else:
+            self.xs[item], self.ys[item] = Vector2._unpack(value)
+
+    def __delitem__(self, item) -> None:
+        del self.xs[item]
+        del self.ys[item]
+
+    def insert(self, index: int, value: 'VectorLike') -> None:
+        """Insert a vector-like before index."""
+        x, y = Vector2._unpack(value)
+        self.xs.insert(index, x)
+        self.ys.insert(index, y)
+
+    def append(self, value: 'VectorLike') -> None:
+        """Append a vector-like to the end of the batch."""
+        x, y = Vector2._unpack(value)
+        self.xs.append(x)
+        self.ys.append(y)
+
+    def extend(self, values: 'typing.Iterable[VectorLike]') -> None:
+        """Append the vector-likes from an iterable to the end of the batch."""
+        if isinstance(values, Vector2Batch):
+            if values.typecode == self.typecode:
+                self.xs.extend(values.xs)
+                self.ys.extend(values.ys)
+            else:
+                # Arrays only extend arrays of the same typecode
+                self.xs.fromlist(values.xs.tolist())
+                self.ys.fromlist(values.ys.tolist())
+            return
+
+        for value in values:
+            self.append(value)
+
+    def __iter__(self) -> 'typing.Iterator[Vector2]':
+        return map(self._make, self.xs, self.ys)
+
+    def __eq__(self, other: 'typing.Any') -> bool:
+        if not isinstance(other, Vector2Batch):
+            return NotImplemented
+        return self.xs == other.xs and self.ys == other.ys
+
+    def __repr__(self) -> str:
+        return _repr(self)
+
+
+class _Gather(Sequence):
+    """A read-only sequence of the elements of an array at some indices."""
+
+    __slots__ = ('array', 'indices')
+
+    def __init__(self, array: 'typing.Sequence[float]', indices: 'typing.Sequence[int]') -> None:
+        self.array, self.indices = array, indices
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return _Gather(self.array, self.indices[item])
+        return self.array[self.indices[item]]
+
+    def __iter__(self) -> 'typing.Iterator[float]':
+        return map(self.array.__getitem__, self.indices)
+
+
+class Vector2BatchView(Sequence):
+    """A view of some of the vectors of a :py:class:`Vector2Batch`.
+
+    Views are made by :py:meth:`Vector2Batch.view`, from a slice, possibly
+    strided, or from indices. They share the arrays of the batch instead of
+    copying its coordinates, so changes to the batch show through its views:
+
+    >>> batch = Vector2Batch([(0, 0), (1, 1), (2, 2), (3, 3)])
+    >>> odd, picked = batch.view(slice(1, None, 2)), batch.view([3, 0])
+    >>> odd
+    Vector2BatchView([Vector2(1.0, 1.0), Vector2(3.0, 3.0)])
+    >>> batch[3] = (5, 5)
+    >>> picked
+    Vector2BatchView([Vector2(5.0, 5.0), Vector2(0.0, 0.0)])
+
+    Modifying a view copies the vectors it selects first, leaving the batch
+    unchanged; the view then holds its own arrays, as :py:attr:`shared` tells:
+
+    >>> odd[0] = (-1, -1)
+    >>> odd.shared, batch[1]
+    (False, Vector2(1.0, 1.0))
+
+    Slicing a view makes a view of the same vectors, and :py:meth:`copy`
+    makes a :py:class:`Vector2Batch` of them.
+
+    Views have a fixed length, and select the vectors which were at their
+    indices in the batch when they were made: inserting or deleting vectors
+    in the batch shifts the vectors that its views see, and
+    :py:exc:`IndexError` is raised on access to vectors past its end.
+    """
+    #: The X coordinates of the vectors, as a read-only sequence while shared
+    xs: 'typing.Sequence[float]'
+    #: The Y coordinates of the vectors, as a read-only sequence while shared
+    ys: 'typing.Sequence[float]'
+    #: The :py:mod:`array` typecode of the coordinates, ``'d'`` or ``'f'``
+    typecode: str
+    #: The class of the elements, that of the batch
+    element_type: 'typing.Type[Vector2]'
+    _make: 'Factory'
+
+    __slots__ = ('xs', 'ys', 'typecode', 'element_type', '_make')
+
+    @classmethod
+    def _select(cls, xs: 'typing.Sequence[float]', ys: 'typing.Sequence[float]',
+                item: 'Selection', element_type: 'typing.Type[Vector2]') -> 'Vector2BatchView':
+        """Make a view of the coordinates of an array, or a view, at some indices."""
+        count = len(xs)
+        indices: 'typing.Sequence[int]'
+        if isinstance(item, slice):
+            indices = range(*item.indices(count))
+        else:
+            indices = [as_index(i) for i in item]
+            for i, value in enumerate(indices):
+                if not -count <= value < count:
+                    raise IndexError(f"Index {value} out of range for {count} vectors")
+                indices[i] = value % count
+
+        if isinstance(xs, _Gather):
+            # Views of shared views select from the same arrays, which both share
+            if isinstance(item, slice):
+                indices = xs.indices[item]
+            else:
+                indices = [xs.indices[i] for i in indices]
+            xs, ys = xs.array, ys.array  # type: ignore
+
+        self = cls.__new__(cls)
+        self.xs, self.ys = _Gather(xs, indices), _Gather(ys, indices)
+        self.typecode = xs.typecode  # type: ignore
+        self.element_type, self._make = element_type, _factory(element_type)
+        return self
+
+    @property
+    def shared(self) -> bool:
+        """Whether the view still shares the arrays of its batch."""
+        return isinstance(self.xs, _Gather)
+
+    def view(self, item: 'Selection' = _ALL) -> 'Vector2BatchView':
+        """Make a view of some of the vectors of the view, as :py:meth:`Vector2Batch.view`."""
+        return Vector2BatchView._select(self.xs, self.ys, item, self.element_type)
+
+    def copy(self) -> Vector2Batch:
+        """Make a batch of the vectors of the view."""
+        return Vector2Batch.from_arrays(
+            self.xs, self.ys, typecode=self.typecode, element_type=self.element_type,
+        )
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return self.view(item)
+        return self._make(self.xs[item], self.ys[item])
+
+    def __setitem__(self, item, value) -> None:
+        """Replace vectors, by index or by slice, copying the viewed vectors first.
+
+        Slices are replaced by as many vectors, as views have a fixed length.
+        """
+        if self.shared:
+            self.xs, self.ys = array(self.typecode, self.xs), array(self.typecode, self.ys)
+
+        if isinstance(item, slice):
+            count = len(range(*item.indices(len(self))))
+            values = Vector2Batch(value, typecode=self.typecode)
+            if len(values) != count:
+                raise ValueError(f"Cannot assign {len(values)} vectors to {count} vectors")
+            self.xs[item], self.ys[item] = values.xs, values.ys  # type: ignore
+        else:
+            self.xs[item], self.ys[item] = Vector2._unpack(value)  # type: ignore
+
+    def __iter__(self) -> 'typing.Iterator[Vector2]':
+        return map(self._make, self.xs, self.ys)
+
+    def __eq__(self, other: 'typing.Any') -> bool:
+        if not isinstance(other, (Vector2Batch, Vector2BatchView)):
+            return NotImplemented
+        return list(self.xs) == list(other.xs) and list(self.ys) == list(other.ys)
+
+    def __repr__(self) -> str:
+        return _repr(self)
+
+
+def _repr(vectors: 'typing.Union[Vector2Batch, Vector2BatchView]') -> str:
+    arguments = [repr(list(vectors))]
+    if vectors.typecode != 'd':
+        arguments.append(f"typecode={vectors.typecode!r}")
+    if vectors.element_type is not Vector2:
+        arguments.append(f"element_type={vectors.element_type.__name__}")
+    return f"{type(vectors).__name__}({', '.join(arguments)})"
+
+
+def _element_type(vectors: 'typing.Iterable[VectorLike]') -> 'typing.Type[Vector2]':
+    """Get the element type of a batch or a view, or Vector2 for other iterables."""
+    if isinstance(vectors, (Vector2Batch, Vector2BatchView)):
+        return vectors.element_type
+    return Vector2
+
+
+def _result_type(*values: 'typing.Any') -> 'typing.Type[Vector2]':
+    """Find the element type of a batch made from vector-likes and batches.
+
+    It is the type of the result of adding them, as vectors, from left to right.
+    """
+    rtype = Vector2
+    for value in values:
+        if isinstance(value, (Vector2Batch, Vector2BatchView)):
+            rtype = _find_lowest_vector(rtype, value.element_type)
+        else:
+            rtype = _find_lowest_vector(rtype, type(value))
+    return rtype
+
+
+def _coordinates(
+    vectors: 'typing.Iterable[VectorLike]',
+) -> 'typing.Iterator[typing.Tuple[float, float]]':
+    """Iterate over the coordinates of a batch, a view or an iterable of vector-likes."""
+    if isinstance(vectors, (Vector2Batch, Vector2BatchView)):
+        return zip(vectors.xs, vectors.ys)
+    return map(Vector2._unpack, vectors)
+
+
+def _columns(
+    vectors: 'typing.Iterable[VectorLike]',
+) -> 'typing.Tuple[typing.Sequence[float], typing.Sequence[float]]':
+    """Get the X and Y coordinates of a batch, a view or vector-likes, as sequences."""
+    if isinstance(vectors, Vector2BatchView):
+        return vectors.xs, vectors.ys
+    if not isinstance(vectors, Vector2Batch):
+        vectors = Vector2Batch(vectors)
+    return vectors.xs, vectors.ys
@@ -0,0 +1,344 @@
+"""Broad-phase collision detection between axis-aligned boxes.
+
+Boxes are stored in an :py:class:`AABBBatch`, as their corners of lowest and
+highest coordinates, and :py:class:`SweepAndPrune` finds which of them
+overlap, reporting the changes from one step of a simulation to the next:
+
+>>> from ppb_vector.broadphase import AABBBatch, SweepAndPrune
+>>> boxes = AABBBatch.from_centers([(0, 0), (3, 0), (10, 0)], [(2, 1), (2, 1), (2, 1)])
+>>> broadphase = SweepAndPrune()
+>>> broadphase.update(boxes)
+({(0, 1)}, set())
+>>> boxes[2] = ((4, -1), (8, 1))
+>>> broadphase.update(boxes)
+({(1, 2)}, set())
+>>> sorted(broadphase.pairs)
+[(0, 1), (1, 2)]
+"""
+from collections.abc import MutableSequence
+from itertools import compress
+from operator import ge
+
+from ppb_vector.batch import Vector2Batch
+from ppb_vector.vector2 import Vector2
+
+__all__ = ('AABBBatch', 'SweepAndPrune', 'overlapping_pairs')
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing  # noqa: I300
+
+    from ppb_vector.vector2 import VectorLike
+
+    # AABBBatch or subclass
+    Batch = typing.TypeVar('Batch', bound='AABBBatch')
+    # A pair of indices of boxes, the lowest first
+    Pair = typing.Tuple[int, int]
+
+
+class AABBBatch(MutableSequence):
+    """A mutable sequence of axis-aligned bounding boxes, stored packed.
+
+    Each box is a pair of vector-likes, its corners of lowest and highest
+    coordinates, as returned by :py:func:`ppb_vector.reductions.bounding_box`.
+    They are stored in two :py:class:`Vector2Batch <ppb_vector.Vector2Batch>`,
+    :py:attr:`lows` and :py:attr:`highs`:
+
+    >>> boxes = AABBBatch([((0, 0), (1, 2))])
+    >>> boxes.append(((1, 1), (2, 2)))
+    >>> boxes[1]
+    (Vector2(1.0, 1.0), Vector2(2.0, 2.0))
+    >>> boxes.highs.xs
+    array('d', [1.0, 2.0])
+    """
+    #: The corner of lowest coordinates of each box
+    lows: Vector2Batch
+    #: The corner of highest coordinates of each box
+    highs: Vector2Batch
+
+    __slots__ = ('lows', 'highs')
+
+    def __init__(self, boxes: 'typing.Iterable[typing.Tuple[VectorLike, VectorLike]]' = ()):
+        """Make a batch from an iterable of pairs of corners."""
+        self.lows, self.highs = Vector2Batch(), Vector2Batch()
+        self.extend(boxes)
+
+    @classmethod
+    def from_corners(cls: 'typing.Type[Batch]', lows: 'typing.Iterable[VectorLike]',
+                     highs: 'typing.Iterable[VectorLike]') -> 'Batch':
+        """Make a batch from iterables of lowest and highest corners."""
+        self = cls()
+        self.lows.extend(lows)
+        self.highs.extend(highs)
+        if len(self.lows) != len(self.highs):
+            raise ValueError(f"Got {len(self.lows)} lowest and {len(self.highs)} highest corners")
+        return self
+
+    @classmethod
+    def from_centers(cls: 'typing.Type[Batch]', centers: 'typing.Iterable[VectorLike]',
+                     half_extents: 'typing.Iterable[VectorLike]') -> 'Batch':
+        """Make a batch from the centers and half-extents of boxes.
+
+        >>> AABBBatch.from_centers([(1, 1)], [(1, 2)])
+        AABBBatch([(Vector2(0.0, -1.0), Vector2(2.0, 3.0))])
+        """
+        centers = Vector2Batch(centers)
+        half_extents = Vector2Batch(half_extents)
+        if len(centers) != len(half_extents):
+            raise ValueError(f"Got {len(centers)} centers and {len(half_extents)} half-extents")
+
+        return cls.from_corners(
+            Vector2Batch.from_arrays(
+                map(float.__sub__, centers.xs, half_extents.xs),
+                map(float.__sub__, centers.ys, half_extents.ys),
+            ),
+            Vector2Batch.from_arrays(
+                map(float.__add__, centers.xs, half_extents.xs),
+                map(float.__add__, centers.ys, half_extents.ys),
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.lows)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return type(self).from_corners(self.lows[item], self.highs[item])
+        return self.lows[item], self.highs[item]
+
+    def __setitem__(self, item, value) -> None:
+        if isinstance(item, slice):
+            values = value if isinstance(value, AABBBatch) else AABBBatch(value)
+            self.lows[item], self.highs[item] = values.lows, values.highs
+        else:
+            self.lows[item], self.highs[item] = value
+
+    def __delitem__(self, item) -> None:
+        del self.lows[item]
+        del self.highs[item]
+
+    def insert(self, index: int, value: 'typing.Tuple[VectorLike, VectorLike]') -> None:
+        """Insert a box before index."""
+        low, high = value
+        self.lows.insert(index, low)
+        self.highs.insert(index, high)
+
+    def append(self, value: 'typing.Tuple[VectorLike, VectorLike]') -> None:
+        """Append a box to the end of the batch."""
+        low, high = value
+        self.lows.append(low)
+        self.highs.append(high)
+
+    def extend(self, values: 'typing.Iterable[typing.Tuple[VectorLike, VectorLike]]') -> None:
+        """Append the boxes from an iterable to the end of the batch."""
+        if isinstance(values, AABBBatch):
+            self.lows.extend(values.lows)
+            self.highs.extend(values.highs)
+            return
+
+        for value in values:
+            self.append(value)
+
+    def move(self, index: int, offset: 'VectorLike') -> None:
+        """Translate a box, without changing its size.
+
+        >>> boxes = AABBBatch([((0, 0), (1, 1))])
+        >>> boxes.move(0, (2, 0))
+        >>> boxes[0]
+        (Vector2(2.0, 0.0), Vector2(3.0, 1.0))
+        """
+        x, y = Vector2._unpack(offset)
+        self.lows.xs[index] += x
+        self.lows.ys[index] += y
+        self.highs.xs[index] += x
+        self.highs.ys[index] += y
+
+    def __eq__(self, other: 'typing.Any') -> bool:
+        if not isinstance(other, AABBBatch):
+            return NotImplemented
+        return self.lows == other.lows and self.highs == other.highs
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+def _sweep(boxes: AABBBatch, order: 'typing.Sequence[int]') -> 'typing.Set[Pair]':
+    """Find the overlapping boxes, given the indices of all boxes by lowest X."""
+    min_xs, min_ys = boxes.lows.xs, boxes.lows.ys
+    max_xs, max_ys = boxes.highs.xs, boxes.highs.ys
+
+    pairs = set()
+    count = len(order)
+    for position, i in enumerate(order):
+        max_x, min_y, max_y = max_xs[i], min_ys[i], max_ys[i]
+        # The following boxes overlap box i along X while they start before it ends
+        for following in range(position + 1, count):
+            j = order[following]
+            if min_xs[j] > max_x:
+                break
+            if min_ys[j] <= max_y and max_ys[j] >= min_y:
+                pairs.add((i, j) if i < j else (j, i))
+
+    return pairs
+
+
+def overlapping_pairs(boxes: AABBBatch) -> 'typing.Set[Pair]':
+    """Find all pairs of overlapping boxes.
+
+    Returns the set of ``(i, j)``, with ``i < j``, such that boxes ``i`` and
+    ``j`` overlap; boxes which only touch are considered overlapping.
+
+    >>> overlapping_pairs(AABBBatch([((0, 0), (1, 1)), ((1, 1), (2, 2)), ((3, 0), (4, 1))]))
+    {(0, 1)}
+    """
+    order = sorted(range(len(boxes)), key=boxes.lows.xs.__getitem__)
+    return _sweep(boxes, order)
+
+
+def _overlap(boxes: AABBBatch, i: int, j: int) -> bool:
+    """Check whether boxes i and j overlap, or touch."""
+    lows, highs = boxes.lows, boxes.highs
+    if lows.xs[i] > highs.xs[j] or lows.xs[j] > highs.xs[i]:
+        return False
+    return lows.ys[i] <= highs.ys[j] and lows.ys[j] <= highs.ys[i]
+
+
+def _endpoints(
+    lows: 'typing.Sequence[float]', highs: 'typing.Sequence[float]',
+) -> 'typing.List[int]':
+    """Sort the endpoints of boxes along an axis, given their lowest and highest coordinates.
+
+    Endpoint ``2 * i`` is the lowest coordinate of box ``i``, and ``2 * i + 1``
+    its highest. At equal coordinates, lowest endpoints come first, so that
+    touching boxes overlap.
+    """
+    coordinates = [c for low_high in zip(lows, highs) for c in low_high]
+    return sorted(range(len(coordinates)), key=lambda e: (coordinates[e], e & 1))
+
+
+class SweepAndPrune:
+    """A persistent sort-and-sweep broad-phase.
+
+    Each call to :py:meth:`update` finds the pairs of overlapping boxes, as
+    :py:func:`overlapping_pairs` does, and reports which pairs started or
+    stopped overlapping since the previous call.
+
+    Between calls, it keeps the endpoints of the boxes sorted along both axes.
+    When boxes only move a little from one step to the next, that order is
+    nearly right, and an insertion sort restores it in close to linear time;
+    as two boxes can only start or stop overlapping when an endpoint of one
+    passes an endpoint of the other, the pairs are updated from the swaps the
+    sort makes, rather than found again from scratch.
+
+    The cost of an update is proportional to the number of boxes that move,
+    and to the number of endpoints they pass. In tests/benchmark_broadphase.py,
+    with 10000 boxes, an update takes about a sixth of the time of
+    :py:func:`overlapping_pairs` when 1% of the boxes move at each step, and
+    about a third when 10% do; when all of them move, it is no faster.
+    """
+
+    #: The pairs of boxes which overlap, as of the last update
+    pairs: 'typing.Set[Pair]'
+
+    def __init__(self) -> None:
+        self.pairs = set()
+        # The sorted endpoints along each axis, as in _endpoints
+        self._ends: 'typing.List[typing.List[int]]' = []
+
+    def update(self, boxes: AABBBatch) -> 'typing.Tuple[typing.Set[Pair], typing.Set[Pair]]':
+        """Find the overlapping boxes, and the changes since the last update.
+
+        Returns the sets of pairs that were added and removed since then. Boxes
+        are identified by their index in ``boxes``; if boxes were added to the
+        end of the batch, or removed from it, the pairs involving them are
+        reported as added or removed.
+
+        Updates with as many boxes as the previous one only sort the endpoints
+        incrementally; otherwise, they are sorted and swept from scratch.
+        """
+        if not self._ends or len(self._ends[0]) != 2 * len(boxes):
+            return self._rebuild(boxes)
+
+        lows, highs = boxes.lows, boxes.highs
+        added: 'typing.Set[Pair]' = set()
+        removed: 'typing.Set[Pair]' = set()
+        self._resort(self._ends[0], lows.xs, highs.xs, boxes, added, removed)
+        self._resort(self._ends[1], lows.ys, highs.ys, boxes, added, removed)
+        return added, removed
+
+    def _rebuild(self, boxes: AABBBatch) -> 'typing.Tuple[typing.Set[Pair], typing.Set[Pair]]':
+        lows, highs = boxes.lows, boxes.highs
+        self._ends = [_endpoints(lows.xs, highs.xs), _endpoints(lows.ys, highs.ys)]
+
+        pairs = overlapping_pairs(boxes)
+        added, removed = pairs - self.pairs, self.pairs - pairs
+        self.pairs = pairs
+        return added, removed
+
+    def _resort(self, ends: 'typing.List[int]', lows: 'typing.Sequence[float]',
+                highs: 'typing.Sequence[float]', boxes: AABBBatch,
+                added: 'typing.Set[Pair]', removed: 'typing.Set[Pair]') -> None:
+        """Insertion sort the endpoints along an axis, updating the pairs as they swap."""
+        min_xs, min_ys = boxes.lows.xs, boxes.lows.ys
+        max_xs, max_ys = boxes.highs.xs, boxes.highs.ys
+        pairs = self.pairs
+        count = len(ends)
+
+        coordinates = [0.0] * count
+        coordinates[0::2], coordinates[1::2] = lows, highs
+        values = list(map(coordinates.__getitem__, ends))
+
+        # Only endpoints which aren't greater than the previous one may have to
+        #  move, and they are found without a Python-level loop; once one has
+        #  moved, the next endpoint is checked against the one that took its place.
+        candidates = compress(range(1, count), map(ge, values, values[1:]))
+        k = next(candidates, count)
+        while k < count:
+            e, value = ends[k], values[k]
+            is_high, a = e & 1, e >> 1
+            j = k - 1
+            while j >= 0 and (values[j] > value or (values[j] == value and ends[j] & 1 > is_high)):
+                f = ends[j]
+                b = f >> 1
+                # Only a lowest endpoint passing a highest one, or the other
+                #  way around, changes whether two boxes overlap on this axis
+                if f & 1 != is_high and a != b:
+                    pair = (a, b) if a < b else (b, a)
+                    if is_high:
+                        # The end of box a moved before the start of box b
+                        if pair in pairs:
+                            pairs.remove(pair)
+                            if pair in added:
+                                added.remove(pair)
+                            else:
+                                removed.add(pair)
+                    elif pair in pairs or min_xs[a] > max_xs[b] or min_xs[b] > max_xs[a]:
+                        pass
+                    elif min_ys[a] <= max_ys[b] and min_ys[b] <= max_ys[a]:
+                        # The start of box a moved before the end of box b
+                        pairs.add(pair)
+                        if pair in removed:
+                            removed.remove(pair)
+                        else:
+                            added.add(pair)
+
+                ends[j + 1], values[j + 1] = f, values[j]
+                j -= 1
+
+            if j + 1 < k:
+                ends[j + 1], values[j + 1] = e, value
+                # The endpoint now at k is the greatest so far, and may be
+                #  greater than the next one, which then wasn't a candidate
+                if k + 1 < count and values[k + 1] <= values[k]:
+                    k += 1
+                    continue
+
+            following = next(candidates, count)
+            while following <= k:
+                following = next(candidates, count)
+            k = following
+
+    def reset(self) -> None:
+        """Forget the boxes and pairs seen so far."""
+        self.pairs = set()
+        self._ends = []
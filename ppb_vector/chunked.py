@@ -0,0 +1,273 @@
+"""Chunked storage of vectors in a file, loaded as they are accessed.
+
+:py:class:`ChunkedVectors` presents the vectors stored in a file as a single
+sequence, while keeping only a few chunks of them in memory: chunks are
+loaded on first access, as :py:class:`Vector2Batch
+<ppb_vector.Vector2Batch>`, and the least recently used ones are evicted
+beyond ``max_chunks``, after writing them back if they were modified.
+
+>>> import os, tempfile
+>>> from ppb_vector.chunked import ChunkedVectors
+>>> path = os.path.join(tempfile.mkdtemp(), 'positions')
+>>> with ChunkedVectors.create(path, [(i, -i) for i in range(10)],
+...                            chunk_size=4, max_chunks=2) as store:
+...     store[9]
+...     store[5] = (50, -50)
+...     store.loaded
+Vector2(9.0, -9.0)
+(2, 1)
+>>> with ChunkedVectors(path, chunk_size=4) as store:
+...     len(store), store[5]
+(10, Vector2(50.0, -50.0))
+
+Memory use is thus bounded by ``max_chunks * chunk_size`` vectors, of 16
+bytes each, or 8 for single precision storage. Accessing vectors in order,
+or sorting them by :py:mod:`locality <ppb_vector.locality>` beforehand, keeps
+the number of chunks loaded low.
+"""
+from array import array
+from collections import OrderedDict
+from collections.abc import Sequence
+
+from ppb_vector.batch import _factory, _TYPECODES, Vector2Batch
+from ppb_vector.vector2 import Vector2
+
+__all__ = ('ChunkedVectors',)
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing  # noqa: I300
+
+    from ppb_vector.vector2 import VectorLike
+
+    # ChunkedVectors or subclass
+    Chunked = typing.TypeVar('Chunked', bound='ChunkedVectors')
+
+
+class ChunkedVectors(Sequence):
+    """A sequence of vectors stored in a file, in chunks of ``chunk_size`` vectors.
+
+    Each chunk is stored as the packed X coordinates of its vectors, followed
+    by their Y coordinates, in the native byte order; chunks are loaded and
+    written back whole, and all chunks but the last hold ``chunk_size``
+    vectors. Files must be opened with the ``chunk_size`` and ``typecode``
+    they were created with.
+
+    Vectors are read and written by index, or by slice, as instances of
+    ``element_type`` and :py:class:`Vector2Batch <ppb_vector.Vector2Batch>` of
+    them; they can only be added at the end, with :py:meth:`extend`. Functions
+    operating on batches can work on a chunk at a time, with
+    :py:meth:`chunks` and :py:meth:`apply`.
+
+    Modified chunks are only written back when they are evicted, or by
+    :py:meth:`flush` and :py:meth:`close`, which are called when leaving a
+    ``with`` block.
+    """
+
+    def __init__(self, path: str, *, chunk_size: int = 65536, max_chunks: int = 16,
+                 typecode: str = 'd', element_type: 'typing.Type[Vector2]' = Vector2) -> None:
+        """Open a file of vectors, which must exist.
+
+        ``element_type`` is the class of the vectors read, :py:class:`Vector2`
+        or a subclass of it.
+
+        Raises :py:exc:`ValueError` if ``chunk_size`` or ``max_chunks`` isn't
+        positive, if ``typecode`` isn't ``'d'`` or ``'f'``, or if the size of
+        the file isn't a whole number of vectors, and :py:exc:`TypeError` if
+        ``element_type`` isn't a subclass of :py:class:`Vector2`.
+        """
+        if chunk_size < 1 or max_chunks < 1:
+            raise ValueError(f"Expected positive sizes, got {chunk_size} and {max_chunks}")
+        if typecode not in _TYPECODES:
+            raise ValueError(f"Unsupported typecode {typecode!r}, expected 'd' or 'f'")
+
+        self.chunk_size, self.max_chunks, self.typecode = chunk_size, max_chunks, typecode
+        self.element_type, self._make = element_type, _factory(element_type)
+        self._itemsize = array(typecode).itemsize
+        self._file = open(path, 'r+b')
+        size = self._file.seek(0, 2)
+        if size % (2 * self._itemsize):
+            self._file.close()
+            raise ValueError(f"{path} doesn't hold whole vectors of typecode {typecode!r}")
+        self._length = size // (2 * self._itemsize)
+        # Chunks in memory by index, from the least to the most recently used
+        self._chunks: 'typing.MutableMapping[int, Vector2Batch]' = OrderedDict()
+        self._dirty: 'typing.Set[int]' = set()
+
+    @classmethod
+    def create(cls: 'typing.Type[Chunked]', path: str,
+               vectors: 'typing.Iterable[VectorLike]' = (), **kwargs: 'typing.Any') -> 'Chunked':
+        """Create a file of vectors, replacing any existing one, and open it.
+
+        The keyword arguments are passed to the constructor.
+        """
+        open(path, 'wb').close()
+        self = cls(path, **kwargs)
+        self.extend(vectors)
+        return self
+
+    @property
+    def loaded(self) -> 'typing.Tuple[int, ...]':
+        """The indices of the chunks in memory, from the least to the most recently used."""
+        return tuple(self._chunks)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _chunk(self, index: int) -> Vector2Batch:
+        """Get a chunk, loading it if needed, and mark it as the most recently used."""
+        chunks = self._chunks
+        if index in chunks:
+            chunks.move_to_end(index)  # type: ignore
+            return chunks[index]
+
+        count = min(self.chunk_size, self._length - index * self.chunk_size)
+        xs, ys = array(self.typecode), array(self.typecode)
+        self._file.seek(index * self.chunk_size * 2 * self._itemsize)
+        xs.fromfile(self._file, count)
+        ys.fromfile(self._file, count)
+        chunk = chunks[index] = Vector2Batch.from_arrays(
+            xs, ys, typecode=self.typecode, element_type=self.element_type,
+        )
+        self._evict(self.max_chunks)
+        return chunk
+
+    def _write(self, index: int) -> None:
+        chunk = self._chunks[index]
+        self._file.seek(index * self.chunk_size * 2 * self._itemsize)
+        chunk.xs.tofile(self._file)
+        chunk.ys.tofile(self._file)
+        self._dirty.discard(index)
+
+    def _evict(self, keep: int) -> None:
+        """Evict the least recently used chunks, until at most ``keep`` are loaded."""
+        chunks = self._chunks
+        while len(chunks) > keep:
+            index = next(iter(chunks))
+            if index in self._dirty:
+                self._write(index)
+            del chunks[index]
+
+    def _index(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return index
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            batch = Vector2Batch(typecode=self.typecode, element_type=self.element_type)
+            for index in range(*item.indices(self._length)):
+                chunk = self._chunk(index // self.chunk_size)
+                batch.xs.append(chunk.xs[index % self.chunk_size])
+                batch.ys.append(chunk.ys[index % self.chunk_size])
+            return batch
+
+        index = self._index(item)
+        chunk = self._chunk(index // self.chunk_size)
+        offset = index % self.chunk_size
+        return self._make(chunk.xs[offset], chunk.ys[offset])
+
+    def __setitem__(self, item, value) -> None:
+        """Replace vectors, by index or by slice.
+
+        Slices are replaced by as many vectors, as slice assignments can't
+        change the length of the sequence.
+        """
+        if isinstance(item, slice):
+            indices = range(*item.indices(self._length))
+            values = list(value)
+            if len(values) != len(indices):
+                raise ValueError(
+                    f"Cannot assign {len(values)} vectors to a slice of {len(indices)} vectors",
+                )
+            for index, v in zip(indices, values):
+                self[index] = v
+            return
+
+        index = self._index(item)
+        chunk = self._chunk(index // self.chunk_size)
+        chunk[index % self.chunk_size] = value
+        self._dirty.add(index // self.chunk_size)
+
+    def __iter__(self) -> 'typing.Iterator[Vector2]':
+        for _, chunk in self.chunks():
+            yield from chunk
+
+    def extend(self, vectors: 'typing.Iterable[VectorLike]') -> None:
+        """Append vector-likes to the end of the sequence."""
+        for value in vectors:
+            index, offset = divmod(self._length, self.chunk_size)
+            if offset:
+                chunk = self._chunk(index)
+            else:
+                chunk = self._chunks[index] = Vector2Batch(
+                    typecode=self.typecode, element_type=self.element_type,
+                )
+                self._evict(self.max_chunks)
+            chunk.append(value)
+            self._dirty.add(index)
+            self._length += 1
+
+    def chunks(self) -> 'typing.Iterator[typing.Tuple[int, Vector2Batch]]':
+        """Iterate over the chunks, as the index of their first vector and a batch.
+
+        The batches are those held in memory, and should not be modified;
+        use :py:meth:`apply` for that.
+        """
+        for index in range(-(-self._length // self.chunk_size)):
+            yield index * self.chunk_size, self._chunk(index)
+
+    def apply(self, function: 'typing.Callable[[Vector2Batch], None]') -> None:
+        """Call a function on each chunk, which may modify it in place.
+
+        The function is given each chunk as a :py:class:`Vector2Batch
+        <ppb_vector.Vector2Batch>`, and must not change its length: if it does,
+        :py:exc:`ValueError` is raised, and the changes to that chunk are lost.
+
+        >>> import os, tempfile
+        >>> def move(chunk):
+        ...     for i, v in enumerate(chunk):
+        ...         chunk[i] = v + (1, 2)
+        >>> path = os.path.join(tempfile.mkdtemp(), 'positions')
+        >>> store = ChunkedVectors.create(path, [(0, 0)] * 5, chunk_size=2)
+        >>> store.apply(move)
+        >>> store[4]
+        Vector2(1.0, 2.0)
+        >>> store.close()
+        """
+        for start, chunk in self.chunks():
+            index, count = start // self.chunk_size, len(chunk)
+            if index in self._dirty:
+                # Keep earlier changes, should this chunk be dropped
+                self._write(index)
+            function(chunk)
+            if len(chunk) != count:
+                # Drop the chunk rather than write it back, which would shift the next ones
+                del self._chunks[index]
+                self._dirty.discard(index)
+                raise ValueError(f"Chunk at {start} changed length from {count} to {len(chunk)}")
+            self._dirty.add(index)
+
+    def flush(self) -> None:
+        """Write the modified chunks back to the file."""
+        for index in sorted(self._dirty):
+            self._write(index)
+        self._file.flush()
+
+    def close(self) -> None:
+        """Write the modified chunks back, and close the file."""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+        self._chunks.clear()
+
+    def __enter__(self: 'Chunked') -> 'Chunked':
+        return self
+
+    def __exit__(self, *exc_info: 'typing.Any') -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} of {self._length} vectors in {self._file.name!r}>"
@@ -0,0 +1,143 @@
+"""Delta compression of successive snapshots of many vectors.
+
+:py:func:`encode_delta` compares two batches of the same size, such as the
+positions of entities at two consecutive ticks, and encodes the vectors which
+changed as a compact stream of their indices and quantized differences;
+:py:func:`decode_delta` applies that stream to the previous batch:
+
+>>> from ppb_vector import Vector2Batch
+>>> from ppb_vector.delta import decode_delta, encode_delta
+>>> previous = Vector2Batch([(0, 0), (10, 10), (20, 20)])
+>>> current = Vector2Batch([(0, 0), (10.5, 9), (20, 20)])
+>>> data = encode_delta(previous, current, precision=0.01)
+>>> len(data)
+4
+>>> decode_delta(previous, data, precision=0.01)
+Vector2Batch([Vector2(0.0, 0.0), Vector2(10.5, 9.0), Vector2(20.0, 20.0)])
+
+Vectors which are close to their previous value, as by :py:meth:`Vector2.isclose
+<ppb_vector.Vector2.isclose>` with the given tolerances, or within
+``precision`` of it, are skipped. Other vectors are decoded within
+``precision`` of their current value, on each coordinate.
+
+Those errors don't accumulate over many snapshots as long as ``previous`` is
+the batch the receiver holds, that is the result of the last
+:py:func:`decode_delta`, rather than the exact previous values.
+
+The stream is made of variable-length integers, of 7 bits per byte: the
+number of changed vectors, then for each of them the difference between its
+index and the previous one's, and its quantized differences on each axis. A
+vector which moved by less than 100 times the precision on each axis takes 3
+bytes, if it is less than 128 vectors after the previous change.
+"""
+from math import hypot, inf
+
+from ppb_vector.batch import Vector2Batch
+
+__all__ = ('decode_delta', 'encode_delta')
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing  # noqa: I300
+
+
+def _step(precision: float) -> float:
+    """Get the quantization step for a precision."""
+    precision = float(precision)
+    if not 0 < precision < inf:
+        raise ValueError(f"Delta compression requires a positive precision, got {precision}")
+    # Rounding to the nearest step is off by at most half a step.
+    return 2 * precision
+
+
+def _write(out: bytearray, value: int) -> None:
+    """Append a non-negative integer to out, 7 bits per byte, the lowest bits first."""
+    while value > 0x7f:
+        out.append(value & 0x7f | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read(data: bytes, position: int) -> 'typing.Tuple[int, int]':
+    """Read an integer written by _write at position, and return it with the next position."""
+    value, shift = 0, 0
+    try:
+        while True:
+            byte = data[position]
+            position += 1
+            value |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return value, position
+            shift += 7
+    except IndexError:
+        raise ValueError("Truncated delta stream")
+
+
+def encode_delta(
+    previous: Vector2Batch, current: Vector2Batch, precision: float, *,
+    abs_tol: float = 1e-09, rel_tol: float = 1e-09,
+) -> bytes:
+    """Encode the changes from ``previous`` to ``current``.
+
+    Raises :py:exc:`ValueError` if the batches have different sizes, or if
+    ``precision`` isn't positive. All coordinates must be finite.
+    """
+    if len(previous) != len(current):
+        raise ValueError(f"Got {len(previous)} previous vectors and {len(current)} current ones")
+    step = _step(precision)
+    abs_tol, rel_tol = float(abs_tol), float(rel_tol)
+
+    changes = bytearray()
+    count, last = 0, 0
+    for i, px, py, cx, cy in zip(range(len(current)), previous.xs, previous.ys,
+                                 current.xs, current.ys):
+        dx, dy = cx - px, cy - py
+        if dx == 0 and dy == 0:
+            continue
+
+        # Same test as Vector2.isclose
+        diff = hypot(dx, dy)
+        if diff <= abs_tol or diff <= rel_tol * max(hypot(px, py), hypot(cx, cy)):
+            continue
+
+        qx, qy = round(dx / step), round(dy / step)
+        if qx == 0 and qy == 0:
+            continue
+
+        _write(changes, i - last)
+        # Zigzag encoding maps small negative numbers to small positive ones.
+        _write(changes, qx << 1 if qx >= 0 else ~qx << 1 | 1)
+        _write(changes, qy << 1 if qy >= 0 else ~qy << 1 | 1)
+        count, last = count + 1, i
+
+    header = bytearray()
+    _write(header, count)
+    return bytes(header + changes)
+
+
+def decode_delta(previous: Vector2Batch, data: bytes, precision: float) -> Vector2Batch:
+    """Apply changes encoded by :py:func:`encode_delta` to a copy of ``previous``.
+
+    ``precision`` must be the one the changes were encoded with. Raises
+    :py:exc:`ValueError` if ``data`` isn't a valid stream of changes to
+    ``previous``.
+    """
+    step = _step(precision)
+    result = previous[:]
+    xs, ys = result.xs, result.ys
+    count, position = _read(data, 0)
+
+    index = 0
+    for _ in range(count):
+        gap, position = _read(data, position)
+        qx, position = _read(data, position)
+        qy, position = _read(data, position)
+        index += gap
+        if index >= len(xs):
+            raise ValueError(f"Delta stream changes vector {index}, out of {len(xs)}")
+        xs[index] += (qx >> 1 if not qx & 1 else ~(qx >> 1)) * step
+        ys[index] += (qy >> 1 if not qy & 1 else ~(qy >> 1)) * step
+
+    if position != len(data):
+        raise ValueError(f"Got {len(data) - position} extra bytes after the delta stream")
+    return result
@@ -0,0 +1,213 @@
+"""Geometry of polygons and point sets.
+
+Polygons are given as a :py:class:`Vector2Batch <ppb_vector.Vector2Batch>`, or
+any iterable of vector-likes, listing their vertices in order; the last vertex
+is implicitly connected to the first. The functions in this module work on
+coordinates directly, without creating a :py:class:`Vector2
+<ppb_vector.Vector2>` for each vertex or edge:
+
+>>> from ppb_vector import Vector2
+>>> from ppb_vector.geometry import centroid, signed_area
+>>> square = [(0, 0), (2, 0), (2, 2), (0, 2)]
+>>> signed_area(square)
+4.0
+>>> centroid(square)
+Vector2(1.0, 1.0)
+"""
+from fractions import Fraction
+
+from ppb_vector.batch import _columns, _element_type, Vector2Batch
+from ppb_vector.vector2 import _make_vector, Vector2
+
+__all__ = ('centroid', 'contains', 'convex_hull', 'signed_area', 'winding')
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing  # noqa: I300
+
+    from ppb_vector.vector2 import VectorLike
+
+
+# Bound on the relative rounding error of the determinant in _orientation,
+# from Shewchuk's "Adaptive Precision Floating-Point Arithmetic and Fast Robust
+# Geometric Predicates".
+_ORIENTATION_ERROR = (3 + 16 * 2.0 ** -53) * 2.0 ** -53
+# Below this, subnormal products invalidate the bound
+_ORIENTATION_TINY = 2.0 ** -960
+
+
+def _orientation(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> int:
+    """Find on which side of the line through A and B point C lies.
+
+    Returns ``1`` if A, B and C turn counter-clockwise, ``-1`` if they turn
+    clockwise, and ``0`` if they lie on one line. When rounding errors could
+    change the answer, it is computed again with exact arithmetic.
+    """
+    left = (bx - ax) * (cy - ay)
+    right = (by - ay) * (cx - ax)
+    determinant = left - right
+    if abs(determinant) > max(_ORIENTATION_ERROR * (abs(left) + abs(right)), _ORIENTATION_TINY):
+        return (determinant > 0) - (determinant < 0)
+
+    a_x, a_y, b_x, b_y, c_x, c_y = map(Fraction, (ax, ay, bx, by, cx, cy))
+    exact = (b_x - a_x) * (c_y - a_y) - (b_y - a_y) * (c_x - a_x)
+    return (exact > 0) - (exact < 0)
+
+
+def signed_area(polygon: 'typing.Iterable[VectorLike]') -> float:
+    """Compute the area of a simple polygon, using the shoelace formula.
+
+    The area is positive when the vertices are listed counter-clockwise, and
+    negative when they are listed clockwise:
+
+    >>> signed_area([(0, 0), (0, 1), (1, 0)])
+    -0.5
+
+    Polygons with fewer than 3 vertices have an area of zero.
+    """
+    xs, ys = _columns(polygon)
+    if len(xs) < 3:
+        return 0.0
+
+    # Coordinates are taken relative to the first vertex, which does not
+    # change the area but avoids cancellations far away from the origin.
+    x0, y0 = xs[0], ys[0]
+    total = 0.0
+    prev_x, prev_y = xs[1] - x0, ys[1] - y0
+    for i in range(2, len(xs)):
+        x, y = xs[i] - x0, ys[i] - y0
+        total += prev_x * y - x * prev_y
+        prev_x, prev_y = x, y
+
+    return total / 2
+
+
+def winding(polygon: 'typing.Iterable[VectorLike]') -> int:
+    """Find the order in which the vertices of a simple polygon are listed.
+
+    Returns ``1`` if they are counter-clockwise, ``-1`` if they are clockwise,
+    and ``0`` if the polygon is degenerate.
+
+    >>> winding([(0, 0), (1, 0), (0, 1)])
+    1
+    """
+    area = signed_area(polygon)
+    return (area > 0) - (area < 0)
+
+
+def centroid(polygon: 'typing.Iterable[VectorLike]') -> Vector2:
+    """Compute the centroid, or center of mass, of a simple polygon.
+
+    This is the center of the area enclosed by the polygon, which differs in
+    general from the mean of its vertices:
+
+    >>> centroid([(0, 0), (3, 0), (3, 3), (2, 3), (1, 3), (0, 3)])
+    Vector2(1.5, 1.5)
+
+    Raises :py:exc:`ValueError` if the polygon has an area of zero.
+    """
+    xs, ys = _columns(polygon)
+    if len(xs) < 3:
+        raise ValueError("centroid() requires a polygon with a non-zero area")
+
+    x0, y0 = xs[0], ys[0]
+    area = c_x = c_y = 0.0
+    prev_x, prev_y = xs[1] - x0, ys[1] - y0
+    for i in range(2, len(xs)):
+        x, y = xs[i] - x0, ys[i] - y0
+        cross = prev_x * y - x * prev_y
+        area += cross
+        c_x += (prev_x + x) * cross
+        c_y += (prev_y + y) * cross
+        prev_x, prev_y = x, y
+
+    if area == 0:
+        raise ValueError("centroid() requires a polygon with a non-zero area")
+
+    # The sums are 2A and 6A times the coordinates of the centroid
+    return _make_vector(Vector2, x0 + c_x / (3 * area), y0 + c_y / (3 * area))
+
+
+def contains(
+    polygon: 'typing.Iterable[VectorLike]', points: 'typing.Iterable[VectorLike]',
+) -> 'typing.List[bool]':
+    """Test which points lie inside a polygon.
+
+    Returns a list with one boolean per point; the polygon doesn't need to be
+    convex nor simple, and its interior is determined by the even-odd rule:
+
+    >>> contains([(0, 0), (4, 0), (4, 4), (0, 4)], [(1, 1), (5, 1), (3, 3)])
+    [True, False, True]
+
+    Points exactly on the boundary may be reported as inside or outside.
+    """
+    xs, ys = _columns(polygon)
+    point_xs, point_ys = _columns(points)
+    if len(xs) < 3:
+        return [False] * len(point_xs)
+
+    # Precompute, for each edge that isn't horizontal, its Y range and the
+    # terms of the X coordinate where it crosses a given horizontal line.
+    edges = []
+    prev_x, prev_y = xs[-1], ys[-1]
+    for x, y in zip(xs, ys):
+        if y != prev_y:
+            slope = (x - prev_x) / (y - prev_y)
+            edges.append((min(y, prev_y), max(y, prev_y), prev_x - prev_y * slope, slope))
+        prev_x, prev_y = x, y
+
+    min_x, max_x = min(xs), max(xs)
+    min_y, max_y = min(ys), max(ys)
+
+    result = []
+    for x, y in zip(point_xs, point_ys):
+        inside = False
+        if min_x <= x <= max_x and min_y <= y <= max_y:
+            for low, high, intercept, slope in edges:
+                # Half-open Y range, so that vertices are only counted once
+                if low <= y < high and x < intercept + y * slope:
+                    inside = not inside
+        result.append(inside)
+
+    return result
+
+
+def convex_hull(points: 'typing.Iterable[VectorLike]') -> Vector2Batch:
+    """Compute the convex hull of a set of points.
+
+    The hull is returned as a polygon, listing its vertices counter-clockwise
+    from the one with the lowest coordinates; points along its edges are not
+    included:
+
+    >>> convex_hull([(0, 0), (1, 1), (2, 0), (2, 2), (0, 2), (1, 0)])
+    Vector2Batch([Vector2(0.0, 0.0), Vector2(2.0, 0.0), Vector2(2.0, 2.0), Vector2(0.0, 2.0)])
+
+    The vertices have the element type of ``points``, if it is a batch. This
+    uses Andrew's monotone chain algorithm, which runs in O(n log n) time.
+    """
+    element_type = _element_type(points)
+    xs, ys = _columns(points)
+    coordinates = sorted(set(zip(xs, ys)))
+    if len(coordinates) < 3:
+        return Vector2Batch(coordinates, element_type=element_type)
+
+    def chain(
+        coordinates: 'typing.Iterable[typing.Tuple[float, float]]',
+    ) -> 'typing.List[typing.Tuple[float, float]]':
+        """Build the part of the hull that turns left along sorted coordinates."""
+        hull: 'typing.List[typing.Tuple[float, float]]' = []
+        for x, y in coordinates:
+            while len(hull) >= 2:
+                (ax, ay), (bx, by) = hull[-2], hull[-1]
+                if _orientation(ax, ay, bx, by, x, y) > 0:
+                    break
+                hull.pop()
+            hull.append((x, y))
+        return hull
+
+    lower = chain(coordinates)
+    upper = chain(reversed(coordinates))
+
+    # The last point of each chain is the first point of the other one
+    hull_xs, hull_ys = zip(*lower[:-1], *upper[:-1])
+    return Vector2Batch.from_arrays(hull_xs, hull_ys, element_type=element_type)
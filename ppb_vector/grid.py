@@ -0,0 +1,187 @@
+"""Spatial hashing of vectors on a regular grid.
+
+Vectors are hashable, but only vectors that are exactly equal share a hash.
+:py:func:`grid_key` maps vectors to the cell of a square grid that contains
+them instead, so that nearly-equal vectors can be bucketed together:
+
+>>> from ppb_vector.grid import grid_key
+>>> grid_key((0.31, -0.02), 0.1)
+(3, -1)
+
+Vectors less than ``cell_size`` apart are in the same or in neighbouring
+cells; all candidates close to a vector are thus found in the 3×3 block of
+cells given by :py:func:`grid_neighbours`. Vectors whose distance only rounds
+to ``cell_size``, as computed by :py:meth:`Vector2.isclose
+<ppb_vector.Vector2.isclose>`, may be two cells apart, though.
+
+This lets :py:func:`unique_within` collapse nearly-equal vectors in linear
+expected time, rather than comparing all pairs of vectors, and
+:py:func:`snap_to_grid` does so even faster, by rounding vectors to the nodes
+of a grid.
+"""
+from math import floor, hypot, inf, isfinite
+
+from ppb_vector.batch import _coordinates, _element_type, Vector2Batch
+from ppb_vector.vector2 import Vector2
+
+__all__ = ('grid_key', 'grid_neighbours', 'snap_to_grid', 'unique_within')
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing  # noqa: I300
+
+    from ppb_vector.vector2 import VectorLike
+
+    Key = typing.Tuple[int, int]
+    # Unique vectors, and the index of the unique vector matching each input
+    Unique = typing.Tuple[Vector2Batch, typing.List[int]]
+
+
+def _cell_size(cell_size: float) -> float:
+    cell_size = float(cell_size)
+    if not 0 < cell_size < inf:
+        raise ValueError(f"Grid cells require a positive size, got {cell_size}")
+    return cell_size
+
+
+def grid_key(vector: 'VectorLike', cell_size: float) -> 'Key':
+    """Find the cell of a grid of square cells that contains a vector.
+
+    Cells are identified by a pair of integers ``(i, j)``, and contain vectors
+    whose coordinates ``(x, y)`` satisfy ``i * cell_size <= x < (i + 1) *
+    cell_size``, and likewise for ``y``.
+
+    Raises :py:exc:`ValueError` if ``cell_size`` isn't positive, or if the
+    vector isn't finite. Coordinates should be well below ``2 ** 52 *
+    cell_size``, or nearly-equal vectors may be more than one cell apart.
+    """
+    x, y = Vector2._unpack(vector)
+    cell_size = _cell_size(cell_size)
+    try:
+        return floor(x / cell_size), floor(y / cell_size)
+    except (OverflowError, ValueError):
+        raise ValueError(f"Vector2({x}, {y}) is not finite")
+
+
+def grid_neighbours(key: 'Key') -> 'typing.List[Key]':
+    """List a cell and its 8 neighbours, the cell itself first.
+
+    >>> grid_neighbours((3, -1))[:4]
+    [(3, -1), (2, -2), (2, -1), (2, 0)]
+    """
+    i, j = key
+    return [(i, j)] + [
+        (i + di, j + dj)
+        for di in (-1, 0, 1)
+        for dj in (-1, 0, 1)
+        if di or dj
+    ]
+
+
+def unique_within(points: 'typing.Iterable[VectorLike]', abs_tol: float) -> 'Unique':
+    """Collapse the points that are within ``abs_tol`` of each other.
+
+    Points are taken in order, and each one is matched to the first unique
+    point it is close to, as by :py:meth:`Vector2.isclose
+    <ppb_vector.Vector2.isclose>` with ``abs_tol`` and ``rel_tol=0``, or else
+    becomes a unique point itself. Returns the unique points, and the index
+    among them of the point matched to each input point:
+
+    >>> unique, indices = unique_within([(0, 0), (5, 5), (0.05, 0), (5, 5.01)], 0.1)
+    >>> unique
+    Vector2Batch([Vector2(0.0, 0.0), Vector2(5.0, 5.0)])
+    >>> indices
+    [0, 1, 0, 1]
+
+    Unique points are thus more than ``abs_tol`` apart, and each point is
+    within ``abs_tol`` of its unique point; a chain of points that are each
+    close to the next one may still be split. With ``abs_tol=0``, only equal
+    points are collapsed.
+
+    Points are bucketed by :py:func:`grid_key`, with cells of size ``2 *
+    abs_tol``, so this takes linear time unless many points are crowded in
+    few cells. Raises :py:exc:`ValueError` if ``abs_tol`` is negative, or if
+    any point isn't finite.
+    """
+    abs_tol = float(abs_tol)
+    unique = Vector2Batch(element_type=_element_type(points))
+    xs, ys = unique.xs, unique.ys
+    indices = []
+
+    if abs_tol == 0:
+        exact: 'typing.Dict[typing.Tuple[float, float], int]' = {}
+        for point in _coordinates(points):
+            if not (isfinite(point[0]) and isfinite(point[1])):
+                raise ValueError(f"Vector2{point} is not finite")
+            index = exact.setdefault(point, len(exact))
+            if index == len(xs):
+                xs.append(point[0])
+                ys.append(point[1])
+            indices.append(index)
+        return unique, indices
+
+    # Cells twice as large as the tolerance keep close points in neighbouring
+    #  cells even when their distance rounds down to abs_tol, at the boundary
+    #  between two cells.
+    cell_size = 2 * _cell_size(abs_tol)
+    cells: 'typing.Dict[Key, typing.List[int]]' = {}
+    for x, y in _coordinates(points):
+        try:
+            key = floor(x / cell_size), floor(y / cell_size)
+        except (OverflowError, ValueError):
+            raise ValueError(f"Vector2({x}, {y}) is not finite")
+        match = None
+        for neighbour in grid_neighbours(key):
+            for candidate in cells.get(neighbour, ()):
+                if hypot(xs[candidate] - x, ys[candidate] - y) <= abs_tol:
+                    if match is None or candidate < match:
+                        match = candidate
+                    break
+
+        if match is None:
+            match = len(xs)
+            xs.append(x)
+            ys.append(y)
+            cells.setdefault(key, []).append(match)
+        indices.append(match)
+
+    return unique, indices
+
+
+def snap_to_grid(points: 'typing.Iterable[VectorLike]', spacing: float) -> 'Unique':
+    """Move points to the nearest node of a square grid, and collapse them.
+
+    Nodes are at whole multiples of ``spacing``, on each axis. Returns the
+    nodes points were moved to, in the order they were first reached, and the
+    index among them of the node each input point was moved to:
+
+    >>> nodes, indices = snap_to_grid([(0.9, 2.1), (5, 5), (1.2, 1.8)], 1)
+    >>> nodes
+    Vector2Batch([Vector2(1.0, 2.0), Vector2(5.0, 5.0)])
+    >>> indices
+    [0, 1, 0]
+
+    Each point moves by at most ``spacing / 2`` on each axis. This is faster
+    than :py:func:`unique_within`, but nearly-equal points on both sides of
+    the boundary between two nodes are not collapsed. Raises
+    :py:exc:`ValueError` if ``spacing`` isn't positive, or if any point isn't
+    finite.
+    """
+    spacing = _cell_size(spacing)
+    unique = Vector2Batch(element_type=_element_type(points))
+    xs, ys = unique.xs, unique.ys
+    indices = []
+    nodes: 'typing.Dict[Key, int]' = {}
+    for x, y in _coordinates(points):
+        try:
+            node = round(x / spacing), round(y / spacing)
+        except (OverflowError, ValueError):
+            raise ValueError(f"Vector2({x}, {y}) is not finite")
+
+        index = nodes.setdefault(node, len(nodes))
+        if index == len(xs):
+            xs.append(node[0] * spacing)
+            ys.append(node[1] * spacing)
+        indices.append(index)
+
+    return unique, indices
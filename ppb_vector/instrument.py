@@ -0,0 +1,247 @@
+"""Opt-in instrumentation of :py:class:`Vector2 <ppb_vector.Vector2>` operations.
+
+Instrumentation is disabled by default, and costs nothing then: enabling it
+replaces the methods of :py:class:`Vector2 <ppb_vector.Vector2>` with counting
+wrappers, and disabling it puts the original methods back.
+
+>>> from ppb_vector import Vector2, instrument
+>>> with instrument.collect() as stats:
+...     v = Vector2(1, 2) + (3, 4)
+>>> stats.snapshot().calls['__add__']
+1
+>>> stats.snapshot().conversions[tuple]
+1
+
+Only the methods defined by :py:class:`Vector2 <ppb_vector.Vector2>` itself
+are instrumented; overrides in subclasses are not.
+
+Passing vector-likes, such as tuples or dicts, where a
+:py:class:`Vector2 <ppb_vector.Vector2>` is expected forces a slower conversion.
+To find out which callers cause the most conversions, instrumentation can also
+record where those vector-likes enter the API:
+
+>>> with instrument.collect(trace_conversions=True) as stats:
+...     for _ in range(3):
+...         v = Vector2(1, 2).reflect((0, 1))
+>>> [(site, count)] = stats.snapshot().call_sites.most_common()
+>>> count
+3
+"""
+import functools
+import os
+import sys
+import typing
+from collections import Counter
+from contextlib import contextmanager
+from time import perf_counter
+
+from ppb_vector.vector2 import _install_wrapper, _remove_wrapper, Vector2
+
+__all__ = ('Snapshot', 'Stats', 'collect', 'disable', 'enable', 'is_enabled', 'reset', 'snapshot')
+
+
+#: The methods and properties of Vector2 whose calls are counted.
+METHODS = (
+    '__add__', '__sub__', '__mul__', '__rmul__', '__truediv__', '__neg__',
+    '__eq__', '__getitem__', '__iter__', '__len__',
+    'angle', 'asdict', 'dot', 'isclose', 'length', 'normalize', 'reflect',
+    'rotate', 'scale', 'scale_by', 'scale_to', 'truncate', 'update',
+)
+
+
+class Snapshot(typing.NamedTuple):
+    """A copy of the statistics collected so far."""
+
+    #: Number of calls, per method name
+    calls: typing.Counter[str]
+    #: Number of vector-likes converted by ``Vector2._unpack``, per source type
+    conversions: typing.Counter[type]
+    #: Number of vectors created, per class
+    allocations: typing.Counter[type]
+    #: Number of timed calls and their total wall-time in seconds, per method name
+    timings: typing.Mapping[str, typing.Tuple[int, float]]
+    #: Number of vector-likes converted, per ``(filename, line)`` of the caller
+    call_sites: typing.Counter[typing.Tuple[str, int]]
+
+
+class Stats:
+    """Statistics collected while instrumentation is enabled."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all the statistics collected so far."""
+        self.calls: typing.Counter[str] = Counter()
+        self.conversions: typing.Counter[type] = Counter()
+        self.allocations: typing.Counter[type] = Counter()
+        self.timed_calls: typing.Counter[str] = Counter()
+        self.timed_total: typing.Dict[str, float] = {}
+        self.call_sites: typing.Counter[typing.Tuple[str, int]] = Counter()
+
+    def snapshot(self) -> Snapshot:
+        """Copy the statistics collected so far."""
+        return Snapshot(
+            calls=self.calls.copy(),
+            conversions=self.conversions.copy(),
+            allocations=self.allocations.copy(),
+            timings={
+                name: (count, self.timed_total[name])
+                for name, count in self.timed_calls.items()
+            },
+            call_sites=self.call_sites.copy(),
+        )
+
+
+# Statistics are recorded into _active, which collect() temporarily replaces
+_global = _active = Stats()
+
+# The instrumenting attributes installed on Vector2, by name
+_wrappers: typing.Dict[str, typing.Any] = {}
+_sample_every = 0
+_trace_conversions = False
+
+_PACKAGE_DIR = os.path.dirname(__file__)
+
+
+def _call_site() -> typing.Tuple[str, int]:
+    """Find the innermost frame on the stack that is outside of this package."""
+    frame = sys._getframe(2)
+    while frame.f_back is not None and frame.f_code.co_filename.startswith(_PACKAGE_DIR):
+        frame = frame.f_back
+    return frame.f_code.co_filename, frame.f_lineno
+
+
+def _instrument_method(name: str, method: typing.Callable) -> typing.Callable:
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        if not wrapper._active:
+            return method(*args, **kwargs)
+
+        stats = _active
+        stats.calls[name] += 1
+        if not _sample_every or stats.calls[name] % _sample_every:
+            return method(*args, **kwargs)
+
+        start = perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            stats.timed_calls[name] += 1
+            stats.timed_total[name] = stats.timed_total.get(name, 0.0) + perf_counter() - start
+
+    return wrapper
+
+
+def _instrument_new(new: typing.Callable) -> typing.Callable:
+    @functools.wraps(new)
+    def wrapper(cls, *args, **kwargs):
+        rv = new(cls, *args, **kwargs)
+        if wrapper._active and not (len(args) == 1 and rv is args[0]):
+            _active.allocations[type(rv)] += 1
+        return rv
+
+    return wrapper
+
+
+def _instrument_unpack(unpack: typing.Callable) -> typing.Callable:
+    @functools.wraps(unpack)
+    def wrapper(value):
+        if not wrapper._active:
+            return unpack(value)
+
+        _active.conversions[type(value)] += 1
+        if _trace_conversions and not isinstance(value, Vector2):
+            _active.call_sites[_call_site()] += 1
+        return unpack(value)
+
+    return wrapper
+
+
+def is_enabled() -> bool:
+    """Check whether instrumentation is currently enabled."""
+    return bool(_wrappers)
+
+
+def enable(*, sample_every: int = 0, trace_conversions: bool = False) -> None:
+    """Start instrumenting :py:class:`Vector2 <ppb_vector.Vector2>`.
+
+    :param sample_every: if positive, the wall-time of one call in
+      ``sample_every`` is measured, for each method.
+
+    :param trace_conversions: record the call sites where vector-likes that
+      are not :py:class:`Vector2 <ppb_vector.Vector2>` instances get converted.
+      Call sites are the innermost stack frames outside of :py:mod:`ppb_vector`.
+
+    Enabling instrumentation when it already is only changes the options.
+    """
+    global _sample_every, _trace_conversions
+    if sample_every < 0:
+        raise ValueError("sample_every must be non-negative")
+
+    _sample_every, _trace_conversions = sample_every, trace_conversions
+    if is_enabled():
+        return
+
+    attributes = vars(Vector2)
+    for name in METHODS:
+        attribute = attributes[name]
+        wrapped: typing.Any
+        if isinstance(attribute, property):
+            wrapped = property(_instrument_method(name, attribute.fget))  # type: ignore
+        else:
+            wrapped = _instrument_method(name, attribute)
+        _wrappers[name] = wrapped
+
+    _wrappers['__new__'] = staticmethod(_instrument_new(Vector2.__new__))
+    _wrappers['_unpack'] = staticmethod(_instrument_unpack(Vector2._unpack))
+
+    for name, wrapped in _wrappers.items():
+        _install_wrapper(name, wrapped)
+
+
+def disable() -> None:
+    """Stop instrumenting, restoring the original methods.
+
+    Statistics collected so far are kept until :py:func:`reset`.
+    """
+    for name, wrapped in _wrappers.items():
+        _remove_wrapper(name, wrapped)
+    _wrappers.clear()
+
+
+def snapshot() -> Snapshot:
+    """Copy the statistics collected outside of :py:func:`collect` blocks."""
+    return _global.snapshot()
+
+
+def reset() -> None:
+    """Discard the statistics collected outside of :py:func:`collect` blocks."""
+    _global.reset()
+
+
+@contextmanager
+def collect(*, sample_every: int = 0, trace_conversions: bool = False) -> typing.Iterator[Stats]:
+    """Collect statistics about the operations performed in a block of code.
+
+    Instrumentation is enabled for the duration of the block, unless it already
+    was, and the statistics are recorded into a fresh :py:class:`Stats` object,
+    separately from those returned by :py:func:`snapshot`.
+
+    :param sample_every: as in :py:func:`enable`.
+    :param trace_conversions: as in :py:func:`enable`.
+    """
+    global _active
+    was_enabled, previous = is_enabled(), _active
+    previous_options = _sample_every, _trace_conversions
+
+    stats = _active = Stats()
+    enable(sample_every=sample_every, trace_conversions=trace_conversions)
+    try:
+        yield stats
+    finally:
+        _active = previous
+        if was_enabled:
+            enable(sample_every=previous_options[0], trace_conversions=previous_options[1])
+        else:
+            disable()
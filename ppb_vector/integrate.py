@@ -0,0 +1,175 @@
+"""Numerical integration of the motion of many particles.
+
+The integrators in this module step the positions and velocities of particles,
+stored in :py:class:`Vector2Batch <ppb_vector.Vector2Batch>`, in place and in a
+single pass, without creating any :py:class:`Vector2 <ppb_vector.Vector2>`:
+
+>>> from ppb_vector import Vector2Batch
+>>> from ppb_vector.integrate import semi_implicit_euler
+>>> positions = Vector2Batch([(0, 0), (10, 0)])
+>>> velocities = Vector2Batch([(1, 0), (0, 1)])
+>>> semi_implicit_euler(positions, velocities, (0, -10), 0.1)
+>>> positions
+Vector2Batch([Vector2(0.1, -0.1), Vector2(10.0, 0.0)])
+>>> velocities
+Vector2Batch([Vector2(1.0, -1.0), Vector2(0.0, 0.0)])
+
+Accelerations are either a batch or a view of one, with one acceleration per
+particle, or a single vector-like applied to all particles, such as gravity.
+
+All integrators can also apply damping, which scales velocities by
+``1 / (1 + damping * dt)`` at each step, and clamp the speed of particles, as
+:py:meth:`Vector2.truncate <ppb_vector.Vector2.truncate>` would; ``max_speed``
+is either a single limit or one limit per particle.
+"""
+from array import array
+from itertools import repeat
+from math import inf, sqrt
+
+from ppb_vector.batch import Vector2Batch, Vector2BatchView
+from ppb_vector.vector2 import Vector2
+
+__all__ = ('euler', 'semi_implicit_euler', 'verlet')
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing  # noqa: I300
+
+    from ppb_vector.vector2 import VectorLike
+
+    Accelerations = typing.Union[Vector2Batch, Vector2BatchView, VectorLike]
+    Speeds = typing.Union[float, typing.Iterable[float], None]
+
+
+def _accelerations(
+    count: int, accelerations: 'Accelerations',
+) -> 'typing.Tuple[typing.Iterable[float], typing.Iterable[float]]':
+    """Get per-particle acceleration coordinates, for count particles."""
+    if isinstance(accelerations, (Vector2Batch, Vector2BatchView)):
+        if len(accelerations) != count:
+            raise ValueError(f"Got {count} particles and {len(accelerations)} accelerations")
+        return accelerations.xs, accelerations.ys
+
+    x, y = Vector2._unpack(accelerations)
+    return repeat(x, count), repeat(y, count)
+
+
+def _speeds(count: int, max_speed: 'Speeds') -> 'typing.Iterable[float]':
+    """Get per-particle speed limits, for count particles."""
+    if max_speed is None:
+        return repeat(inf, count)
+    if isinstance(max_speed, (int, float)):
+        return repeat(float(max_speed), count)
+
+    speeds = array('d', max_speed)
+    if len(speeds) != count:
+        raise ValueError(f"Got {count} particles and {len(speeds)} speed limits")
+    return speeds
+
+
+def _check(positions: Vector2Batch, other: Vector2Batch, name: str) -> int:
+    count = len(positions)
+    if len(other) != count:
+        raise ValueError(f"Got {count} positions and {len(other)} {name}")
+    return count
+
+
+def euler(
+    positions: Vector2Batch, velocities: Vector2Batch, accelerations: 'Accelerations',
+    dt: float, *, damping: float = 0.0, max_speed: 'Speeds' = None,
+) -> None:
+    """Step particles with the explicit Euler method.
+
+    Positions are moved by the velocities at the beginning of the step, which
+    are then updated; this is the simplest method, but the least stable.
+
+    >>> positions, velocities = Vector2Batch([(0, 0)]), Vector2Batch([(1, 0)])
+    >>> euler(positions, velocities, (0, -10), 0.1)
+    >>> positions[0], velocities[0]
+    (Vector2(0.1, 0.0), Vector2(1.0, -1.0))
+    """
+    count = _check(positions, velocities, 'velocities')
+    ax, ay = _accelerations(count, accelerations)
+    speeds = _speeds(count, max_speed)
+    retained = 1 / (1 + damping * dt)
+
+    xs, ys = positions.xs, positions.ys
+    vxs, vys = velocities.xs, velocities.ys
+    for i, a_x, a_y, speed in zip(range(count), ax, ay, speeds):
+        vx, vy = vxs[i], vys[i]
+        xs[i] += vx * dt
+        ys[i] += vy * dt
+
+        vx = (vx + a_x * dt) * retained
+        vy = (vy + a_y * dt) * retained
+        if vx * vx + vy * vy > speed * speed:
+            scale = speed / sqrt(vx * vx + vy * vy)
+            vx, vy = vx * scale, vy * scale
+        vxs[i], vys[i] = vx, vy
+
+
+def semi_implicit_euler(
+    positions: Vector2Batch, velocities: Vector2Batch, accelerations: 'Accelerations',
+    dt: float, *, damping: float = 0.0, max_speed: 'Speeds' = None,
+) -> None:
+    """Step particles with the semi-implicit, or symplectic, Euler method.
+
+    Velocities are updated first, and positions are moved by the new
+    velocities; this is as cheap as :py:func:`euler`, and much more stable.
+    """
+    count = _check(positions, velocities, 'velocities')
+    ax, ay = _accelerations(count, accelerations)
+    speeds = _speeds(count, max_speed)
+    retained = 1 / (1 + damping * dt)
+
+    xs, ys = positions.xs, positions.ys
+    vxs, vys = velocities.xs, velocities.ys
+    for i, a_x, a_y, speed in zip(range(count), ax, ay, speeds):
+        vx = (vxs[i] + a_x * dt) * retained
+        vy = (vys[i] + a_y * dt) * retained
+        if vx * vx + vy * vy > speed * speed:
+            scale = speed / sqrt(vx * vx + vy * vy)
+            vx, vy = vx * scale, vy * scale
+        vxs[i], vys[i] = vx, vy
+
+        xs[i] += vx * dt
+        ys[i] += vy * dt
+
+
+def verlet(
+    positions: Vector2Batch, previous: Vector2Batch, accelerations: 'Accelerations',
+    dt: float, *, damping: float = 0.0, max_speed: 'Speeds' = None,
+) -> None:
+    """Step particles with the position Verlet method.
+
+    Velocities are not stored, but implied by the positions at the previous
+    step, which ``previous`` holds and which are updated as well:
+
+    >>> positions, previous = Vector2Batch([(0, 0)]), Vector2Batch([(-0.5, 0)])
+    >>> verlet(positions, previous, (0, -4), 0.5)
+    >>> positions[0], previous[0]
+    (Vector2(0.5, -1.0), Vector2(0.0, 0.0))
+
+    This method is second-order accurate, and changing positions directly,
+    for instance to resolve collisions, implicitly changes velocities. Speed
+    limits apply to the velocity implied by the new positions.
+    """
+    count = _check(positions, previous, 'previous positions')
+    ax, ay = _accelerations(count, accelerations)
+    speeds = _speeds(count, max_speed)
+    retained = 1 / (1 + damping * dt)
+    dt2 = dt * dt
+
+    xs, ys = positions.xs, positions.ys
+    pxs, pys = previous.xs, previous.ys
+    for i, a_x, a_y, speed in zip(range(count), ax, ay, speeds):
+        x, y = xs[i], ys[i]
+        dx = (x - pxs[i]) * retained + a_x * dt2
+        dy = (y - pys[i]) * retained + a_y * dt2
+        limit = speed * dt
+        if dx * dx + dy * dy > limit * limit:
+            scale = limit / sqrt(dx * dx + dy * dy)
+            dx, dy = dx * scale, dy * scale
+
+        pxs[i], pys[i] = x, y
+        xs[i], ys[i] = x + dx, y + dy
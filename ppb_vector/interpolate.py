@@ -0,0 +1,239 @@
+"""Interpolation between vectors, and sampling of curves.
+
+The functions in this module evaluate an interpolation, or a curve, at many
+values of its parameter ``t`` in a single call, and return the results as a
+:py:class:`Vector2Batch <ppb_vector.Vector2Batch>`, without creating any
+intermediate :py:class:`Vector2 <ppb_vector.Vector2>`:
+
+>>> from ppb_vector.interpolate import lerp
+>>> lerp((0, 0), (2, 4), [0, 0.25, 1])
+Vector2Batch([Vector2(0.0, 0.0), Vector2(0.5, 1.0), Vector2(2.0, 4.0)])
+
+The results are instances of the most derived class among the given vectors,
+as for :py:meth:`Vector2.__add__ <ppb_vector.Vector2.__add__>`.
+
+Curves can also be flattened into polylines, whose distance to the curve is
+below a given tolerance, with :py:func:`flatten_bezier` and
+:py:func:`flatten_catmull_rom`.
+"""
+from math import hypot
+
+from ppb_vector.batch import _result_type, Vector2Batch
+from ppb_vector.vector2 import Vector2
+
+__all__ = (
+    'bezier', 'catmull_rom', 'flatten_bezier', 'flatten_catmull_rom', 'lerp', 'slerp',
+)
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing  # noqa: I300
+
+    from ppb_vector.vector2 import VectorLike
+
+    Point = typing.Tuple[float, float]
+
+#: Maximum number of times a curve is split in two by flatten_bezier
+_MAX_DEPTH = 24
+
+
+def lerp(a: 'VectorLike', b: 'VectorLike', ts: 'typing.Iterable[float]') -> Vector2Batch:
+    """Interpolate linearly between two vectors.
+
+    For each ``t``, this computes ``a + (b - a) * t``: ``t = 0`` gives ``a``,
+    and ``t = 1`` gives ``b``.
+    """
+    ax, ay = Vector2._unpack(a)
+    bx, by = Vector2._unpack(b)
+    dx, dy = bx - ax, by - ay
+
+    result = Vector2Batch(element_type=_result_type(a, b))
+    xs, ys = result.xs, result.ys
+    for t in ts:
+        xs.append(ax + dx * t)
+        ys.append(ay + dy * t)
+    return result
+
+
+def slerp(a: 'VectorLike', b: 'VectorLike', ts: 'typing.Iterable[float]') -> Vector2Batch:
+    """Interpolate spherically between two vectors.
+
+    The direction of the result turns from ``a`` to ``b`` at a constant rate,
+    by the angle between them given by :py:meth:`Vector2.angle
+    <ppb_vector.Vector2.angle>`, while its length changes linearly; the result
+    is ``a`` for ``t = 0``, and ``b`` for ``t = 1``:
+
+    >>> slerp((1, 0), (-3, 0), [0, 0.5, 1])
+    Vector2Batch([Vector2(1.0, 0.0), Vector2(0.0, 2.0), Vector2(-3.0, 0.0)])
+
+    As in :py:meth:`Vector2.rotate <ppb_vector.Vector2.rotate>`, the
+    direction turns counter-clockwise when the angle is positive. If either
+    vector is zero, the direction is undefined and this is the same as
+    :py:func:`lerp`.
+    """
+    a_vector, b_vector = Vector2(a), Vector2(b)
+    a_length, b_length = a_vector.length, b_vector.length
+    if a_length == 0 or b_length == 0:
+        return lerp(a, b, ts)
+
+    angle = a_vector.angle(b_vector)
+    ux, uy = a_vector.x / a_length, a_vector.y / a_length
+    trig = Vector2._trig
+
+    result = Vector2Batch(element_type=_result_type(a, b))
+    xs, ys = result.xs, result.ys
+    for t in ts:
+        length = a_length + (b_length - a_length) * t
+        r_cos, r_sin = trig(angle * t)
+        xs.append(length * (ux * r_cos - uy * r_sin))
+        ys.append(length * (ux * r_sin + uy * r_cos))
+    return result
+
+
+def bezier(
+    p0: 'VectorLike', p1: 'VectorLike', p2: 'VectorLike', p3: 'VectorLike',
+    ts: 'typing.Iterable[float]',
+) -> Vector2Batch:
+    """Evaluate a cubic Bézier curve.
+
+    The curve goes from ``p0``, for ``t = 0``, to ``p3``, for ``t = 1``, and
+    ``p1`` and ``p2`` are its control points:
+
+    >>> bezier((0, 0), (0, 1), (1, 1), (1, 0), [0, 0.5, 1])
+    Vector2Batch([Vector2(0.0, 0.0), Vector2(0.5, 0.75), Vector2(1.0, 0.0)])
+    """
+    x0, y0 = Vector2._unpack(p0)
+    x1, y1 = Vector2._unpack(p1)
+    x2, y2 = Vector2._unpack(p2)
+    x3, y3 = Vector2._unpack(p3)
+
+    result = Vector2Batch(element_type=_result_type(p0, p1, p2, p3))
+    xs, ys = result.xs, result.ys
+    for t in ts:
+        s = 1 - t
+        # Bernstein polynomials of degree 3
+        b0, b1, b2, b3 = s * s * s, 3 * s * s * t, 3 * s * t * t, t * t * t
+        xs.append(b0 * x0 + b1 * x1 + b2 * x2 + b3 * x3)
+        ys.append(b0 * y0 + b1 * y1 + b2 * y2 + b3 * y3)
+    return result
+
+
+def catmull_rom(
+    p0: 'VectorLike', p1: 'VectorLike', p2: 'VectorLike', p3: 'VectorLike',
+    ts: 'typing.Iterable[float]',
+) -> Vector2Batch:
+    """Evaluate a uniform Catmull-Rom spline segment.
+
+    The segment goes from ``p1``, for ``t = 0``, to ``p2``, for ``t = 1``;
+    ``p0`` and ``p3`` are the neighbouring points of the spline, which set the
+    tangents at both ends:
+
+    >>> catmull_rom((0, 0), (1, 0), (2, 0), (3, 0), [0, 0.5, 1])
+    Vector2Batch([Vector2(1.0, 0.0), Vector2(1.5, 0.0), Vector2(2.0, 0.0)])
+
+    Sampling consecutive segments of a spline, sliding the four points by one
+    each time, gives a smooth curve through all points but the first and last.
+    """
+    result = bezier(*_catmull_rom_to_bezier(p0, p1, p2, p3), ts)
+    result.element_type = _result_type(p0, p1, p2, p3)
+    return result
+
+
+def _catmull_rom_to_bezier(
+    p0: 'VectorLike', p1: 'VectorLike', p2: 'VectorLike', p3: 'VectorLike',
+) -> 'typing.Tuple[Point, Point, Point, Point]':
+    """Find the control points of the Bézier curve equal to a Catmull-Rom segment."""
+    x0, y0 = Vector2._unpack(p0)
+    x1, y1 = Vector2._unpack(p1)
+    x2, y2 = Vector2._unpack(p2)
+    x3, y3 = Vector2._unpack(p3)
+    return (
+        (x1, y1),
+        (x1 + (x2 - x0) / 6, y1 + (y2 - y0) / 6),
+        (x2 - (x3 - x1) / 6, y2 - (y3 - y1) / 6),
+        (x2, y2),
+    )
+
+
+def _distance_to_chord(x: float, y: float, x0: float, y0: float, dx: float, dy: float) -> float:
+    """Compute the distance from a point to the segment from (x0, y0) to (x0 + dx, y0 + dy)."""
+    squared_length = dx * dx + dy * dy
+    t = 0.0
+    if squared_length > 0:
+        t = min(max(((x - x0) * dx + (y - y0) * dy) / squared_length, 0.0), 1.0)
+    return hypot(x - x0 - t * dx, y - y0 - t * dy)
+
+
+def flatten_bezier(
+    p0: 'VectorLike', p1: 'VectorLike', p2: 'VectorLike', p3: 'VectorLike',
+    tolerance: float,
+) -> Vector2Batch:
+    """Approximate a cubic Bézier curve with a polyline.
+
+    The curve is split in two until its control points are within
+    ``tolerance`` of the segment between its endpoints; since the curve lies
+    in the convex hull of its control points, all points of the curve are
+    then within ``tolerance`` of the returned polyline, which starts at ``p0``
+    and ends at ``p3``:
+
+    >>> len(flatten_bezier((0, 0), (0, 1), (1, 1), (1, 0), 0.1))
+    5
+    >>> flatten_bezier((0, 0), (1, 0), (2, 0), (3, 0), 0.1)
+    Vector2Batch([Vector2(0.0, 0.0), Vector2(3.0, 0.0)])
+
+    Flatter parts of the curve get fewer vertices. Raises :py:exc:`ValueError`
+    if the tolerance isn't positive.
+    """
+    tolerance = float(tolerance)
+    if not tolerance > 0:
+        raise ValueError("flatten_bezier() requires a positive tolerance")
+
+    x0, y0 = Vector2._unpack(p0)
+    result = Vector2Batch(element_type=_result_type(p0, p1, p2, p3))
+    xs, ys = result.xs, result.ys
+    xs.append(x0)
+    ys.append(y0)
+
+    # Curves waiting to be flattened, the last one first; each one is listed
+    # as its control points but the first, which is the last vertex added.
+    stack = [(Vector2._unpack(p1), Vector2._unpack(p2), Vector2._unpack(p3), 0)]
+    while stack:
+        (x1, y1), (x2, y2), (x3, y3), depth = stack.pop()
+        x0, y0 = xs[-1], ys[-1]
+
+        dx, dy = x3 - x0, y3 - y0
+        flat = max(
+            _distance_to_chord(x1, y1, x0, y0, dx, dy),
+            _distance_to_chord(x2, y2, x0, y0, dx, dy),
+        ) <= tolerance
+        if flat or depth >= _MAX_DEPTH:
+            xs.append(x3)
+            ys.append(y3)
+            continue
+
+        # De Casteljau's algorithm, at t = 1/2
+        x01, y01 = (x0 + x1) / 2, (y0 + y1) / 2
+        x12, y12 = (x1 + x2) / 2, (y1 + y2) / 2
+        x23, y23 = (x2 + x3) / 2, (y2 + y3) / 2
+        x012, y012 = (x01 + x12) / 2, (y01 + y12) / 2
+        x123, y123 = (x12 + x23) / 2, (y12 + y23) / 2
+        middle = (x012 + x123) / 2, (y012 + y123) / 2
+
+        stack.append(((x123, y123), (x23, y23), (x3, y3), depth + 1))
+        stack.append(((x01, y01), (x012, y012), middle, depth + 1))
+
+    return result
+
+
+def flatten_catmull_rom(
+    p0: 'VectorLike', p1: 'VectorLike', p2: 'VectorLike', p3: 'VectorLike',
+    tolerance: float,
+) -> Vector2Batch:
+    """Approximate a uniform Catmull-Rom spline segment with a polyline.
+
+    The polyline goes from ``p1`` to ``p2``, and is within ``tolerance`` of the
+    segment; see :py:func:`catmull_rom` and :py:func:`flatten_bezier`.
+    """
+    result = flatten_bezier(*_catmull_rom_to_bezier(p0, p1, p2, p3), tolerance)
+    result.element_type = _result_type(p0, p1, p2, p3)
+    return result
@@ -0,0 +1,225 @@
+"""Locality-preserving orders of points, along space-filling curves.
+
+Points are mapped to the cells of a grid of ``2 ** bits`` by ``2 ** bits``
+cells over a bounding box, and the cells are numbered along a Morton
+(Z-order) or Hilbert curve: points that are close in space mostly get close
+keys, so sorting points by key brings nearby points next to each other.
+
+>>> from ppb_vector import Vector2Batch
+>>> from ppb_vector.locality import argsort_by_locality, hilbert_key, reorder
+>>> hilbert_key((0.9, 0.1), (0, 0), (1, 1), bits=1)
+3
+>>> points = Vector2Batch([(0, 0), (10, 10), (1, 0), (9, 10), (0, 1)])
+>>> order = argsort_by_locality(points)
+>>> order
+[0, 2, 4, 3, 1]
+>>> reorder(points, order)
+>>> list(points[:3])
+[Vector2(0.0, 0.0), Vector2(1.0, 0.0), Vector2(0.0, 1.0)]
+
+Reordering batches in memory this way, before iterating over them or running
+neighbour queries, makes accesses to nearby points hit the same cache lines.
+Batches holding other data about the same points, such as their velocities,
+should be reordered along, with the same ``order``.
+
+The Hilbert curve keeps consecutive cells adjacent, and generally preserves
+locality better; Morton keys are cheaper to compute.
+"""
+from array import array
+from math import inf
+
+from ppb_vector.batch import _coordinates, Vector2Batch
+from ppb_vector.reductions import bounding_box
+from ppb_vector.vector2 import Vector2
+
+__all__ = (
+    'argsort_by_locality', 'hilbert_key', 'hilbert_keys', 'morton_key', 'morton_keys',
+    'reorder',
+)
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing  # noqa: I300
+
+    from ppb_vector.vector2 import VectorLike
+
+#: Largest number of bits per coordinate
+_MAX_BITS = 32
+
+# The bits of each byte, spread to the even bits of a 16 bits integer
+_SPREAD = [sum((byte >> i & 1) << 2 * i for i in range(8)) for byte in range(256)]
+
+# Steps along the Hilbert curve for 4 bits of each coordinate at a time,
+#  indexed by state << 8 | x << 4 | y, and holding the 8 bits of the curve
+#  index as digits << 2 | next state. Filled on first use.
+_hilbert_table: 'typing.List[int]' = []
+
+
+def _fill_hilbert_table() -> None:
+    # The state tells how the curve is transformed in the current cell: bit 1
+    #  is set if both coordinates are flipped, bit 0 if they are swapped.
+    for state in range(4):
+        for x in range(16):
+            for y in range(16):
+                flip, swap, digits = state >> 1, state & 1, 0
+                for i in (3, 2, 1, 0):
+                    rx, ry = x >> i & 1 ^ flip, y >> i & 1 ^ flip
+                    if swap:
+                        rx, ry = ry, rx
+                    digits = digits << 2 | (3 * rx) ^ ry
+                    if not ry:
+                        flip ^= rx
+                        swap ^= 1
+                _hilbert_table.append(digits << 2 | flip << 1 | swap)
+
+
+def _cells(
+    points: 'typing.Iterable[VectorLike]', low: 'VectorLike', high: 'VectorLike', bits: int,
+) -> 'typing.Iterator[typing.Tuple[int, int]]':
+    """Find the grid cells containing points, clamping points out of the bounds."""
+    if not 1 <= bits <= _MAX_BITS:
+        raise ValueError(f"Expected between 1 and {_MAX_BITS} bits, got {bits}")
+    low_x, low_y = Vector2._unpack(low)
+    high_x, high_y = Vector2._unpack(high)
+    if not (low_x <= high_x and low_y <= high_y):
+        raise ValueError(f"Bounds {Vector2(low)} and {Vector2(high)} are empty")
+
+    cells = 1 << bits
+    last = cells - 1
+    # Dividing by an infinite span puts all points in the first cell, and
+    #  doesn't overflow as multiplying by the inverse of a tiny span would.
+    span_x, span_y = high_x - low_x or inf, high_y - low_y or inf
+    for x, y in _coordinates(points):
+        yield (
+            int(min(max((x - low_x) / span_x * cells, 0), last)),
+            int(min(max((y - low_y) / span_y * cells, 0), last)),
+        )
+
+
+def _morton(x: int, y: int) -> int:
+    spread = _SPREAD
+    key = 0
+    for shift in (24, 16, 8, 0):
+        key = key << 16 | spread[x >> shift & 255] | spread[y >> shift & 255] << 1
+    return key
+
+
+def _hilbert(x: int, y: int, bits: int) -> int:
+    if not _hilbert_table:
+        _fill_hilbert_table()
+    table = _hilbert_table
+
+    # The curve index of a cell of a coarse grid is that of its cells in a
+    #  finer grid divided by their number, as the curve goes through them in
+    #  a row: compute it on a grid with a multiple of 4 bits.
+    padding = -bits % 4
+    x, y = x << padding, y << padding
+    state = index = 0
+    for shift in range(bits + padding - 4, -1, -4):
+        step = table[state << 8 | (x >> shift & 15) << 4 | y >> shift & 15]
+        index = index << 8 | step >> 2
+        state = step & 3
+    return index >> 2 * padding
+
+
+def morton_keys(
+    points: 'typing.Iterable[VectorLike]', low: 'VectorLike', high: 'VectorLike',
+    bits: int = 16,
+) -> 'typing.List[int]':
+    """Compute the Morton keys of points, in a grid over the box from low to high.
+
+    Keys are integers of ``2 * bits`` bits, interleaving the bits of the
+    grid coordinates of the points, those of X in the even bits. Points out of
+    the box are moved to the nearest cell in it.
+
+    Raises :py:exc:`ValueError` if ``bits`` isn't between 1 and 32, if any
+    coordinate of ``low`` is greater than that of ``high``, or if any point
+    has a NaN coordinate.
+    """
+    return [_morton(x, y) for x, y in _cells(points, low, high, bits)]
+
+
+def morton_key(
+    point: 'VectorLike', low: 'VectorLike', high: 'VectorLike', bits: int = 16,
+) -> int:
+    """Compute the Morton key of a point; see :py:func:`morton_keys`.
+
+    >>> morton_key((3, 1), (0, 0), (4, 4), bits=2)
+    7
+    """
+    [key] = morton_keys([point], low, high, bits)
+    return key
+
+
+def hilbert_keys(
+    points: 'typing.Iterable[VectorLike]', low: 'VectorLike', high: 'VectorLike',
+    bits: int = 16,
+) -> 'typing.List[int]':
+    """Compute the Hilbert keys of points, in a grid over the box from low to high.
+
+    Keys are integers of ``2 * bits`` bits, numbering the cells of the grid
+    along a Hilbert curve, from the cell at ``low`` to the one at ``(high.x,
+    low.y)``. Points out of the box are moved to the nearest cell in it.
+
+    Raises :py:exc:`ValueError` as :py:func:`morton_keys` does.
+    """
+    return [_hilbert(x, y, bits) for x, y in _cells(points, low, high, bits)]
+
+
+def hilbert_key(
+    point: 'VectorLike', low: 'VectorLike', high: 'VectorLike', bits: int = 16,
+) -> int:
+    """Compute the Hilbert key of a point; see :py:func:`hilbert_keys`.
+
+    >>> [hilbert_key(p, (0, 0), (2, 2), bits=1) for p in [(0, 0), (0, 1), (1, 1), (1, 0)]]
+    [0, 1, 2, 3]
+    """
+    [key] = hilbert_keys([point], low, high, bits)
+    return key
+
+
+def argsort_by_locality(
+    points: 'typing.Iterable[VectorLike]',
+    low: 'typing.Optional[VectorLike]' = None, high: 'typing.Optional[VectorLike]' = None,
+    *, curve: str = 'hilbert', bits: int = 16,
+) -> 'typing.List[int]':
+    """Find the order of points along a space-filling curve.
+
+    Returns the list of the indices of the points, sorted by their keys, as
+    computed by :py:func:`hilbert_keys` or by :py:func:`morton_keys` if
+    ``curve`` is ``'morton'``. Points with the same key stay in their order.
+
+    The grid covers the box from ``low`` to ``high``, which default to the
+    :py:func:`bounding box <ppb_vector.reductions.bounding_box>` of the points.
+    """
+    if curve not in ('hilbert', 'morton'):
+        raise ValueError(f"Unknown curve {curve!r}, expected 'hilbert' or 'morton'")
+    if not isinstance(points, Vector2Batch):
+        points = Vector2Batch(points)
+    if not points:
+        return []
+
+    if low is None or high is None:
+        box_low, box_high = bounding_box(points)
+        low = box_low if low is None else low
+        high = box_high if high is None else high
+
+    keys = (hilbert_keys if curve == 'hilbert' else morton_keys)(points, low, high, bits)
+    return sorted(range(len(keys)), key=keys.__getitem__)
+
+
+def reorder(batch: Vector2Batch, order: 'typing.Iterable[int]') -> None:
+    """Reorder a batch in place, so that ``batch[i]`` becomes ``batch[order[i]]``.
+
+    The arrays of the batch are updated, rather than replaced. Raises
+    :py:exc:`ValueError` if ``order`` isn't a permutation of the indices of
+    the batch.
+    """
+    order = list(order)
+    count = len(batch)
+    if len(order) != count or set(order) != set(range(count)):
+        raise ValueError(f"Order isn't a permutation of the {count} indices of the batch")
+
+    xs, ys = batch.xs, batch.ys
+    xs[:] = array(xs.typecode, [xs[i] for i in order])
+    ys[:] = array(ys.typecode, [ys[i] for i in order])
@@ -0,0 +1,216 @@
+"""Boolean masks over batches of vectors, and operations selected by them.
+
+Masks are lists of booleans, one per vector. The predicates in this module
+compute them from coordinates directly, without creating a
+:py:class:`Vector2 <ppb_vector.Vector2>` for each vector, and the other
+functions select, update or filter vectors according to them:
+
+>>> from ppb_vector import Vector2, Vector2Batch
+>>> from ppb_vector.masks import compress, longer_than, transform
+>>> velocities = Vector2Batch([(3, 4), (0, 1), (6, 8)])
+>>> too_fast = longer_than(velocities, 2)
+>>> too_fast
+[True, False, True]
+>>> transform(velocities, too_fast, Vector2.truncate, 2)
+>>> velocities
+Vector2Batch([Vector2(1.2, 1.6), Vector2(0.0, 1.0), Vector2(1.2, 1.6)])
+>>> compress(velocities, [not m for m in too_fast])
+Vector2Batch([Vector2(0.0, 1.0)])
+
+Masks combine with the usual boolean operators, element-wise, such as
+``[a and not b for a, b in zip(mask, other)]``. Functions taking one vector
+per element, such as :py:func:`where`, also take a single vector-like, which
+then applies to all elements; any other argument giving one vector per
+element must be a :py:class:`Vector2Batch <ppb_vector.Vector2Batch>` or a
+:py:class:`Vector2BatchView <ppb_vector.Vector2BatchView>`.
+"""
+from itertools import compress as _compress, repeat
+from math import hypot
+
+from ppb_vector.batch import (
+    _columns, _element_type, _result_type, Vector2Batch, Vector2BatchView,
+)
+from ppb_vector.vector2 import Vector2
+
+__all__ = (
+    'compress', 'half_plane', 'indices', 'isclose', 'longer_than', 'shorter_than',
+    'transform', 'update', 'where',
+)
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing  # noqa: I300
+
+    from ppb_vector.vector2 import VectorLike
+
+    Mask = typing.List[bool]
+    # One vector per element, or a single vector for all elements
+    Operand = typing.Union[Vector2Batch, Vector2BatchView, VectorLike]
+
+
+def _mask(mask: 'typing.Iterable[bool]', count: int) -> 'Mask':
+    mask = [bool(m) for m in mask]
+    if len(mask) != count:
+        raise ValueError(f"Got {count} vectors and a mask of {len(mask)} elements")
+    return mask
+
+
+def _operand(
+    value: 'Operand', count: int,
+) -> 'typing.Tuple[typing.Iterable[float], typing.Iterable[float]]':
+    """Get the coordinates of a batch of count vectors, or of a vector repeated count times."""
+    if isinstance(value, (Vector2Batch, Vector2BatchView)):
+        if len(value) != count:
+            raise ValueError(f"Got {count} vectors and a batch of {len(value)}")
+        return value.xs, value.ys
+
+    x, y = Vector2._unpack(value)
+    return repeat(x, count), repeat(y, count)
+
+
+def longer_than(vectors: 'typing.Iterable[VectorLike]', length: float) -> 'Mask':
+    """Check which vectors are longer than ``length``.
+
+    This is ``[v.length > length for v in vectors]``.
+    """
+    xs, ys = _columns(vectors)
+    return list(map(float(length).__lt__, map(hypot, xs, ys)))
+
+
+def shorter_than(vectors: 'typing.Iterable[VectorLike]', length: float) -> 'Mask':
+    """Check which vectors are shorter than ``length``.
+
+    This is ``[v.length < length for v in vectors]``.
+    """
+    xs, ys = _columns(vectors)
+    return list(map(float(length).__gt__, map(hypot, xs, ys)))
+
+
+def isclose(vectors: 'typing.Iterable[VectorLike]', other: 'Operand', *,
+            abs_tol: float = 1e-09, rel_tol: float = 1e-09) -> 'Mask':
+    """Check which vectors are close to others, or to a single vector.
+
+    This is ``[v.isclose(w, abs_tol=abs_tol, rel_tol=rel_tol) for v, w in
+    zip(vectors, other)]``; see :py:meth:`Vector2.isclose
+    <ppb_vector.Vector2.isclose>`.
+
+    >>> isclose([(1, 0), (1, 1e-10), (0, 1)], (1, 0))
+    [True, True, False]
+    """
+    abs_tol, rel_tol = float(abs_tol), float(rel_tol)
+    if abs_tol < 0 or rel_tol < 0:
+        raise ValueError("isclose takes non-negative tolerances")
+
+    xs, ys = _columns(vectors)
+    other_xs, other_ys = _operand(other, len(xs))
+    mask = []
+    for x, y, other_x, other_y in zip(xs, ys, other_xs, other_ys):
+        diff = hypot(x - other_x, y - other_y)
+        rel_length = max(hypot(x, y), hypot(other_x, other_y))
+        mask.append(diff <= rel_tol * rel_length or diff <= abs_tol)
+    return mask
+
+
+def half_plane(vectors: 'typing.Iterable[VectorLike]', normal: 'VectorLike',
+               offset: float = 0.0) -> 'Mask':
+    """Check which vectors lie in the open half-plane ``v.dot(normal) > offset``.
+
+    With a zero offset, these are the vectors less than 90° away from
+    ``normal``; for a unit ``normal``, they are the points further than
+    ``offset`` along it.
+
+    >>> half_plane([(2, 5), (0, -1), (1, 1)], (1, 0), 1)
+    [True, False, False]
+    """
+    normal_x, normal_y = Vector2._unpack(normal)
+    offset = float(offset)
+    xs, ys = _columns(vectors)
+    return [x * normal_x + y * normal_y > offset for x, y in zip(xs, ys)]
+
+
+def indices(mask: 'typing.Iterable[bool]') -> 'typing.List[int]':
+    """List the indices of the elements of a mask that are set.
+
+    Passing them to :py:meth:`Vector2Batch.view <ppb_vector.Vector2Batch.view>`
+    filters a batch without copying it:
+
+    >>> batch = Vector2Batch([(0, 0), (1, 1), (2, 2)])
+    >>> batch.view(indices([True, False, True]))
+    Vector2BatchView([Vector2(0.0, 0.0), Vector2(2.0, 2.0)])
+    """
+    return [i for i, m in enumerate(mask) if m]
+
+
+def compress(vectors: 'typing.Iterable[VectorLike]', mask: 'typing.Iterable[bool]') -> Vector2Batch:
+    """Make a batch of the vectors whose element of the mask is set.
+
+    The batch has the typecode and element type of ``vectors``, if it is a
+    batch or a view.
+    """
+    element_type = _element_type(vectors)
+    xs, ys = _columns(vectors)
+    mask = _mask(mask, len(xs))
+    typecode = vectors.typecode if isinstance(vectors, (Vector2Batch, Vector2BatchView)) else 'd'
+    return Vector2Batch.from_arrays(
+        _compress(xs, mask), _compress(ys, mask), typecode=typecode, element_type=element_type,
+    )
+
+
+def where(mask: 'typing.Iterable[bool]', a: 'Operand', b: 'Operand') -> Vector2Batch:
+    """Make a batch of the elements of ``a`` where the mask is set, and of ``b`` elsewhere.
+
+    >>> where([True, False], Vector2Batch([(1, 1), (2, 2)]), (0, 0))
+    Vector2Batch([Vector2(1.0, 1.0), Vector2(0.0, 0.0)])
+
+    The batch has the typecode of ``a``, if it is a batch, or else of ``b``,
+    if it is a batch, or else stores double precision coordinates. Its
+    element type is that of ``a + b``, for elements of ``a`` and ``b``.
+    """
+    mask = [bool(m) for m in mask]
+    count = len(mask)
+    a_xs, a_ys = _operand(a, count)
+    b_xs, b_ys = _operand(b, count)
+
+    typecode = 'd'
+    for operand in (b, a):
+        if isinstance(operand, (Vector2Batch, Vector2BatchView)):
+            typecode = operand.typecode
+
+    return Vector2Batch.from_arrays(
+        [ax if m else bx for m, ax, bx in zip(mask, a_xs, b_xs)],
+        [ay if m else by for m, ay, by in zip(mask, a_ys, b_ys)],
+        typecode=typecode, element_type=_result_type(a, b),
+    )
+
+
+def update(batch: Vector2Batch, mask: 'typing.Iterable[bool]', values: 'Operand') -> None:
+    """Replace the vectors of a batch whose element of the mask is set, in place.
+
+    ``values`` gives the new vectors, one per element of the batch, or a single
+    one for all of them.
+
+    >>> batch = Vector2Batch([(1, 1), (2, 2), (3, 3)])
+    >>> update(batch, [False, True, True], (0, 0))
+    >>> batch
+    Vector2Batch([Vector2(1.0, 1.0), Vector2(0.0, 0.0), Vector2(0.0, 0.0)])
+    """
+    count = len(batch)
+    mask = _mask(mask, count)
+    value_xs, value_ys = _operand(values, count)
+    xs, ys = batch.xs, batch.ys
+    for i, m, x, y in zip(range(count), mask, value_xs, value_ys):
+        if m:
+            xs[i], ys[i] = x, y
+
+
+def transform(batch: Vector2Batch, mask: 'typing.Iterable[bool]',
+              function: 'typing.Callable[..., VectorLike]', *args: 'typing.Any') -> None:
+    """Replace the vectors of a batch whose element of the mask is set by ``function(v, *args)``.
+
+    Only those vectors are made into :py:class:`Vector2 <ppb_vector.Vector2>`
+    and passed to ``function``, such as a method of :py:class:`Vector2
+    <ppb_vector.Vector2>`; the batch is updated in place.
+    """
+    mask = _mask(mask, len(batch))
+    for i in indices(mask):
+        batch[i] = function(batch[i], *args)
@@ -0,0 +1,163 @@
+"""Opt-in memoization of :py:class:`Vector2 <ppb_vector.Vector2>` operations.
+
+The methods of :py:class:`Vector2 <ppb_vector.Vector2>` are pure functions of
+immutable values, so their results can be cached. This is worth it when the
+same operations are repeated many times, for instance rotating the same
+directions by the same angles, and profiling shows them to be hot. Looking
+results up costs about as much as computing the cheapest operations, such as
+:py:attr:`length <ppb_vector.Vector2.length>` or :py:meth:`angle
+<ppb_vector.Vector2.angle>`, while cache hits on :py:meth:`rotate
+<ppb_vector.Vector2.rotate>` or :py:meth:`normalize
+<ppb_vector.Vector2.normalize>` are several times faster.
+
+Memoization is disabled by default, and costs nothing then: enabling it for
+some methods replaces them with wrappers, which look their arguments up in a
+bounded LRU cache, and disabling it puts the original methods back.
+
+>>> from ppb_vector import memoize, Vector2
+>>> memoize.enable('rotate')
+>>> for _ in range(3):
+...     v = Vector2(1, 0).rotate(30)
+>>> memoize.cache_info()['rotate']
+CacheInfo(hits=2, misses=1, maxsize=1024, currsize=1)
+>>> memoize.disable()
+
+Results are keyed by the class and coordinates of the vector, and by the
+other arguments and their types, which must be hashable for the result to be
+cached; calls with keyword arguments, or unhashable arguments such as lists,
+are not cached. As keys compare like vectors and numbers do, ``0.0`` and
+``-0.0`` share cache entries.
+
+Cached results are returned as they are by later calls, rather than copied:
+subclasses of :py:class:`Vector2 <ppb_vector.Vector2>` that add mutable
+attributes should not be memoized.
+
+Memoization and :py:mod:`instrumentation <ppb_vector.instrument>` both
+replace methods, and can be enabled and disabled independently, in any order.
+"""
+import functools
+import typing
+from contextlib import contextmanager
+
+from ppb_vector.vector2 import _install_wrapper, _make_vector, _remove_wrapper, Vector2
+
+__all__ = ('cache_clear', 'cache_info', 'disable', 'enable', 'is_enabled', 'memoized')
+
+
+#: The methods and properties of Vector2 that can be memoized.
+METHODS = (
+    'angle', 'dot', 'length', 'normalize', 'reflect', 'rotate', 'scale_by', 'scale_to',
+    'truncate',
+)
+
+# The memoizing attributes installed on Vector2, by name
+_wrappers: typing.Dict[str, typing.Any] = {}
+# The caches of the memoized methods, by name
+_caches: typing.Dict[str, typing.Any] = {}
+
+
+def _memoize(
+    method: typing.Callable, maxsize: typing.Optional[int],
+) -> typing.Tuple[typing.Callable, typing.Any]:
+    # Typed, so that equal arguments of different types, such as a vector and
+    #  an instance of a subclass, don't share results whose type differs.
+    @functools.lru_cache(maxsize=maxsize, typed=True)
+    def cached(cls, x, y, *args):
+        return method(_make_vector(cls, x, y), *args)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if kwargs or not wrapper._active:
+            return method(self, *args, **kwargs)
+        try:
+            return cached(type(self), self.x, self.y, *args)
+        except TypeError:
+            try:
+                hash(args)
+            except TypeError:
+                # Unhashable arguments, such as lists
+                return method(self, *args)
+            raise
+
+    return wrapper, cached
+
+
+def is_enabled(method: typing.Optional[str] = None) -> bool:
+    """Check whether memoization is enabled for a method, or for any method."""
+    if method is None:
+        return bool(_wrappers)
+    return method in _wrappers
+
+
+def enable(*methods: str, maxsize: typing.Optional[int] = 1024) -> None:
+    """Start memoizing methods of :py:class:`Vector2 <ppb_vector.Vector2>`.
+
+    :param methods: the names of the methods to memoize, among
+      :py:data:`METHODS`; all of them if none are given.
+
+    :param maxsize: the number of results cached for each method, beyond which
+      the least recently used ones are discarded; ``None`` for no limit.
+
+    Raises :py:exc:`ValueError` for methods that can't be memoized. Methods
+    that already are memoized keep their cache, and its size.
+    """
+    methods = methods or METHODS
+    for name in methods:
+        if name not in METHODS:
+            raise ValueError(f"Cannot memoize Vector2.{name}")
+
+    attributes = vars(Vector2)
+    for name in methods:
+        if name in _wrappers:
+            continue
+
+        attribute = attributes[name]
+        wrapped: typing.Any
+        if isinstance(attribute, property):
+            getter, _caches[name] = _memoize(attribute.fget, maxsize)  # type: ignore
+            wrapped = property(getter)
+        else:
+            wrapped, _caches[name] = _memoize(attribute, maxsize)
+        _install_wrapper(name, wrapped)
+        _wrappers[name] = wrapped
+
+
+def disable(*methods: str) -> None:
+    """Stop memoizing methods, all of them if none are given, and drop their caches."""
+    for name in methods or list(_wrappers):
+        if name in _wrappers:
+            _remove_wrapper(name, _wrappers.pop(name))
+            del _caches[name]
+
+
+def cache_info() -> typing.Dict[str, typing.Any]:
+    """Get the statistics of the caches, by method name.
+
+    They are given as by :py:func:`functools.lru_cache`, with the number of
+    hits and misses, the maximum size, and the current size of each cache.
+    """
+    return {name: cache.cache_info() for name, cache in _caches.items()}
+
+
+def cache_clear() -> None:
+    """Empty the caches, and reset their statistics, without disabling memoization."""
+    for cache in _caches.values():
+        cache.cache_clear()
+
+
+@contextmanager
+def memoized(*methods: str, maxsize: typing.Optional[int] = 1024) -> typing.Iterator[None]:
+    """Memoize methods for the duration of a block of code.
+
+    The methods which weren't memoized before the block stop being memoized
+    after it, and their caches are dropped.
+
+    :param methods: as in :py:func:`enable`.
+    :param maxsize: as in :py:func:`enable`.
+    """
+    previous = set(_wrappers)
+    enable(*methods, maxsize=maxsize)
+    try:
+        yield
+    finally:
+        disable(*(set(_wrappers) - previous))
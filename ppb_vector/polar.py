@@ -0,0 +1,281 @@
+from collections.abc import Sequence
+from math import atan2, cos, degrees, hypot, radians, sin
+
+from ppb_vector.vector2 import Vector2
+
+__all__ = ('PolarVector2',)
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing  # noqa: I300
+
+    from ppb_vector.vector2 import VectorLike
+
+    # PolarVector2 or subclass
+    Polar = typing.TypeVar('Polar', bound='PolarVector2')
+
+
+def _normalize_heading(heading: float) -> float:
+    """Bring an angle, in degrees, into (-180, 180]."""
+    heading = heading % 360
+    if heading > 180:
+        heading -= 360
+    return heading
+
+
+def _cos_sin(heading: float) -> 'typing.Tuple[float, float]':
+    """Compute the cosine and sine of an angle, in degrees.
+
+    The angle is first reduced to within 45° of a multiple of 90°, so that the
+    smaller of the two values keeps its full relative precision, even close to
+    the axes; exact multiples of 90° give exact zeroes.
+    """
+    quarter = round(heading / 90)
+    r = radians(heading - 90 * quarter)
+    c, s = cos(r), sin(r)
+    # Subtracting from 0.0, rather than negating, avoids producing -0.0
+    return ((c, s), (0.0 - s, c), (0.0 - c, 0.0 - s), (s, 0.0 - c))[quarter % 4]
+
+
+def _unpickle(cls: 'typing.Type[Polar]', length: float, heading: float,
+              x: float, y: float) -> 'Polar':
+    # Restore the Cartesian coordinates too, as recomputing them from the
+    #  length and heading may round differently, and they define equality.
+    self = cls.__new__(cls, length, heading)
+    object.__setattr__(self, '_x', x)
+    object.__setattr__(self, '_y', y)
+    return self
+
+
+class PolarVector2(Sequence):
+    """An immutable 2D vector, in polar coordinates.
+
+    :py:class:`PolarVector2` stores the length and heading of a vector, so that
+    computing them, and operations that only change one of them, do not
+    involve any trigonometry:
+
+    >>> from ppb_vector import PolarVector2, Vector2
+    >>> v = PolarVector2.from_vector(Vector2(0, 2))
+    >>> v
+    PolarVector2(2.0, 90.0)
+    >>> v.rotate(90).scale_to(3)
+    PolarVector2(3.0, 180.0)
+
+    The heading is the angle, in degrees, from the X axis to the vector; it is
+    normalized to (-180°, 180°], and positive angles are counter-clockwise, as
+    in :py:meth:`Vector2.rotate`.
+
+    Cartesian coordinates are only computed when needed, and then cached:
+
+    >>> PolarVector2(2, 90).x
+    0.0
+    >>> Vector2(PolarVector2(2, 90))
+    Vector2(0.0, 2.0)
+
+    As seen above, :py:class:`PolarVector2` is a vector-like, and can be used
+    anywhere a :py:class:`Vector2` is accepted. Operations that are not cheap
+    in polar coordinates, such as additions, return a :py:class:`Vector2`.
+    """
+    length: float
+    heading: float
+    _x: float
+    _y: float
+
+    __slots__ = ('length', 'heading', '_x', '_y', '__weakref__')
+
+    def __new__(cls, length: 'typing.SupportsFloat', heading: 'typing.SupportsFloat'):
+        """Make a polar vector from its length and heading, in degrees."""
+        length = float(length)
+        if length < 0:
+            raise ValueError("PolarVector2 takes non-negative lengths.")
+
+        self = super().__new__(cls)
+        # The class is frozen, so we need to bypass its assignment function
+        object.__setattr__(self, 'length', length)
+        object.__setattr__(self, 'heading', _normalize_heading(float(heading)))
+        return self
+
+    @classmethod
+    def from_vector(cls: 'typing.Type[Polar]', value: 'VectorLike') -> 'Polar':
+        """Convert a :py:class:`Vector2` or vector-like to polar coordinates.
+
+        >>> PolarVector2.from_vector((-1, 0))
+        PolarVector2(1.0, 180.0)
+        """
+        if isinstance(value, cls):
+            return value
+
+        x, y = Vector2._unpack(value)
+        self = cls(hypot(x, y), degrees(atan2(y, x)))
+        object.__setattr__(self, '_x', x)
+        object.__setattr__(self, '_y', y)
+        return self
+
+    def to_vector(self) -> Vector2:
+        """Convert to a :py:class:`Vector2`.
+
+        >>> PolarVector2(1, 180).to_vector()
+        Vector2(-1.0, 0.0)
+        """
+        return Vector2(self.x, self.y)
+
+    def _cartesian(self) -> 'typing.Tuple[float, float]':
+        try:
+            return self._x, self._y
+        except AttributeError:
+            # Not Vector2._trig: its length-preserving correction loses the
+            #  smaller coordinate when the heading is close to an axis.
+            r_cos, r_sin = _cos_sin(self.heading)
+            x, y = self.length * r_cos, self.length * r_sin
+            object.__setattr__(self, '_x', x)
+            object.__setattr__(self, '_y', y)
+            return x, y
+
+    @property
+    def x(self) -> float:
+        """The X coordinate of the vector."""
+        return self._cartesian()[0]
+
+    @property
+    def y(self) -> float:
+        """The Y coordinate of the vector."""
+        return self._cartesian()[1]
+
+    def __setattr__(self, name: str, value: 'typing.Any') -> None:
+        if type(self) is PolarVector2 or name in ('length', 'heading'):
+            from dataclasses import FrozenInstanceError
+            raise FrozenInstanceError(f"cannot assign to field {name!r}")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if type(self) is PolarVector2 or name in ('length', 'heading'):
+            from dataclasses import FrozenInstanceError
+            raise FrozenInstanceError(f"cannot delete field {name!r}")
+        super().__delattr__(name)
+
+    def __reduce__(self):
+        return _unpickle, (type(self), self.length, self.heading, *self._cartesian())
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.length}, {self.heading})"
+
+    def __len__(self) -> int:
+        return 2
+
+    def __iter__(self) -> 'typing.Iterator[float]':
+        return iter(self._cartesian())
+
+    def __getitem__(self, item: 'typing.Union[str, int]') -> float:  # type: ignore
+        return Vector2.__getitem__(self, item)  # type: ignore
+
+    def __eq__(self, other: 'typing.Any') -> bool:
+        """Test whether two vectors are equal.
+
+        Vectors, polar or not, are compared by their Cartesian coordinates, so
+        that equality is consistent with :py:meth:`__hash__`.
+        """
+        if isinstance(other, PolarVector2):
+            return self._cartesian() == other._cartesian()
+
+        try:
+            other_x, other_y = Vector2._unpack(other)
+        except (TypeError, ValueError):
+            return NotImplemented
+        else:
+            return self._cartesian() == (other_x, other_y)
+
+    def __hash__(self) -> int:
+        """Hash a vector like the :py:class:`Vector2` it is equal to."""
+        return hash(self._cartesian())
+
+    def __add__(self, other: 'VectorLike') -> Vector2:
+        return self.to_vector() + other
+
+    def __sub__(self, other: 'VectorLike') -> Vector2:
+        return self.to_vector() - other
+
+    def __neg__(self: 'Polar') -> 'Polar':
+        """Negate a vector, by turning it around."""
+        return type(self)(self.length, self.heading + 180)
+
+    def __mul__(self: 'Polar', other: 'typing.SupportsFloat') -> 'Polar':
+        if isinstance(other, (float, int)):
+            return self.scale_by(other)
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self: 'Polar', other: 'typing.SupportsFloat') -> 'Polar':
+        return self.scale_by(1 / float(other))
+
+    def dot(self, other: 'VectorLike') -> float:
+        """Dot product of two vectors."""
+        return self.to_vector().dot(other)
+
+    def angle(self, other: 'VectorLike') -> float:
+        """Compute the angle between two vectors, as in :py:meth:`Vector2.angle`.
+
+        >>> PolarVector2(1, 0).angle(PolarVector2(1, 90))
+        90.0
+        """
+        if not isinstance(other, PolarVector2):
+            x, y = Vector2._unpack(other)
+            return _normalize_heading(degrees(atan2(y, x)) - self.heading)
+
+        return _normalize_heading(other.heading - self.heading)
+
+    def isclose(self, other: 'VectorLike', **kwargs: 'typing.SupportsFloat') -> bool:
+        """Perform an approximate comparison of two vectors.
+
+        See :py:meth:`Vector2.isclose` for the optional, keyword arguments.
+        """
+        return self.to_vector().isclose(other, **kwargs)  # type: ignore
+
+    def rotate(self: 'Polar', angle: 'typing.SupportsFloat') -> 'Polar':
+        """Rotate a vector, counter-clockwise, by changing its heading.
+
+        >>> PolarVector2(1, 90).rotate(-45)
+        PolarVector2(1.0, 45.0)
+        """
+        return type(self)(self.length, self.heading + float(angle))
+
+    def scale_by(self: 'Polar', scalar: 'typing.SupportsFloat') -> 'Polar':
+        """Scalar multiplication.
+
+        >>> PolarVector2(1, 90).scale_by(-2)
+        PolarVector2(2.0, -90.0)
+        """
+        scalar = float(scalar)
+        if scalar < 0:
+            return type(self)(-scalar * self.length, self.heading + 180)
+        return type(self)(scalar * self.length, self.heading)
+
+    def scale_to(self: 'Polar', length: 'typing.SupportsFloat') -> 'Polar':
+        """Change the length of a vector, preserving its heading."""
+        length = float(length)
+        if length < 0:
+            raise ValueError("PolarVector2.scale_to takes non-negative lengths.")
+        return type(self)(length, self.heading)
+
+    scale = scale_to
+
+    def truncate(self: 'Polar', max_length: 'typing.SupportsFloat') -> 'Polar':
+        """Scale a vector down to a given length, if it is larger.
+
+        Unlike :py:meth:`Vector2.truncate`, the result is never larger than
+        ``max_length``.
+        """
+        max_length = float(max_length)
+        if self.length <= max_length:
+            return self
+        return self.scale_to(max_length)
+
+    def normalize(self: 'Polar') -> 'Polar':
+        """Return a vector with the same heading and unit length.
+
+        As with :py:meth:`Vector2.normalize`, the zero vector cannot be
+        normalized and raises :py:exc:`ZeroDivisionError`.
+        """
+        if self.length == 0:
+            raise ZeroDivisionError("Cannot normalize the zero vector.")
+        return type(self)(1, self.heading)
@@ -0,0 +1,191 @@
+"""Quantization of vectors to fixed-point integers, for compact serialization.
+
+A :py:class:`Quantizer` maps vectors within given bounds to pairs of integers,
+using as few bits as a given precision allows, and back:
+
+>>> from ppb_vector.quantize import Quantizer
+>>> quantizer = Quantizer((0, 0), (127, 63), precision=0.5)
+>>> quantizer.x_bits, quantizer.y_bits
+(7, 6)
+>>> quantizer.quantize((25.3, 10.6))
+(25, 11)
+>>> quantizer.dequantize((25, 11))
+Vector2(25.0, 11.0)
+
+Each coordinate comes back within ``precision`` of the original one, up to the
+rounding error of double precision on the bounds' coordinates (about ``1e-15``
+of their magnitude); vectors thus come back within ``precision * sqrt(2)``.
+
+Many vectors can also be bit-packed together into :py:class:`bytes`, taking
+:py:attr:`Quantizer.bits` bits per vector, with :py:meth:`Quantizer.encode`
+and :py:meth:`Quantizer.decode`.
+"""
+from math import ceil
+
+from ppb_vector.batch import _coordinates, Vector2Batch
+from ppb_vector.vector2 import _make_vector, Vector2
+
+__all__ = ('Quantizer',)
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing  # noqa: I300
+
+    from ppb_vector.vector2 import VectorLike
+
+#: Largest number of bits per coordinate, beyond which doubles cannot tell
+#  quantization steps apart
+_MAX_BITS = 53
+
+
+def _axis(low: float, high: float, precision: float) -> 'typing.Tuple[int, float]':
+    """Find the number of bits and the step of an axis."""
+    # Rounding to the nearest step is off by at most half a step.
+    steps = (high - low) / (2 * precision)
+    if not steps < 1 << _MAX_BITS:
+        raise ValueError(f"Precision {precision} is too fine for bounds [{low}, {high}]")
+    bits = ceil(steps).bit_length()
+    return bits, (high - low) / ((1 << bits) - 1) if bits else 0.0
+
+
+class Quantizer:
+    """A fixed-point encoding of the vectors between two corners.
+
+    Vectors between :py:attr:`low` and :py:attr:`high` are mapped to pairs of
+    integers, each with the smallest number of bits that keeps coordinates
+    within ``precision`` of the original vector; the whole range of those
+    integers is used, so the actual error is usually a bit smaller.
+
+    Raises :py:exc:`ValueError` if ``precision`` isn't positive, if any
+    coordinate of ``low`` is greater than that of ``high``, or if the
+    precision would need more than 53 bits per coordinate.
+    """
+
+    #: The corner of the bounds with the lowest coordinates
+    low: Vector2
+    #: The corner of the bounds with the highest coordinates
+    high: Vector2
+    #: The largest error on each coordinate
+    precision: float
+    #: The number of bits of X coordinates
+    x_bits: int
+    #: The number of bits of Y coordinates
+    y_bits: int
+
+    def __init__(self, low: 'VectorLike', high: 'VectorLike', precision: float) -> None:
+        self.low, self.high = Vector2(low), Vector2(high)
+        self.precision = float(precision)
+        if not 0 < self.precision < float('inf'):
+            raise ValueError(f"Quantizer() requires a positive precision, got {precision}")
+        if not (self.low.x <= self.high.x and self.low.y <= self.high.y):
+            raise ValueError(f"Bounds {self.low} and {self.high} are empty")
+
+        self.x_bits, self._x_step = _axis(self.low.x, self.high.x, self.precision)
+        self.y_bits, self._y_step = _axis(self.low.y, self.high.y, self.precision)
+
+    @property
+    def bits(self) -> int:
+        """The number of bits of a vector, as packed by :py:meth:`pack`."""
+        return self.x_bits + self.y_bits
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.low!r}, {self.high!r}, precision={self.precision!r})"
+
+    def _quantize(self, x: float, y: float) -> 'typing.Tuple[int, int]':
+        low, high = self.low, self.high
+        if not (low.x <= x <= high.x and low.y <= y <= high.y):
+            raise ValueError(f"Vector2({x}, {y}) is out of bounds [{low}, {high}]")
+        qx = round((x - low.x) / self._x_step) if self.x_bits else 0
+        qy = round((y - low.y) / self._y_step) if self.y_bits else 0
+        return qx, qy
+
+    def quantize(self, vector: 'VectorLike') -> 'typing.Tuple[int, int]':
+        """Map a vector to a pair of integers.
+
+        They are between 0 and ``2 ** x_bits - 1``, and ``2 ** y_bits - 1``.
+        Raises :py:exc:`ValueError` if the vector is out of bounds.
+        """
+        return self._quantize(*Vector2._unpack(vector))
+
+    def dequantize(self, codes: 'typing.Tuple[int, int]') -> Vector2:
+        """Map a pair of integers, as made by :py:meth:`quantize`, back to a vector."""
+        qx, qy = codes
+        return _make_vector(
+            Vector2, self.low.x + qx * self._x_step, self.low.y + qy * self._y_step,
+        )
+
+    def pack(self, vector: 'VectorLike') -> int:
+        """Map a vector to a single integer of :py:attr:`bits` bits.
+
+        >>> quantizer = Quantizer((0, 0), (127, 63), precision=0.5)
+        >>> quantizer.pack((25.3, 10.6))
+        1611
+        >>> quantizer.unpack(1611)
+        Vector2(25.0, 11.0)
+        """
+        qx, qy = self.quantize(vector)
+        return qx << self.y_bits | qy
+
+    def unpack(self, code: int) -> Vector2:
+        """Map an integer, as made by :py:meth:`pack`, back to a vector."""
+        return self.dequantize((code >> self.y_bits, code & ((1 << self.y_bits) - 1)))
+
+    def encode(self, vectors: 'typing.Iterable[VectorLike]') -> bytes:
+        """Pack vectors into bytes, with :py:attr:`bits` bits per vector.
+
+        Vectors are packed as by :py:meth:`pack`, the first one in the most
+        significant bits, and the last byte is padded with zeros:
+
+        >>> quantizer = Quantizer((0, 0), (127, 63), precision=0.5)
+        >>> data = quantizer.encode([(0, 0), (25.3, 10.6), (127, 63)])
+        >>> len(data)  # 3 vectors of 13 bits
+        5
+        >>> quantizer.decode(data, 3)
+        Vector2Batch([Vector2(0.0, 0.0), Vector2(25.0, 11.0), Vector2(127.0, 63.0)])
+        """
+        width, y_bits = self.bits, self.y_bits
+        if not width:
+            return b''
+
+        low_x, low_y, high_x, high_y = self.low.x, self.low.y, self.high.x, self.high.y
+        # A step of 1 maps the single coordinate of a zero-bit axis to 0.
+        x_step, y_step = self._x_step or 1.0, self._y_step or 1.0
+
+        # Bits are joined as text, which int() parses in linear time.
+        digit_format = f'0{width}b'
+        digits = []
+        for x, y in _coordinates(vectors):
+            if not (low_x <= x <= high_x and low_y <= y <= high_y):
+                raise ValueError(f"Vector2({x}, {y}) is out of bounds [{self.low}, {self.high}]")
+            code = round((x - low_x) / x_step) << y_bits | round((y - low_y) / y_step)
+            digits.append(format(code, digit_format))
+
+        size = -(-len(digits) * width // 8)
+        padding = size * 8 - len(digits) * width
+        return (int(''.join(digits) or '0', 2) << padding).to_bytes(size, 'big')
+
+    def decode(self, data: bytes, count: int) -> Vector2Batch:
+        """Unpack ``count`` vectors from bytes made by :py:meth:`encode`.
+
+        Raises :py:exc:`ValueError` if ``data`` doesn't have the size of
+        ``count`` packed vectors.
+        """
+        width, y_bits = self.bits, self.y_bits
+        size = -(-count * width // 8)
+        if len(data) != size:
+            raise ValueError(f"Expected {size} bytes for {count} vectors, got {len(data)}")
+
+        result = Vector2Batch()
+        if not width:
+            result.extend([self.low] * count)
+            return result
+
+        digits = format(int.from_bytes(data, 'big'), f'0{size * 8}b')
+        y_mask = (1 << y_bits) - 1
+        low_x, low_y, x_step, y_step = self.low.x, self.low.y, self._x_step, self._y_step
+        xs, ys = result.xs, result.ys
+        for start in range(0, count * width, width):
+            code = int(digits[start:start + width], 2)
+            xs.append(low_x + (code >> y_bits) * x_step)
+            ys.append(low_y + (code & y_mask) * y_step)
+        return result
@@ -0,0 +1,220 @@
+"""Single-pass reductions over many vectors.
+
+The functions in this module accept a :py:class:`Vector2Batch
+<ppb_vector.Vector2Batch>`, or any iterable of vector-likes, and compute their
+result without creating intermediate vectors. Vectors are returned as the
+:py:attr:`element_type <ppb_vector.Vector2Batch.element_type>` of a batch, or
+as :py:class:`Vector2 <ppb_vector.Vector2>` for other iterables:
+
+>>> from ppb_vector import Vector2
+>>> from ppb_vector.reductions import bounding_box, mean
+>>> points = [Vector2(0, 0), (2, 1), {'x': 1, 'y': 5}]
+>>> mean(points)
+Vector2(1.0, 2.0)
+>>> bounding_box(points)
+(Vector2(0.0, 0.0), Vector2(2.0, 5.0))
+
+Sums accumulate rounding errors over long streams of vectors; functions which
+add up coordinates take a ``compensated`` flag, trading some speed for a
+result that is correctly rounded (for batches, using :py:func:`math.fsum`)
+or nearly so (for other iterables, using Neumaier's summation).
+"""
+from array import array
+from itertools import starmap
+from math import fsum, hypot, inf
+from operator import mul
+
+from ppb_vector.batch import _coordinates, _element_type, _factory, Vector2Batch
+from ppb_vector.vector2 import Vector2
+
+__all__ = ('bounding_box', 'mean', 'min_max_length', 'vsum', 'weighted_mean')
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing  # noqa: I300
+
+    from ppb_vector.vector2 import VectorLike
+
+
+def _add(total: float, compensation: float, value: float) -> 'typing.Tuple[float, float]':
+    """Add value to total, accumulating the rounding error in compensation.
+
+    This is one step of Neumaier's variant of Kahan summation: the sum is
+    total + compensation, once all the values are added.
+    """
+    t = total + value
+    if abs(total) >= abs(value):
+        compensation += (total - t) + value
+    else:
+        compensation += (value - t) + total
+    return t, compensation
+
+
+def _sum(
+    coordinates: 'typing.Iterable[typing.Tuple[float, float]]', compensated: bool,
+) -> 'typing.Tuple[float, float, int]':
+    """Add up coordinates, returning both sums and the number of terms."""
+    count = 0
+    sum_x = sum_y = 0.0
+    if not compensated:
+        for x, y in coordinates:
+            sum_x += x
+            sum_y += y
+            count += 1
+        return sum_x, sum_y, count
+
+    c_x = c_y = 0.0
+    for x, y in coordinates:
+        sum_x, c_x = _add(sum_x, c_x, x)
+        sum_y, c_y = _add(sum_y, c_y, y)
+        count += 1
+
+    return sum_x + c_x, sum_y + c_y, count
+
+
+def vsum(vectors: 'typing.Iterable[VectorLike]', *, compensated: bool = False) -> Vector2:
+    """Add up vectors.
+
+    >>> vsum([(1, 2), (3, 4)])
+    Vector2(4.0, 6.0)
+
+    The sum of no vectors is the zero vector.
+    """
+    make = _factory(_element_type(vectors))
+    if isinstance(vectors, Vector2Batch):
+        add = fsum if compensated else sum
+        return make(float(add(vectors.xs)), float(add(vectors.ys)))
+
+    x, y, _ = _sum(_coordinates(vectors), compensated)
+    return make(x, y)
+
+
+def mean(vectors: 'typing.Iterable[VectorLike]', *, compensated: bool = False) -> Vector2:
+    """Compute the arithmetic mean, or centroid, of vectors.
+
+    >>> mean([(1, 2), (3, 4)])
+    Vector2(2.0, 3.0)
+
+    Raises :py:exc:`ValueError` if there are no vectors.
+    """
+    make = _factory(_element_type(vectors))
+    if isinstance(vectors, Vector2Batch):
+        add = fsum if compensated else sum
+        x, y, count = float(add(vectors.xs)), float(add(vectors.ys)), len(vectors)
+    else:
+        x, y, count = _sum(_coordinates(vectors), compensated)
+
+    if count == 0:
+        raise ValueError("mean() requires at least one vector")
+
+    return make(x / count, y / count)
+
+
+def weighted_mean(
+    vectors: 'typing.Iterable[VectorLike]', weights: 'typing.Iterable[float]', *,
+    compensated: bool = False,
+) -> Vector2:
+    """Compute the weighted mean of vectors.
+
+    >>> weighted_mean([(0, 0), (4, 8)], [3, 1])
+    Vector2(1.0, 2.0)
+
+    Raises :py:exc:`ValueError` if there isn't one weight per vector, or if the
+    weights add up to zero.
+    """
+    make = _factory(_element_type(vectors))
+    if isinstance(vectors, Vector2Batch):
+        weights = array('d', weights)
+        if len(weights) != len(vectors):
+            raise ValueError(f"Got {len(vectors)} vectors and {len(weights)} weights")
+
+        add = fsum if compensated else sum
+        x = float(add(map(mul, vectors.xs, weights)))
+        y = float(add(map(mul, vectors.ys, weights)))
+        total = float(add(weights))
+    else:
+        weights = iter(weights)
+        x = y = total = 0.0
+        c_x = c_y = c_total = 0.0
+        for v_x, v_y in _coordinates(vectors):
+            w = next(weights, None)
+            if w is None:
+                raise ValueError("Got more vectors than weights")
+
+            w = float(w)
+            if compensated:
+                x, c_x = _add(x, c_x, v_x * w)
+                y, c_y = _add(y, c_y, v_y * w)
+                total, c_total = _add(total, c_total, w)
+            else:
+                x += v_x * w
+                y += v_y * w
+                total += w
+
+        if next(weights, None) is not None:
+            raise ValueError("Got more weights than vectors")
+
+        x, y, total = x + c_x, y + c_y, total + c_total
+
+    if total == 0:
+        raise ValueError("weighted_mean() requires weights that don't add up to zero")
+
+    return make(x / total, y / total)
+
+
+def bounding_box(vectors: 'typing.Iterable[VectorLike]') -> 'typing.Tuple[Vector2, Vector2]':
+    """Compute the smallest axis-aligned box containing vectors.
+
+    The box is returned as its corners of lowest and highest coordinates:
+
+    >>> bounding_box([(1, 4), (3, 2)])
+    (Vector2(1.0, 2.0), Vector2(3.0, 4.0))
+
+    Raises :py:exc:`ValueError` if there are no vectors.
+    """
+    make = _factory(_element_type(vectors))
+    if isinstance(vectors, Vector2Batch):
+        if not vectors:
+            raise ValueError("bounding_box() requires at least one vector")
+        xs, ys = vectors.xs, vectors.ys
+        return make(min(xs), min(ys)), make(max(xs), max(ys))
+
+    min_x = min_y = inf
+    max_x = max_y = -inf
+    count = 0
+    for x, y in _coordinates(vectors):
+        if x < min_x:
+            min_x = x
+        if x > max_x:
+            max_x = x
+        if y < min_y:
+            min_y = y
+        if y > max_y:
+            max_y = y
+        count += 1
+
+    if count == 0:
+        raise ValueError("bounding_box() requires at least one vector")
+
+    return make(min_x, min_y), make(max_x, max_y)
+
+
+def min_max_length(vectors: 'typing.Iterable[VectorLike]') -> 'typing.Tuple[float, float]':
+    """Find the shortest and longest lengths of vectors.
+
+    >>> min_max_length([(3, 4), (0, 1), (-6, 8)])
+    (1.0, 10.0)
+
+    Raises :py:exc:`ValueError` if there are no vectors.
+    """
+    shortest, longest = inf, -inf
+    for length in starmap(hypot, _coordinates(vectors)):
+        if length < shortest:
+            shortest = length
+        if length > longest:
+            longest = length
+
+    if longest < 0:
+        raise ValueError("min_max_length() requires at least one vector")
+
+    return shortest, longest
@@ -0,0 +1,334 @@
+"""Line segments, and their intersections.
+
+A :py:class:`SegmentBatch` stores many segments as two :py:class:`Vector2Batch
+<ppb_vector.Vector2Batch>` of endpoints, and the functions in this module work
+on those packed coordinates:
+
+>>> from ppb_vector.segments import intersections, raycast, SegmentBatch
+>>> walls = SegmentBatch([((0, 0), (4, 4)), ((0, 4), (4, 0)), ((5, 0), (5, 4))])
+>>> intersections(walls)
+[(0, 1, Vector2(2.0, 2.0))]
+>>> raycast(walls, (0, 1), (1, 0))
+Hit(segment=0, point=Vector2(1.0, 1.0), distance=1.0)
+"""
+from collections.abc import MutableSequence
+from math import inf, sqrt
+from typing import NamedTuple
+
+from ppb_vector.batch import Vector2Batch
+from ppb_vector.geometry import _orientation
+from ppb_vector.vector2 import _make_vector, Vector2
+
+__all__ = ('Hit', 'SegmentBatch', 'intersections', 'raycast')
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing  # noqa: I300
+
+    from ppb_vector.vector2 import VectorLike
+
+    # SegmentBatch or subclass
+    Batch = typing.TypeVar('Batch', bound='SegmentBatch')
+
+
+class SegmentBatch(MutableSequence):
+    """A mutable sequence of line segments, stored as packed endpoints.
+
+    Each segment is a pair of vector-likes, its endpoints; they are stored in
+    two :py:class:`Vector2Batch <ppb_vector.Vector2Batch>`, :py:attr:`starts`
+    and :py:attr:`ends`, and converted back to pairs of :py:class:`Vector2
+    <ppb_vector.Vector2>` when accessed:
+
+    >>> segments = SegmentBatch([((0, 0), (1, 0))])
+    >>> segments.append(((1, 0), {'x': 1, 'y': 1}))
+    >>> segments[1]
+    (Vector2(1.0, 0.0), Vector2(1.0, 1.0))
+    >>> segments.ends
+    Vector2Batch([Vector2(1.0, 0.0), Vector2(1.0, 1.0)])
+    """
+    #: The first endpoint of each segment
+    starts: Vector2Batch
+    #: The second endpoint of each segment
+    ends: Vector2Batch
+
+    __slots__ = ('starts', 'ends')
+
+    def __init__(self, segments: 'typing.Iterable[typing.Tuple[VectorLike, VectorLike]]' = ()):
+        """Make a batch from an iterable of pairs of vector-likes."""
+        self.starts, self.ends = Vector2Batch(), Vector2Batch()
+        self.extend(segments)
+
+    @classmethod
+    def from_endpoints(cls: 'typing.Type[Batch]', starts: 'typing.Iterable[VectorLike]',
+                       ends: 'typing.Iterable[VectorLike]') -> 'Batch':
+        """Make a batch from iterables of first and second endpoints.
+
+        >>> SegmentBatch.from_endpoints([(0, 0)], [(1, 2)])
+        SegmentBatch([(Vector2(0.0, 0.0), Vector2(1.0, 2.0))])
+        """
+        self = cls()
+        self.starts.extend(starts)
+        self.ends.extend(ends)
+        if len(self.starts) != len(self.ends):
+            raise ValueError(f"Got {len(self.starts)} first and {len(self.ends)} second endpoints")
+        return self
+
+    @classmethod
+    def from_polyline(cls: 'typing.Type[Batch]', vertices: 'typing.Iterable[VectorLike]', *,
+                      closed: bool = False) -> 'Batch':
+        """Make a batch from the edges between consecutive vertices.
+
+        If ``closed`` is true, the last vertex is also connected to the first,
+        as for the edges of a polygon:
+
+        >>> len(SegmentBatch.from_polyline([(0, 0), (1, 0), (1, 1)], closed=True))
+        3
+        """
+        vertices = Vector2Batch(vertices)
+        if not vertices:
+            return cls()
+
+        ends = vertices[1:]
+        if closed:
+            ends.append(vertices[0])
+        else:
+            vertices.pop()
+        return cls.from_endpoints(vertices, ends)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return type(self).from_endpoints(self.starts[item], self.ends[item])
+        return self.starts[item], self.ends[item]
+
+    def __setitem__(self, item, value) -> None:
+        if isinstance(item, slice):
+            values = value if isinstance(value, SegmentBatch) else SegmentBatch(value)
+            self.starts[item], self.ends[item] = values.starts, values.ends
+        else:
+            self.starts[item], self.ends[item] = value
+
+    def __delitem__(self, item) -> None:
+        del self.starts[item]
+        del self.ends[item]
+
+    def insert(self, index: int, value: 'typing.Tuple[VectorLike, VectorLike]') -> None:
+        """Insert a segment before index."""
+        start, end = value
+        self.starts.insert(index, start)
+        self.ends.insert(index, end)
+
+    def append(self, value: 'typing.Tuple[VectorLike, VectorLike]') -> None:
+        """Append a segment to the end of the batch."""
+        start, end = value
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def extend(self, values: 'typing.Iterable[typing.Tuple[VectorLike, VectorLike]]') -> None:
+        """Append the segments from an iterable to the end of the batch."""
+        if isinstance(values, SegmentBatch):
+            self.starts.extend(values.starts)
+            self.ends.extend(values.ends)
+            return
+
+        for value in values:
+            self.append(value)
+
+    def __eq__(self, other: 'typing.Any') -> bool:
+        if not isinstance(other, SegmentBatch):
+            return NotImplemented
+        return self.starts == other.starts and self.ends == other.ends
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+def _intersect(
+    ax: float, ay: float, bx: float, by: float,
+    cx: float, cy: float, dx: float, dy: float,
+) -> 'typing.Optional[typing.Tuple[float, float]]':
+    """Find a point common to segments AB and CD, if there is one.
+
+    Whether the segments intersect is decided exactly; when they touch at an
+    endpoint, that endpoint is returned, and when they overlap along a line,
+    the end of the overlap closest to A is.
+    """
+    if max(ax, bx) < min(cx, dx) or max(cx, dx) < min(ax, bx):
+        return None
+    if max(ay, by) < min(cy, dy) or max(cy, dy) < min(ay, by):
+        return None
+
+    # Each segment must have the endpoints of the other on both of its sides
+    c_side = _orientation(ax, ay, bx, by, cx, cy)
+    d_side = _orientation(ax, ay, bx, by, dx, dy)
+    if c_side == d_side != 0:
+        return None
+    a_side = _orientation(cx, cy, dx, dy, ax, ay)
+    b_side = _orientation(cx, cy, dx, dy, bx, by)
+    if a_side == b_side != 0:
+        return None
+
+    if c_side == d_side == a_side == b_side == 0:
+        return _overlap(ax, ay, bx, by, cx, cy, dx, dy)
+
+    if a_side == 0:
+        return ax, ay
+    if b_side == 0:
+        return bx, by
+    if c_side == 0:
+        return cx, cy
+    if d_side == 0:
+        return dx, dy
+
+    # The segments cross, and aren't parallel
+    rx, ry = bx - ax, by - ay
+    sx, sy = dx - cx, dy - cy
+    denominator = rx * sy - ry * sx
+    if denominator == 0:
+        # Rounding errors made nearly-parallel segments look parallel
+        return cx, cy
+    t = ((cx - ax) * sy - (cy - ay) * sx) / denominator
+    t = min(max(t, 0.0), 1.0)
+    return ax + t * rx, ay + t * ry
+
+
+def _overlap(
+    ax: float, ay: float, bx: float, by: float,
+    cx: float, cy: float, dx: float, dy: float,
+) -> 'typing.Optional[typing.Tuple[float, float]]':
+    """Find the end closest to A of the overlap of collinear segments AB and CD."""
+    # Compare coordinates along the axis the line is closest to
+    if max(abs(bx - ax), abs(dx - cx)) >= max(abs(by - ay), abs(dy - cy)):
+        a, b, c, d = ax, bx, cx, dx
+    else:
+        a, b, c, d = ay, by, cy, dy
+
+    low = max(min(a, b), min(c, d))
+    high = min(max(a, b), max(c, d))
+    if low > high:
+        return None
+
+    # The end of the overlap closest to A is an endpoint of either segment
+    closest = low if a <= b else high
+    for x, y, coordinate in (ax, ay, a), (cx, cy, c), (dx, dy, d):
+        if coordinate == closest:
+            return x, y
+    return bx, by
+
+
+def intersections(segments: SegmentBatch) -> 'typing.List[typing.Tuple[int, int, Vector2]]':
+    """Find all pairs of intersecting segments.
+
+    Returns a list of ``(i, j, point)``, sorted by ``(i, j)``, for each pair of
+    segments ``i < j`` that have a common point. Segments that overlap along a
+    line are reported once, with the endpoint of their overlap closest to the
+    first point of segment ``i``.
+
+    >>> intersections(SegmentBatch([((0, 0), (2, 0)), ((1, 0), (3, 0)), ((1, -1), (1, 1))]))
+    [(0, 1, Vector2(1.0, 0.0)), (0, 2, Vector2(1.0, 0.0)), (1, 2, Vector2(1.0, 0.0))]
+
+    This uses a sort-and-sweep along the X axis: only segments whose X ranges
+    overlap are considered, and only those whose bounding boxes overlap are
+    tested against each other, so the running time is O(n log n + k), where k
+    is the number of pairs of segments with overlapping X ranges.
+    """
+    x1s, y1s = segments.starts.xs, segments.starts.ys
+    x2s, y2s = segments.ends.xs, segments.ends.ys
+    min_xs = list(map(min, x1s, x2s))
+    max_xs = list(map(max, x1s, x2s))
+    min_ys = list(map(min, y1s, y2s))
+    max_ys = list(map(max, y1s, y2s))
+
+    result = []
+    active: 'typing.List[int]' = []
+    for i in sorted(range(len(segments)), key=min_xs.__getitem__):
+        low_x, low_y, high_y = min_xs[i], min_ys[i], max_ys[i]
+        active = [j for j in active if max_xs[j] >= low_x]
+
+        for j in active:
+            if max_ys[j] < low_y or min_ys[j] > high_y:
+                continue
+
+            # Overlaps are reported from the segment listed first
+            first, second = (i, j) if i < j else (j, i)
+            point = _intersect(
+                x1s[first], y1s[first], x2s[first], y2s[first],
+                x1s[second], y1s[second], x2s[second], y2s[second],
+            )
+            if point is not None:
+                result.append((first, second, _make_vector(Vector2, *point)))
+
+        active.append(i)
+
+    result.sort(key=lambda hit: hit[:2])
+    return result
+
+
+class Hit(NamedTuple):
+    """The closest intersection of a ray with a segment."""
+
+    #: The index of the segment that was hit
+    segment: int
+    #: The point where the ray hits the segment
+    point: Vector2
+    #: The distance from the origin of the ray to the point
+    distance: float
+
+
+def raycast(
+    segments: SegmentBatch, origin: 'VectorLike', direction: 'VectorLike', *,
+    max_distance: float = inf,
+) -> 'typing.Optional[Hit]':
+    """Find the first segment hit by a ray.
+
+    The ray starts at ``origin`` and extends in ``direction``; it is tested
+    against all segments in a single pass, and the closest hit within
+    ``max_distance`` of the origin is returned, or :py:obj:`None` if no segment
+    is hit.
+
+    >>> raycast(SegmentBatch([((2, -1), (2, 1))]), (0, 0), (-1, 0)) is None
+    True
+
+    Raises :py:exc:`ValueError` if the direction is the zero vector.
+    """
+    ox, oy = Vector2._unpack(origin)
+    dx, dy = Vector2._unpack(direction)
+    length = sqrt(dx * dx + dy * dy)
+    if length == 0:
+        raise ValueError("raycast() requires a non-zero direction")
+
+    # Distances along the ray are computed in multiples of direction
+    best_index, best_t = -1, float(max_distance) / length
+    x1s, y1s = segments.starts.xs, segments.starts.ys
+    x2s, y2s = segments.ends.xs, segments.ends.ys
+    for i in range(len(segments)):
+        px, py = x1s[i] - ox, y1s[i] - oy
+        sx, sy = x2s[i] - x1s[i], y2s[i] - y1s[i]
+
+        denominator = dx * sy - dy * sx
+        if denominator != 0:
+            u = (px * dy - py * dx) / denominator
+            if not 0 <= u <= 1:
+                continue
+            t = (px * sy - py * sx) / denominator
+        elif px * dy - py * dx == 0:
+            # The segment lies along the ray: the closest endpoint, if any, is hit
+            t_start = (px * dx + py * dy) / (length * length)
+            t_end = ((x2s[i] - ox) * dx + (y2s[i] - oy) * dy) / (length * length)
+            if t_start < 0 and t_end < 0:
+                continue
+            t = max(0.0, min(t_start, t_end))
+        else:
+            continue
+
+        # On ties, the segment with the lowest index wins
+        if 0 <= t <= best_t and (t < best_t or best_index < 0):
+            best_index, best_t = i, t
+
+    if best_index < 0:
+        return None
+
+    point = _make_vector(Vector2, ox + best_t * dx, oy + best_t * dy)
+    return Hit(best_index, point, best_t * length)
@@ -1,55 +1,136 @@
-import dataclasses
-import functools
-import typing
+import sys
 from collections.abc import Mapping, Sequence
-from dataclasses import dataclass
 from math import atan2, copysign, cos, degrees, hypot, isclose, radians, sin, sqrt
 
 __all__ = ('Vector2',)
 
+# The typing module is slow to import, and ppb_vector only needs it for type
+#  checking: annotations are strings, and the type aliases below are provided
+#  lazily by __getattr__ at runtime.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import typing  # noqa: I300
+    from typing import overload
+
+    # Vector or subclass
+    Vector = typing.TypeVar('Vector', bound='Vector2')
+
+    # Anything convertable to a Vector, including lists, tuples, and dicts
+    VectorLike = typing.Union[
+        'Vector2',  # Or subclasses, unconnected to the Vector typevar above
+        typing.Tuple[typing.SupportsFloat, typing.SupportsFloat],
+        typing.Sequence[typing.SupportsFloat],  # TODO: Length 2
+        typing.Mapping[str, typing.SupportsFloat],  # TODO: Length 2, keys 'x', 'y'
+    ]
+else:
+    def overload(func):
+        return func
+
+
+def __getattr__(name):
+    # Only called for missing attributes.
+    if name not in ('Vector', 'VectorLike'):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import typing
+    globals().update(
+        Vector=typing.TypeVar('Vector', bound='Vector2'),
+        VectorLike=typing.Union[
+            'Vector2',
+            typing.Tuple[typing.SupportsFloat, typing.SupportsFloat],
+            typing.Sequence[typing.SupportsFloat],
+            typing.Mapping[str, typing.SupportsFloat],
+        ],
+    )
+    return globals()[name]
+
+
+if sys.version_info < (3, 7):
+    # Modules can't have __getattr__ before Python 3.7 (PEP 562)
+    __getattr__('Vector')
+
+
+class _DataclassAttribute:
+    """Provide an attribute that makes Vector2 a dataclass, on first access.
+
+    Vector2 used to be a frozen dataclass. It isn't decorated anymore, as
+    importing the dataclasses module dominated the import time of ppb_vector,
+    but functions such as :py:func:`dataclasses.fields` or
+    :py:func:`dataclasses.replace` still work: the first time they look for
+    ``__dataclass_fields__`` or ``__dataclass_params__``, those are copied
+    from an equivalent dataclass.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: 'typing.Any', owner: 'typing.Any') -> 'typing.Any':
+        from dataclasses import dataclass
+
+        @dataclass(eq=False, frozen=True, init=False, repr=False)
+        class Template:
+            x: float
+            y: float
+
+        for name in ('__dataclass_fields__', '__dataclass_params__'):
+            setattr(Vector2, name, getattr(Template, name))
+        return getattr(Template, self.name)
 
-# Vector or subclass
-Vector = typing.TypeVar('Vector', bound='Vector2')
 
-# Anything convertable to a Vector, including lists, tuples, and dicts
-VectorLike = typing.Union[
-    'Vector2',  # Or subclasses, unconnected to the Vector typevar above
-    typing.Tuple[typing.SupportsFloat, typing.SupportsFloat],
-    typing.Sequence[typing.SupportsFloat],  # TODO: Length 2
-    typing.Mapping[str, typing.SupportsFloat],  # TODO: Length 2, keys 'x', 'y'
-]
+def _make_vector(cls: 'typing.Type[Vector]', x: float, y: float) -> 'Vector':
+    """Make an instance of cls, skipping the conversions and checks of __new__.
 
+    x and y must already be floats.
+    """
+    self = object.__new__(cls)
+    object.__setattr__(self, 'x', x)
+    object.__setattr__(self, 'y', y)
+    return self
+
+
+# Result type of binary operations between instances of two types
+#  The table is filled lazily, and bounded like the lru_cache it replaces, so
+#  that it doesn't keep every subclass or operand type ever seen alive:
+#  beyond _RESULT_TYPES_MAXSIZE entries, the oldest ones are dropped.
+_RESULT_TYPES_MAXSIZE = 128
+_result_types: 'typing.Dict[typing.Tuple[type, type], type]' = {}
 
-@functools.lru_cache()
-def _find_lowest_type(left: typing.Type, right: typing.Type) -> typing.Type:
+
+def _find_lowest_type(left: 'typing.Type', right: 'typing.Type') -> 'typing.Type':
     """
     Guess which is the more specific type.
     """
-    # Basically, see what classes are unique in each type's MRO and return who
-    # has the most.
-    lmro = set(left.__mro__)
-    rmro = set(right.__mro__)
-    if len(lmro) > len(rmro):
-        return left
-    elif len(rmro) > len(lmro):
+    # Basically, see which class has the longest MRO: a subclass always does.
+    # Between unrelated classes of the same depth, pick the left one.
+    if len(right.__mro__) > len(left.__mro__):
         return right
     else:
-        # They're equal, just arbitrarily pick one
         return left
 
 
-def _find_lowest_vector(left: typing.Type, right: typing.Type) -> typing.Type:
+def _find_lowest_vector(left: 'typing.Type', right: 'typing.Type') -> 'typing.Type':
     if left is right:
         return left
-    elif not issubclass(left, Vector2):
-        return right
+
+    try:
+        return _result_types[left, right]
+    except KeyError:
+        pass
+
+    if not issubclass(left, Vector2):
+        rtype = right
     elif not issubclass(right, Vector2):
-        return left
+        rtype = left
     else:
-        return _find_lowest_type(left, right)
+        rtype = _find_lowest_type(left, right)
+
+    if len(_result_types) >= _RESULT_TYPES_MAXSIZE:
+        # Dicts keep insertion order, so this drops the oldest entry
+        del _result_types[next(iter(_result_types))]
+    _result_types[left, right] = rtype
+    return rtype
 
 
-@dataclass(eq=False, frozen=True, init=False, repr=False)
 class Vector2:
     """The immutable, 2D vector class of the PursuedPyBear project.
 
@@ -96,13 +177,16 @@ class Vector2:
     # Tell CPython that this isn't an extendable dict
     __slots__ = ('x', 'y', '__weakref__')
 
-    @typing.overload
-    def __new__(cls, x: typing.SupportsFloat, y: typing.SupportsFloat): pass
+    __dataclass_fields__ = _DataclassAttribute('__dataclass_fields__')
+    __dataclass_params__ = _DataclassAttribute('__dataclass_params__')
 
-    @typing.overload
-    def __new__(cls, other: VectorLike): pass
+    @overload
+    def __new__(cls, x: 'typing.SupportsFloat', y: 'typing.SupportsFloat'): pass
 
-    def __new__(cls, *args, **kwargs):
+    @overload
+    def __new__(cls, other: 'VectorLike'): pass  # noqa: F811
+
+    def __new__(cls, *args, **kwargs):  # noqa: F811
         """
         Make a vector from coordinates, or convert a vector-like.
 
@@ -141,10 +225,7 @@ class Vector2:
         self = super().__new__(cls)
 
         try:
-            # The @dataclass decorator made the class frozen, so we need to
-            #  bypass the class' default assignment function :
-            #
-            #  https://docs.python.org/3/library/dataclasses.html#frozen-instances
+            # The class is frozen, so we need to bypass its assignment function
             object.__setattr__(self, 'x', float(x))
         except ValueError:
             raise TypeError(f"{type(x).__name__} object not convertable to float")
@@ -159,11 +240,30 @@ class Vector2:
     def __reduce__(self):
         return type(self).__new__, (type(self), self.x, self.y)
 
-    #: Return a new :py:class:`Vector2` replacing specified fields with new values.
-    update = dataclasses.replace
+    # Vector2 isn't decorated with @dataclass anymore, see _DataclassAttribute,
+    #  but it still behaves like a frozen dataclass.
+    def __setattr__(self, name: str, value: 'typing.Any') -> None:
+        if type(self) is Vector2 or name in ('x', 'y'):
+            from dataclasses import FrozenInstanceError
+            raise FrozenInstanceError(f"cannot assign to field {name!r}")
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name: str) -> None:
+        if type(self) is Vector2 or name in ('x', 'y'):
+            from dataclasses import FrozenInstanceError
+            raise FrozenInstanceError(f"cannot delete field {name!r}")
+        super().__delattr__(name)
+
+    def update(self: 'Vector', **kwargs: 'typing.SupportsFloat') -> 'Vector':
+        """Return a new :py:class:`Vector2` replacing specified fields with new values.
+
+        >>> Vector2(1, 2).update(y=3)
+        Vector2(1.0, 3.0)
+        """
+        return type(self)(**{'x': self.x, 'y': self.y, **kwargs})
 
     @staticmethod
-    def _unpack(value: VectorLike) -> typing.Tuple[float, float]:
+    def _unpack(value: 'VectorLike') -> 'typing.Tuple[float, float]':
         if isinstance(value, Vector2):
             return value.x, value.y
         elif isinstance(value, Sequence) and len(value) == 2:
@@ -184,7 +284,7 @@ class Vector2:
         # benefit, according to microbenchmarks.
         return hypot(self.x, self.y)
 
-    def asdict(self) -> typing.Mapping[str, float]:
+    def asdict(self) -> 'typing.Mapping[str, float]':
         """Convert a vector to a vector-like dictionary.
 
         >>> v = Vector2(42, 69)
@@ -197,10 +297,10 @@ class Vector2:
         """
         return {'x': self.x, 'y': self.y}
 
-    def __len__(self: Vector) -> int:
+    def __len__(self: 'Vector') -> int:
         return 2
 
-    def __add__(self: Vector, other: VectorLike) -> Vector:
+    def __add__(self: 'Vector', other: 'VectorLike') -> 'Vector':
         """Add two vectors.
 
         :param other: A :py:class:`Vector2` or a vector-like.
@@ -208,15 +308,19 @@ class Vector2:
 
         >>> Vector2(1, 0) + (0, 1)
         Vector2(1.0, 1.0)
+
+        When adding instances of different subclasses of :py:class:`Vector2`,
+        the result is an instance of the most derived one; between unrelated
+        subclasses, it is the type of ``self``.
         """
-        rtype = _find_lowest_vector(type(other), type(self))
+        rtype = _find_lowest_vector(type(self), type(other))
         try:
             other_x, other_y = Vector2._unpack(other)
         except ValueError:
             return NotImplemented
         return rtype(self.x + other_x, self.y + other_y)
 
-    def __sub__(self: Vector, other: VectorLike) -> Vector:
+    def __sub__(self: 'Vector', other: 'VectorLike') -> 'Vector':
         """Subtract one vector from another.
 
         :param other: A :py:class:`Vector2` or a vector-like.
@@ -225,14 +329,14 @@ class Vector2:
         >>> Vector2(3, 3) - (1, 1)
         Vector2(2.0, 2.0)
         """
-        rtype = _find_lowest_vector(type(other), type(self))
+        rtype = _find_lowest_vector(type(self), type(other))
         try:
             other_x, other_y = Vector2._unpack(other)
         except ValueError:
             return NotImplemented
         return rtype(self.x - other_x, self.y - other_y)
 
-    def dot(self: Vector, other: VectorLike) -> float:
+    def dot(self: 'Vector', other: 'VectorLike') -> float:
         """Dot product of two vectors.
 
         :param other: A :py:class:`Vector2` or a vector-like.
@@ -241,7 +345,7 @@ class Vector2:
         other_x, other_y = Vector2._unpack(other)
         return self.x * other_x + self.y * other_y
 
-    def scale_by(self: Vector, scalar: typing.SupportsFloat) -> Vector:
+    def scale_by(self: 'Vector', scalar: 'typing.SupportsFloat') -> 'Vector':
         """Scalar multiplication.
 
         >>> Vector2(1, 2).scale_by(3)
@@ -255,13 +359,13 @@ class Vector2:
         scalar = float(scalar)
         return type(self)(scalar * self.x, scalar * self.y)
 
-    @typing.overload
-    def __mul__(self: Vector, other: VectorLike) -> float: pass
+    @overload
+    def __mul__(self: 'Vector', other: 'VectorLike') -> float: pass
 
-    @typing.overload
-    def __mul__(self: Vector, other: typing.SupportsFloat) -> Vector: pass
+    @overload
+    def __mul__(self: 'Vector', other: 'typing.SupportsFloat') -> 'Vector': pass  # noqa: F811
 
-    def __mul__(self, other):
+    def __mul__(self, other):  # noqa: F811
         """Performs a dot product or scalar product, based on the parameter type.
 
         :param other: If ``other`` is a scalar (an instance of
@@ -299,16 +403,16 @@ class Vector2:
         except (TypeError, ValueError):
             return NotImplemented
 
-    @typing.overload
-    def __rmul__(self: Vector, other: VectorLike) -> float: pass
+    @overload
+    def __rmul__(self: 'Vector', other: 'VectorLike') -> float: pass
 
-    @typing.overload
-    def __rmul__(self: Vector, other: typing.SupportsFloat) -> Vector: pass
+    @overload
+    def __rmul__(self: 'Vector', other: 'typing.SupportsFloat') -> 'Vector': pass  # noqa: F811
 
-    def __rmul__(self, other):
+    def __rmul__(self, other):  # noqa: F811
         return self.__mul__(other)
 
-    def __truediv__(self: Vector, other: typing.SupportsFloat) -> Vector:
+    def __truediv__(self: 'Vector', other: 'typing.SupportsFloat') -> 'Vector':
         """Perform a division between a vector and a scalar.
 
         >>> Vector2(3, 3) / 3
@@ -317,7 +421,7 @@ class Vector2:
         other = float(other)
         return type(self)(self.x / other, self.y / other)
 
-    def __getitem__(self: Vector, item: typing.Union[str, int]) -> float:
+    def __getitem__(self: 'Vector', item: 'typing.Union[str, int]') -> float:
         if hasattr(item, '__index__'):
             item = item.__index__()  # type: ignore
         if isinstance(item, str):
@@ -337,10 +441,10 @@ class Vector2:
         else:
             raise TypeError
 
-    def __repr__(self: Vector) -> str:
+    def __repr__(self: 'Vector') -> str:
         return f"{type(self).__name__}({self.x}, {self.y})"
 
-    def __eq__(self: Vector, other: typing.Any) -> bool:
+    def __eq__(self: 'Vector', other: 'typing.Any') -> bool:
         """Test wheter two vectors are equal.
 
         :param other: A :py:class:`Vector2` or a vector-like.
@@ -356,11 +460,26 @@ class Vector2:
         else:
             return self.x == other_x and self.y == other_y
 
-    def __iter__(self: Vector) -> typing.Iterator[float]:
+    def __hash__(self: 'Vector') -> int:
+        """Hash a vector, consistently with :py:meth:`__eq__`.
+
+        Vectors hash like the tuple of their coordinates, so they can be used
+        as dictionary keys and set members, interchangeably with the tuples
+        they are equal to:
+
+        >>> {Vector2(1, 2): 'a'}[(1, 2)]
+        'a'
+
+        To bucket vectors that are nearly equal, rather than exactly equal,
+        see :py:func:`ppb_vector.grid.grid_key`.
+        """
+        return hash((self.x, self.y))
+
+    def __iter__(self: 'Vector') -> 'typing.Iterator[float]':
         yield self.x
         yield self.y
 
-    def __neg__(self: Vector) -> Vector:
+    def __neg__(self: 'Vector') -> 'Vector':
         """Negate a vector.
 
         Negating a :py:class:`Vector2` produces one with identical length and opposite
@@ -371,7 +490,7 @@ class Vector2:
         """
         return self.scale_by(-1)
 
-    def angle(self: Vector, other: VectorLike) -> float:
+    def angle(self: 'Vector', other: 'VectorLike') -> float:
         """Compute the angle between two vectors, expressed in degrees.
 
         :param other: A :py:class:`Vector2` or a vector-like.
@@ -397,9 +516,9 @@ class Vector2:
 
         return rv
 
-    def isclose(self: Vector, other: VectorLike, *,
-                abs_tol: typing.SupportsFloat = 1e-09, rel_tol: typing.SupportsFloat = 1e-09,
-                rel_to: typing.Sequence[VectorLike] = ()) -> bool:
+    def isclose(self: 'Vector', other: 'VectorLike', *,
+                abs_tol: 'typing.SupportsFloat' = 1e-09, rel_tol: 'typing.SupportsFloat' = 1e-09,
+                rel_to: 'typing.Sequence[VectorLike]' = ()) -> bool:
         """Perform an approximate comparison of two vectors.
 
         :param other: A :py:class:`Vector2` or a vector-like.
@@ -437,7 +556,20 @@ class Vector2:
         return (diff <= rel_tol * rel_length or diff <= float(abs_tol))
 
     @staticmethod
-    def _trig(angle: typing.SupportsFloat) -> typing.Tuple[float, float]:
+    def _trig(angle: 'typing.SupportsFloat') -> 'typing.Tuple[float, float]':
+        # Look the angle up as a float, as the argument may not be hashable
+        angle = float(angle)
+        cached = _trig_table.get(angle)
+        if cached is not None:
+            return cached
+
+        if not _trig_table:
+            _fill_trig_table()
+
+        return Vector2._compute_trig(angle)
+
+    @staticmethod
+    def _compute_trig(angle: 'typing.SupportsFloat') -> 'typing.Tuple[float, float]':
         r = radians(angle)
         r_cos, r_sin = cos(r), sin(r)
 
@@ -454,7 +586,7 @@ class Vector2:
 
         return r_cos, r_sin
 
-    def rotate(self: Vector, angle: typing.SupportsFloat) -> Vector:
+    def rotate(self: 'Vector', angle: 'typing.SupportsFloat') -> 'Vector':
         """Rotate a vector.
 
         Rotate a vector in relation to the origin and return a new :py:class:`Vector2`.
@@ -470,7 +602,7 @@ class Vector2:
         y = self.x * r_sin + self.y * r_cos
         return type(self)(x, y)
 
-    def normalize(self: Vector) -> Vector:
+    def normalize(self: 'Vector') -> 'Vector':
         """Return a vector with the same direction and unit length.
 
         >>> Vector2(3, 4).normalize()
@@ -482,7 +614,7 @@ class Vector2:
         """
         return self.scale(1)
 
-    def truncate(self: Vector, max_length: typing.SupportsFloat) -> Vector:
+    def truncate(self: 'Vector', max_length: 'typing.SupportsFloat') -> 'Vector':
         """Scale a given :py:class:`Vector2` down to a given length, if it is larger.
 
         >>> Vector2(7, 24).truncate(3)
@@ -515,7 +647,7 @@ class Vector2:
 
         return self.scale_to(max_length)
 
-    def scale_to(self: Vector, length: typing.SupportsFloat) -> Vector:
+    def scale_to(self: 'Vector', length: 'typing.SupportsFloat') -> 'Vector':
         """Scale a given :py:class:`Vector2` to a certain length.
 
         >>> Vector2(7, 24).scale_to(2)
@@ -532,7 +664,7 @@ class Vector2:
 
     scale = scale_to
 
-    def reflect(self: Vector, surface_normal: VectorLike) -> Vector:
+    def reflect(self: 'Vector', surface_normal: 'VectorLike') -> 'Vector':
         """Reflect a vector against a surface.
 
         :param other: A :py:class:`Vector2` or a vector-like.
@@ -554,4 +686,55 @@ class Vector2:
         return self - (2 * (self * surface_normal) * surface_normal)
 
 
+# The opt-in modules, such as ppb_vector.instrument and ppb_vector.memoize,
+#  replace attributes of Vector2 with wrappers, possibly over each other's.
+#  Each wrapper function records the attribute it replaced, and whether it is
+#  still active, so that they can be removed in any order: an inactive
+#  wrapper calls straight through, and is skipped when the one above it is
+#  removed.
+
+def _wrapper_function(attribute: 'typing.Any') -> 'typing.Any':
+    """Get the function of a method, property or static method."""
+    if isinstance(attribute, property):
+        return attribute.fget
+    return getattr(attribute, '__func__', attribute)
+
+
+def _install_wrapper(name: str, attribute: 'typing.Any') -> None:
+    """Replace an attribute of Vector2 with a wrapper of it."""
+    wrapper = _wrapper_function(attribute)
+    wrapper._replaced = vars(Vector2)[name]
+    wrapper._active = True
+    setattr(Vector2, name, attribute)
+
+
+def _remove_wrapper(name: str, attribute: 'typing.Any') -> None:
+    """Deactivate a wrapper installed by _install_wrapper, and remove it if it's on top."""
+    _wrapper_function(attribute)._active = False
+    if vars(Vector2)[name] is not attribute:
+        # Another wrapper was installed over this one, which skips it when removed
+        return
+
+    replaced = attribute
+    while not getattr(_wrapper_function(replaced), '_active', True):
+        replaced = _wrapper_function(replaced)._replaced
+    setattr(Vector2, name, replaced)
+
+
+# Cache of Vector2._trig, for whole degrees and multiples of 1/64th of a turn
+#  between -360° and 360°, keyed by float: angles of other types, such as
+#  Decimal or Fraction, are converted before the lookup.
+# The table is filled on the first cache miss, rather than at import, as it
+#  takes a noticeable fraction of the import time.
+_trig_table: 'typing.Dict[typing.Any, typing.Tuple[float, float]]' = {}
+
+
+def _fill_trig_table() -> None:
+    angles = {*range(-360, 361), *(k * 360 / 64 for k in range(-64, 65))}
+    # Vector2._trig(-0.0) and Vector2._trig(0) differ in the sign of zero, and
+    #  cannot share an entry.
+    angles.remove(0)
+    _trig_table.update((angle, Vector2._compute_trig(angle)) for angle in angles)
+
+
 Sequence.register(Vector2)
@@ -1,7 +1,15 @@
 #!/usr/bin/env python3
+import random
+
 import perf  # type: ignore
 
-from ppb_vector import Vector2
+from ppb_vector import approx, Vector2, Vector2Batch
+from ppb_vector.grid import snap_to_grid, unique_within
+from ppb_vector.interpolate import bezier, lerp
+from ppb_vector.locality import argsort_by_locality, hilbert_keys, morton_keys
+from ppb_vector.masks import longer_than, transform
+from ppb_vector.quantize import Quantizer
+from ppb_vector.segments import intersections, raycast, SegmentBatch
 from utils import *
 
 r = perf.Runner()
@@ -17,3 +25,82 @@ for f in UNARY_OPS + UNARY_SCALAR_OPS:  # type: ignore
 
 for f in SCALAR_OPS:  # type: ignore
     r.bench_func(f.__name__, f, x, scalar)
+
+for f in [approx.length, approx.normalize]:  # type: ignore
+    r.bench_func(f"approx.{f.__name__}", f, x)
+
+for f in [approx.rotate, approx.scale_to]:  # type: ignore
+    r.bench_func(f"approx.{f.__name__}", f, x, scalar)
+
+# Rotations hitting and missing the table of precomputed cos/sin values
+for angle in [30, 5.625, 30.5]:
+    r.bench_func(f"rotate({angle})", Vector2.rotate, x, angle)
+    r.bench_func(f"_trig({angle})", Vector2._trig, angle)
+    r.bench_func(f"_compute_trig({angle})", Vector2._compute_trig, angle)
+
+
+class V1(Vector2):
+    pass
+
+
+class V11(V1):
+    pass
+
+
+class V2(Vector2):
+    pass
+
+
+# Result type resolution between (sub)classes
+for left, right in [(Vector2, Vector2), (V1, V1), (V1, V11), (V11, V1), (V1, V2), (Vector2, tuple)]:
+    r.bench_func(f"__add__({left.__name__}, {right.__name__})",
+                 left.__add__, left(x), right(y))  # type: ignore
+
+
+# Short walls, scattered over a level
+rng = random.Random(0)
+for n in [100, 1000, 10000]:
+    starts = [Vector2(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(n)]
+    walls = SegmentBatch((s, s + Vector2(10, 0).rotate(rng.uniform(0, 360))) for s in starts)
+    r.bench_func(f"intersections({n})", intersections, walls)
+    r.bench_func(f"raycast({n})", raycast, walls, Vector2(0, 500), Vector2(1, 0))
+
+
+# Sampling curves in one call, and with Vector2 operations
+ts = [i / 100 for i in range(101)]
+r.bench_func("lerp(101)", lerp, x, y, ts)
+r.bench_func("lerp(101) with Vector2", lambda: [x + (y - x) * t for t in ts])
+r.bench_func("bezier(101)", bezier, x, y, -x, -y, ts)
+
+# Snapshots of entity positions, in a 10 km world to the centimeter
+world = Quantizer((0, 0), (10000, 10000), precision=0.01)
+for n in [10000, 100000]:
+    positions = Vector2Batch((rng.uniform(0, 10000), rng.uniform(0, 10000)) for _ in range(n))
+    snapshot = world.encode(positions)
+    r.bench_func(f"Quantizer.encode({n})", world.encode, positions)
+    r.bench_func(f"Quantizer.decode({n})", world.decode, snapshot, n)
+
+# Space-filling curve keys, for sorting points by locality
+points = Vector2Batch((rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(10000))
+r.bench_func("morton_keys(10000)", morton_keys, points, (0, 0), (1000, 1000))
+r.bench_func("hilbert_keys(10000)", hilbert_keys, points, (0, 0), (1000, 1000))
+r.bench_func("argsort_by_locality(10000)", argsort_by_locality, points)
+
+# Collapsing duplicated points, such as the shared corners of tiles
+corners = [p + (rng.uniform(-1e-6, 1e-6), 0) for p in points for _ in range(2)]
+r.bench_func("unique_within(20000)", unique_within, corners, 1e-3)
+r.bench_func("snap_to_grid(20000)", snap_to_grid, corners, 1e-3)
+
+# Handing half of a batch over, by copying it or through a view
+r.bench_func("Vector2Batch[::2](10000)", points.__getitem__, slice(None, None, 2))
+r.bench_func("Vector2Batch.view(::2)(10000)", points.view, slice(None, None, 2))
+
+# Clamping the speed of the fastest tenth of the particles
+speeds = Vector2Batch(
+    Vector2(rng.uniform(0, 10), 0).rotate(rng.uniform(0, 360)) for _ in range(10000)
+)
+r.bench_func("longer_than(10000)", longer_than, speeds, 9)
+r.bench_func("truncate(10000) with Vector2", lambda: [v.truncate(9) for v in speeds])
+r.bench_func("transform(10000, truncate)", lambda: transform(
+    speeds[:], longer_than(speeds, 9), Vector2.truncate, 9,
+))
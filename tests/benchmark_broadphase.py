@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Measure the broad-phase on many moving boxes.
+
+Boxes are scattered over a square world, whose size grows with their number
+so that each box overlaps a few others, and some of them, all by default,
+jitter a little at each step.
+For each number of boxes, the time per step of a persistent
+:py:class:`SweepAndPrune` is compared to sorting from scratch with
+:py:func:`overlapping_pairs` and, for small numbers, to testing all pairs.
+Results are printed as JSON, in milliseconds.
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+from time import perf_counter
+
+from ppb_vector.broadphase import AABBBatch, overlapping_pairs, SweepAndPrune
+
+
+def scatter(count, rng):
+    side = 20 * count ** 0.5
+    centers = [(rng.uniform(0, side), rng.uniform(0, side)) for _ in range(count)]
+    half_extents = [(rng.uniform(1, 5), rng.uniform(1, 5)) for _ in range(count)]
+    return AABBBatch.from_centers(centers, half_extents)
+
+
+def jitter(boxes, rng, moving=1.0, speed=0.5):
+    for i in range(int(moving * len(boxes))):
+        dx, dy = rng.uniform(-speed, speed), rng.uniform(-speed, speed)
+        boxes.lows.xs[i] += dx
+        boxes.lows.ys[i] += dy
+        boxes.highs.xs[i] += dx
+        boxes.highs.ys[i] += dy
+
+
+def all_pairs(boxes):
+    min_xs, min_ys = boxes.lows.xs, boxes.lows.ys
+    max_xs, max_ys = boxes.highs.xs, boxes.highs.ys
+    count = len(boxes)
+    return {
+        (i, j)
+        for i in range(count)
+        for j in range(i + 1, count)
+        if min_xs[i] <= max_xs[j] and min_xs[j] <= max_xs[i]
+        if min_ys[i] <= max_ys[j] and min_ys[j] <= max_ys[i]
+    }
+
+
+def timed(f, *args):
+    start = perf_counter()
+    result = f(*args)
+    return (perf_counter() - start) * 1000, result
+
+
+def run(count, steps, brute_max, moving, seed):
+    rng = random.Random(seed)
+    boxes = scatter(count, rng)
+    broadphase = SweepAndPrune()
+    first, _ = timed(broadphase.update, boxes)
+
+    persistent, scratch, brute, changes = [], [], [], []
+    for _ in range(steps):
+        jitter(boxes, rng, moving)
+        elapsed, (added, removed) = timed(broadphase.update, boxes)
+        persistent.append(elapsed)
+        changes.append(len(added) + len(removed))
+
+        elapsed, pairs = timed(overlapping_pairs, boxes)
+        scratch.append(elapsed)
+        assert pairs == broadphase.pairs
+
+        if count <= brute_max:
+            elapsed, pairs = timed(all_pairs, boxes)
+            brute.append(elapsed)
+            assert pairs == broadphase.pairs
+
+    result = {
+        'boxes': count,
+        'moving': moving,
+        'pairs': len(broadphase.pairs),
+        'changes_per_step': statistics.median(changes),
+        'first_update': first,
+        'update': statistics.median(persistent),
+        'overlapping_pairs': statistics.median(scratch),
+    }
+    if brute:
+        result['all_pairs'] = statistics.median(brute)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--counts', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help="numbers of boxes")
+    parser.add_argument('--steps', type=int, default=10,
+                        help="number of steps to measure, for each number of boxes")
+    parser.add_argument('--brute-max', type=int, default=2000,
+                        help="largest number of boxes for which all pairs are tested")
+    parser.add_argument('--moving', type=float, default=1.0,
+                        help="fraction of the boxes which move at each step")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    results = {
+        'python': sys.version,
+        'results': [
+            run(count, args.steps, args.brute_max, args.moving, args.seed) for count in args.counts
+        ],
+    }
+    json.dump(results, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Measure the delta compression of successive snapshots of many vectors.
+
+Vectors are scattered over a square world; at each step, a fraction of them
+move a little, and the changes are encoded against the receiver's state, then
+decoded. For each number of vectors, the median time to encode and decode a
+step is reported in milliseconds, along with the throughput in vectors per
+second and the size of the stream, compared to 16 bytes per vector for
+sending the whole snapshot as doubles. Results are printed as JSON.
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+from time import perf_counter
+
+from ppb_vector import Vector2Batch
+from ppb_vector.delta import decode_delta, encode_delta
+
+
+def timed(f, *args):
+    start = perf_counter()
+    result = f(*args)
+    return (perf_counter() - start) * 1000, result
+
+
+def run(count, steps, moving, precision, seed):
+    rng = random.Random(seed)
+    side = 20 * count ** 0.5
+    current = Vector2Batch((rng.uniform(0, side), rng.uniform(0, side)) for _ in range(count))
+    received = current[:]
+
+    encoding, decoding, sizes = [], [], []
+    for _ in range(steps):
+        for i in rng.sample(range(count), int(count * moving)):
+            current.xs[i] += rng.uniform(-1, 1)
+            current.ys[i] += rng.uniform(-1, 1)
+
+        elapsed, data = timed(encode_delta, received, current, precision)
+        encoding.append(elapsed)
+        sizes.append(len(data))
+        elapsed, received = timed(decode_delta, received, data, precision)
+        decoding.append(elapsed)
+
+    encode, decode = statistics.median(encoding), statistics.median(decoding)
+    return {
+        'vectors': count,
+        'encode': encode,
+        'decode': decode,
+        'encode_vectors_per_second': count / encode * 1000,
+        'decode_vectors_per_second': count / decode * 1000,
+        'bytes': statistics.median(sizes),
+        'ratio': statistics.median(sizes) / (16 * count),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--counts', type=int, nargs='+', default=[10000, 100000],
+                        help="numbers of vectors")
+    parser.add_argument('--steps', type=int, default=10,
+                        help="number of steps to measure, for each number of vectors")
+    parser.add_argument('--moving', type=float, default=0.2,
+                        help="fraction of the vectors which move at each step")
+    parser.add_argument('--precision', type=float, default=0.01)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    results = {
+        'python': sys.version,
+        'results': [
+            run(count, args.steps, args.moving, args.precision, args.seed)
+            for count in args.counts
+        ],
+    }
+    json.dump(results, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Measure the time it takes to import ppb_vector.
+
+Each run imports the module in a fresh interpreter, with ``python -X
+importtime``, and the timings of all the modules it pulled in are collected.
+Results are printed as JSON, in microseconds; the cumulative time of the
+top-level module is the figure to watch.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+
+def import_times(module):
+    """Import ``module`` in a new interpreter and return the reported timings.
+
+    The result maps the names of all the modules imported in the process to
+    their ``(self, cumulative)`` import times.
+    """
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        stderr=subprocess.PIPE, universal_newlines=True, check=True,
+    )
+
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+
+        own, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(own), int(cumulative)
+
+    return times
+
+
+def run(module, runs):
+    samples = [import_times(module) for _ in range(runs)]
+    total = [times[module][1] for times in samples]
+
+    modules = {}
+    for name in samples[0]:
+        own = [times[name][0] for times in samples if name in times]
+        modules[name] = statistics.median(own)
+
+    return {
+        'python': sys.version,
+        'module': module,
+        'runs': runs,
+        'cumulative': {
+            'median': statistics.median(total),
+            'min': min(total),
+            'max': max(total),
+        },
+        'self': modules,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=50,
+                        help="number of interpreters to start")
+    parser.add_argument('--module', default='ppb_vector',
+                        help="module to import")
+    args = parser.parse_args()
+
+    json.dump(run(args.module, args.runs), sys.stdout, indent=2)
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Measure the throughput of the particle integrators.
+
+Each integrator steps a batch of particles under gravity, with damping and a
+speed limit, and is compared to the same step written with :py:class:`Vector2`
+operations on lists. Results are printed as JSON, in particles per second.
+"""
+import argparse
+import json
+import random
+import statistics
+import sys
+from time import perf_counter
+
+from ppb_vector import Vector2, Vector2Batch
+from ppb_vector.integrate import euler, semi_implicit_euler, verlet
+
+GRAVITY = Vector2(0, -9.8)
+DT = 1 / 60
+DAMPING = 0.5
+MAX_SPEED = 50.0
+
+
+def vector_step(positions, velocities):
+    """The semi-implicit Euler step, written with Vector2 operations."""
+    for i, (x, v) in enumerate(zip(positions, velocities)):
+        v = ((v + GRAVITY * DT) / (1 + DAMPING * DT)).truncate(MAX_SPEED)
+        velocities[i] = v
+        positions[i] = x + v * DT
+
+
+def particles(count, rng):
+    return [Vector2(rng.uniform(-100, 100), rng.uniform(-100, 100)) for _ in range(count)]
+
+
+def throughput(step, count, steps, *args):
+    times = []
+    for _ in range(steps):
+        start = perf_counter()
+        step(*args)
+        times.append(perf_counter() - start)
+    return count / statistics.median(times)
+
+
+def run(count, steps, seed):
+    rng = random.Random(seed)
+    xs, vs = particles(count, rng), particles(count, rng)
+
+    def batch_step(integrator):
+        def step(positions, velocities):
+            integrator(positions, velocities, GRAVITY, DT, damping=DAMPING, max_speed=MAX_SPEED)
+        return step
+
+    results = {'particles': count}
+    for integrator in [euler, semi_implicit_euler, verlet]:
+        results[integrator.__name__] = throughput(
+            batch_step(integrator), count, steps, Vector2Batch(xs), Vector2Batch(vs),
+        )
+    results['Vector2'] = throughput(vector_step, count, steps, list(xs), list(vs))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--counts', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help="numbers of particles")
+    parser.add_argument('--steps', type=int, default=20,
+                        help="number of steps to measure, for each number of particles")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    results = {
+        'python': sys.version,
+        'results': [run(count, args.steps, args.seed) for count in args.counts],
+    }
+    json.dump(results, sys.stdout, indent=2)
+    print()
+
+
+if __name__ == '__main__':
+    main()
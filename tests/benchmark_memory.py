@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Measure the allocations performed by Vector2 operations.
+
+For every operation listed in :py:mod:`utils`, report the number and size of
+the memory blocks a call leaves allocated (its result), and the peak of
+temporary memory allocated during the call. Also report the steady-state
+footprint of storing many vectors, as a list of :py:class:`Vector2` and as
+packed arrays of coordinates, in double and single precision.
+
+Results are printed as JSON. When given a baseline (a previous output), exit
+with a non-zero status if any operation allocates more than it used to.
+"""
+import argparse
+import json
+import sys
+import tracemalloc
+from array import array
+
+from ppb_vector import Vector2, Vector2Batch
+from utils import *
+
+CALLS = 1000
+
+
+def _reset_peak():
+    if hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+    else:
+        # Python < 3.9 only resets the peak when restarting the tracing
+        tracemalloc.stop()
+        tracemalloc.start()
+
+
+def measure_op(f, *args):
+    """Measure the allocations of a single operation, per call."""
+    f(*args)  # Warm up any cache, interned value, or free list.
+    results = [None] * CALLS
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for i in range(CALLS):
+            results[i] = f(*args)
+        after = tracemalloc.take_snapshot()
+
+        stats = after.compare_to(before, 'filename')
+        retained_blocks = sum(s.count_diff for s in stats)
+        retained_bytes = sum(s.size_diff for s in stats)
+
+        del results
+        _reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        f(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'blocks': retained_blocks / CALLS,
+        'bytes': retained_bytes / CALLS,
+        'peak_bytes': peak - current,
+    }
+
+
+def measure_footprint(make, count):
+    """Measure the memory held by the container built by ``make(count)``."""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        container = make(count)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del container
+    return {
+        'count': count,
+        'bytes': after - before,
+        'bytes_per_vector': (after - before) / count,
+    }
+
+
+def make_vector_list(count):
+    return [Vector2(i, -i) for i in range(count)]
+
+
+def make_tuple_list(count):
+    return [(float(i), float(-i)) for i in range(count)]
+
+
+def make_packed_arrays(count):
+    xs, ys = array('d'), array('d')
+    for i in range(count):
+        xs.append(i)
+        ys.append(-i)
+    return xs, ys
+
+
+def make_single_batch(count):
+    return Vector2Batch(((i, -i) for i in range(count)), typecode='f')
+
+
+def run(count):
+    x, y = Vector2(1, 1), Vector2(0, 1)
+    scalar = 123
+
+    ops = {}
+    for f in BINARY_OPS + BINARY_SCALAR_OPS + BOOL_OPS:  # type: ignore
+        ops[f.__name__] = measure_op(f, x, y)
+
+    for f in UNARY_OPS + UNARY_SCALAR_OPS:  # type: ignore
+        ops[f.__name__] = measure_op(f, x)
+
+    for f in SCALAR_OPS:  # type: ignore
+        ops[f.__name__] = measure_op(f, x, scalar)
+
+    footprint = {
+        'list[Vector2]': measure_footprint(make_vector_list, count),
+        'list[tuple]': measure_footprint(make_tuple_list, count),
+        'array[d] x2': measure_footprint(make_packed_arrays, count),
+        'Vector2Batch[f]': measure_footprint(make_single_batch, count),
+    }
+
+    return {
+        'python': sys.version,
+        'implementation': sys.implementation.name,
+        'operations': ops,
+        'footprint': footprint,
+    }
+
+
+def regressions(results, baseline, tolerance):
+    """List the operations that allocate more than in the baseline."""
+    for name, new in results['operations'].items():
+        old = baseline['operations'].get(name)
+        if old is None:
+            continue
+
+        for key in ('blocks', 'bytes', 'peak_bytes'):
+            if new[key] > old[key] * (1 + tolerance):
+                yield f"{name}: {key} went from {old[key]} to {new[key]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=1_000_000,
+                        help="number of vectors for the footprint measurements")
+    parser.add_argument('--baseline', type=argparse.FileType('r'),
+                        help="previous output to check for regressions against")
+    parser.add_argument('--tolerance', type=float, default=0.1,
+                        help="acceptable relative increase over the baseline")
+    args = parser.parse_args()
+
+    results = run(args.count)
+    json.dump(results, sys.stdout, indent=2, sort_keys=True)
+    print()
+
+    if args.baseline:
+        failures = list(regressions(results, json.load(args.baseline), args.tolerance))
+        for failure in failures:
+            print(failure, file=sys.stderr)
+        if failures:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
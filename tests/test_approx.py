@@ -0,0 +1,84 @@
+import math
+
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import assume, given, note
+
+from ppb_vector import approx, Vector2
+from utils import angles, isclose, lengths, vectors
+
+
+def bounded_vectors():
+    """Vectors within the range where the bounds documented in approx hold."""
+    return vectors(max_magnitude=1e149).filter(lambda v: v.length > 1e-149)
+
+
+class V(Vector2):
+    pass
+
+
+@given(v=bounded_vectors())
+def test_length(v: Vector2):
+    note(f"δ: {approx.length(v) - v.length}")
+    assert isclose(approx.length(v), v.length, rel_tol=5e-16, abs_tol=0)
+
+
+@given(v=bounded_vectors())
+def test_normalize(v: Vector2):
+    n = approx.normalize(v)
+    note(f"Normalized: {n}")
+    assert isclose(n.length, 1, rel_tol=1e-15, abs_tol=0)
+    assert abs(math.radians(v.angle(n))) < 1e-15
+
+
+def test_normalize_zero():
+    with pytest.raises(ZeroDivisionError):
+        approx.normalize(Vector2(0, 0))
+
+
+@given(v=bounded_vectors(), length=lengths(max_value=1e149))
+def test_scale_to(v: Vector2, length: float):
+    assume(length == 0 or length > 1e-149)
+    scaled = approx.scale_to(v, length)
+    note(f"Scaled: {scaled}")
+    assert isclose(scaled.length, length, rel_tol=1e-15, abs_tol=0)
+    if length > 0:
+        assert abs(math.radians(v.angle(scaled))) < 1e-15
+
+
+def test_scale_to_negative():
+    with pytest.raises(ValueError):
+        approx.scale_to(Vector2(1, 1), -1)
+
+
+@given(v=bounded_vectors(), angle=angles())
+def test_rotate(v: Vector2, angle: float):
+    rotated = approx.rotate(v, angle)
+    note(f"Rotated: {rotated}")
+    assert isclose(rotated.length, v.length, rel_tol=1e-15, abs_tol=0)
+
+    error = math.radians(v.angle(rotated) - angle) % (2 * math.pi)
+    note(f"Angular error: {error}")
+    assert min(error, 2 * math.pi - error) < 4e-15
+
+
+@given(angle=angles(), loops=st.integers(min_value=0, max_value=500))
+def test_rotate_stability(angle: float, loops: int):
+    """The length of a vector drifts by at most 1e-15 per rotation."""
+    v = Vector2(1, 0)
+    for _ in range(loops):
+        v = approx.rotate(v, angle)
+
+    note(f"Step-wise: {v}")
+    assert isclose(v.length, 1, rel_tol=1e-15 * max(loops, 1), abs_tol=0)
+
+
+@pytest.mark.parametrize("op, args", [
+    (approx.normalize, ()),
+    (approx.scale_to, (2,)),
+    (approx.rotate, (30,)),
+])
+def test_subclass(op, args):
+    result = op(V(1, 2), *args)
+    assert isinstance(result, V)
+    assert type(result.x) is type(result.y) is float
@@ -0,0 +1,286 @@
+import math
+import pickle
+
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector2, Vector2Batch, Vector2BatchView
+from ppb_vector.reductions import vsum
+from utils import angle_isclose, angles, vector_likes, vectors
+
+#: Relative rounding error of single precision
+U = 2 ** -24
+
+# Coordinates which single precision rounds with a relative error
+single_floats = st.floats(min_value=-1e10, max_value=1e10).filter(
+    lambda x: x == 0 or abs(x) > 1e-10,
+)
+single_vectors = st.builds(Vector2, single_floats, single_floats)
+typecodes = pytest.mark.parametrize("typecode", ['d', 'f'])
+
+
+def batches(max_size=None):
+    return st.lists(vectors(), max_size=max_size).map(Vector2Batch)
+
+
+def stored(v):
+    """Round a vector as storing it in single precision does."""
+    return Vector2Batch([v], typecode='f')[0]
+
+
+@given(vs=st.lists(vectors()))
+def test_roundtrip(vs):
+    batch = Vector2Batch(vs)
+    assert len(batch) == len(vs)
+    assert list(batch) == vs
+    assert [batch[i] for i in range(len(vs))] == vs
+
+
+@pytest.mark.parametrize("vector_like", vector_likes(), ids=lambda x: type(x).__name__)
+def test_vector_likes(vector_like):
+    batch = Vector2Batch([vector_like])
+    batch.append(vector_like)
+    batch.insert(0, vector_like)
+    assert list(batch) == [Vector2(vector_like)] * 3
+
+
+@given(vs=st.lists(vectors()))
+def test_from_arrays(vs):
+    batch = Vector2Batch.from_arrays((v.x for v in vs), (v.y for v in vs))
+    assert batch == Vector2Batch(vs)
+
+
+def test_from_arrays_mismatched():
+    with pytest.raises(ValueError):
+        Vector2Batch.from_arrays([1, 2], [3])
+
+
+@given(vs=st.lists(vectors()), data=st.data())
+def test_slicing(vs, data):
+    start = data.draw(st.integers(-len(vs) - 1, len(vs) + 1))
+    stop = data.draw(st.integers(-len(vs) - 1, len(vs) + 1))
+    step = data.draw(st.integers(1, 3) | st.integers(-3, -1))
+    assert list(Vector2Batch(vs)[start:stop:step]) == vs[start:stop:step]
+
+
+@given(vs=st.lists(vectors(), min_size=1), v=vectors(), data=st.data())
+def test_mutation(vs, v, data):
+    batch = Vector2Batch(vs)
+    i = data.draw(st.integers(-len(vs), len(vs) - 1))
+
+    batch[i] = vs[i] = v
+    assert list(batch) == vs
+
+    del batch[i], vs[i]
+    assert list(batch) == vs
+
+    batch[1:] = vs[1:] = [v, v]
+    assert list(batch) == vs
+
+
+@given(batch=batches())
+def test_pickle(batch):
+    assert pickle.loads(pickle.dumps(batch)) == batch
+
+
+class Position(Vector2):
+    pass
+
+
+class Checked(Vector2):
+    """A subclass whose constructor does more than Vector2's."""
+
+    def __new__(cls, *args, **kwargs):
+        self = super().__new__(cls, *args, **kwargs)
+        if self.x < 0:
+            raise ValueError("Checked vectors have non-negative X coordinates")
+        return self
+
+
+def test_element_type():
+    batch = Vector2Batch([(1, 2)])
+    assert batch.element_type is Vector2
+    assert type(batch[0]) is Vector2
+    assert type(batch[0].x) is float
+
+
+@typecodes
+@given(vs=st.lists(single_vectors, min_size=1))
+def test_element_subclass(typecode, vs):
+    batch = Vector2Batch(vs, typecode=typecode, element_type=Position)
+    copies = [
+        batch[:], batch[::-1], batch.astype('d'), batch.view().copy(),
+        Vector2Batch.from_arrays(batch.xs, batch.ys, typecode=typecode, element_type=Position),
+        pickle.loads(pickle.dumps(batch)),
+    ]
+    for b in [batch, batch.view(), batch.view([0])] + copies:
+        assert b.element_type is Position
+        assert type(b[0]) is Position
+        assert all(type(v) is Position for v in b)
+        assert type(b[0].x) is float
+
+
+def test_element_constructor():
+    """Element types with their own constructor are made by it."""
+    batch = Vector2Batch([(1, 2), (-1, 2)])
+    batch.element_type = Checked
+    assert type(batch[0]) is Checked
+    with pytest.raises(ValueError):
+        batch[1]
+
+    batch.element_type = Vector2
+    assert type(batch[1]) is Vector2
+
+
+@pytest.mark.parametrize("element_type", [tuple, int, Vector2(1, 2), 'Vector2'])
+def test_invalid_element_type(element_type):
+    with pytest.raises(TypeError):
+        Vector2Batch(element_type=element_type)
+    batch = Vector2Batch()
+    with pytest.raises(TypeError):
+        batch.element_type = element_type
+    assert batch.element_type is Vector2
+
+
+def test_element_type_repr():
+    batch = Vector2Batch([(1, 2)], typecode='f', element_type=Position)
+    assert repr(batch) == "Vector2Batch([Position(1.0, 2.0)], typecode='f', element_type=Position)"
+    assert repr(batch.view()) == (
+        "Vector2BatchView([Position(1.0, 2.0)], typecode='f', element_type=Position)"
+    )
+
+
+@typecodes
+@given(vs=st.lists(single_vectors), data=st.data())
+def test_typecode_preserved(typecode, vs, data):
+    batch = Vector2Batch(vs, typecode=typecode)
+    assert batch.typecode == typecode
+    assert batch[::2].typecode == typecode
+
+    other = Vector2Batch(vs, typecode=data.draw(st.sampled_from(['d', 'f'])))
+    batch.extend(other)
+    batch[:len(vs)] = other
+    assert batch.typecode == typecode
+    assert batch == Vector2Batch(list(other) * 2, typecode=typecode)
+
+
+@given(vs=st.lists(vectors(1e30)))
+def test_single_precision_roundtrip(vs):
+    batch = Vector2Batch(vs, typecode='f')
+    assert batch.xs.itemsize == 4
+    for v, w in zip(vs, batch):
+        assert type(w.x) is float and type(w.y) is float
+        assert w.isclose(v, rel_tol=U, abs_tol=2 ** -149)
+
+
+@given(batch=batches())
+def test_astype(batch):
+    single = batch.astype('f')
+    assert single.typecode == 'f'
+    assert single == Vector2Batch(batch, typecode='f')
+    assert single.astype('d').astype('f') == single
+
+    copy = batch.astype('d')
+    assert copy == batch and copy.xs is not batch.xs
+
+
+@pytest.mark.parametrize("typecode", ['i', 'b', 'double'])
+def test_unsupported_typecode(typecode):
+    with pytest.raises(ValueError):
+        Vector2Batch(typecode=typecode)
+    with pytest.raises(ValueError):
+        Vector2Batch([(1, 2)]).astype(typecode)
+
+
+@given(a=single_vectors, b=single_vectors, angle=angles())
+def test_single_precision_error_budget(a, b, angle):
+    """Operations on stored vectors are within the budget documented in Vector2Batch."""
+    sa, sb = stored(a), stored(b)
+    tiny = 1e-12 * (a.length + b.length)
+
+    assert abs(sa.length - a.length) <= U * a.length + tiny
+    assert (sa * 3).isclose(a * 3, rel_tol=U * 1.01, abs_tol=tiny)
+    assert sa.rotate(angle).isclose(a.rotate(angle), rel_tol=U * 1.01, abs_tol=tiny)
+    assert (sa + sb).isclose(a + b, abs_tol=U * (a.length + b.length) + tiny, rel_tol=0)
+    assert abs(sa.dot(sb) - a.dot(b)) <= 2 * U * a.length * b.length * 1.01 + tiny * tiny
+
+    if a.length > 1e-9 and b.length > 1e-9:
+        assert angle_isclose(sa.normalize().angle(a), 0, math.degrees(U) * 1.01)
+        assert angle_isclose(sa.angle(sb), a.angle(b), math.degrees(2 * U) * 1.01)
+
+
+slices = st.builds(slice, st.integers(-10, 10) | st.none(), st.integers(-10, 10) | st.none(),
+                   st.sampled_from([None, 1, 2, -1, -3]))
+
+
+@typecodes
+@given(vs=st.lists(single_vectors), item=slices)
+def test_view(typecode, vs, item):
+    batch = Vector2Batch(vs, typecode=typecode)
+    view = batch.view(item)
+    assert isinstance(view, Vector2BatchView) and view.shared
+    assert view.typecode == typecode
+    assert list(view) == list(batch)[item]
+    assert view == batch[item] and view.copy() == batch[item]
+    assert vsum(view) == vsum(batch[item])
+
+
+@given(vs=st.lists(vectors(), min_size=1), data=st.data())
+def test_index_view(vs, data):
+    indices = data.draw(st.lists(st.integers(-len(vs), len(vs) - 1)))
+    view = Vector2Batch(vs).view(indices)
+    assert list(view) == [vs[i] for i in indices]
+    assert [view[i] for i in range(len(indices))] == [vs[i] for i in indices]
+
+
+@given(vs=st.lists(vectors()), first=slices, second=slices, data=st.data())
+def test_view_of_view(vs, first, second, data):
+    batch = Vector2Batch(vs)
+    view = batch.view(first)
+    assert list(view[second]) == list(batch)[first][second]
+
+    if view:
+        indices = data.draw(st.lists(st.integers(0, len(view) - 1)))
+        assert list(view.view(indices)) == [view[i] for i in indices]
+        assert view.view(indices).xs.array is batch.xs
+
+
+@given(vs=st.lists(vectors(), min_size=1), v=vectors(), item=slices)
+def test_view_shares(vs, v, item):
+    """Changes to the batch show through its views."""
+    batch = Vector2Batch(vs)
+    view = batch.view(item)
+    batch[:] = [v] * len(vs)
+    assert list(view) == [v] * len(view)
+
+
+@given(vs=st.lists(vectors(), min_size=1), v=vectors(), data=st.data())
+def test_view_copy_on_write(vs, v, data):
+    batch = Vector2Batch(vs)
+    view = batch.view(data.draw(st.lists(st.integers(0, len(vs) - 1), min_size=1)))
+    expected = list(view)
+    i = data.draw(st.integers(-len(view), len(view) - 1))
+
+    view[i] = expected[i] = v
+    assert not view.shared
+    assert list(view) == expected
+    assert list(batch) == vs
+
+    view[:1] = expected[:1] = [-v]
+    assert list(view) == expected
+
+
+def test_view_fixed_length():
+    view = Vector2Batch([(0, 0)] * 4).view(slice(1, 3))
+    with pytest.raises(ValueError):
+        view[:] = [(1, 1)]
+    with pytest.raises(ValueError):
+        view[:] = [(1, 1)] * 3
+    assert len(view) == 2
+
+
+@pytest.mark.parametrize("indices", [[2], [-3], [0, 5]])
+def test_view_index_error(indices):
+    with pytest.raises(IndexError):
+        Vector2Batch([(0, 0), (1, 1)]).view(indices)
@@ -0,0 +1,107 @@
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector2
+from ppb_vector.broadphase import AABBBatch, overlapping_pairs, SweepAndPrune
+from utils import vectors
+
+
+def boxes():
+    """Boxes on a coarse grid, so that touching boxes are frequent."""
+    coordinates = st.integers(-10, 10).map(float)
+    sizes = st.integers(0, 5).map(float)
+    return st.builds(
+        lambda x, y, w, h: (Vector2(x, y), Vector2(x + w, y + h)),
+        coordinates, coordinates, sizes, sizes,
+    )
+
+
+def overlap(box, other):
+    (low, high), (other_low, other_high) = box, other
+    return low.x <= other_high.x and other_low.x <= high.x and \
+        low.y <= other_high.y and other_low.y <= high.y
+
+
+def brute_force(boxes):
+    return {
+        (i, j)
+        for i, box in enumerate(boxes)
+        for j, other in enumerate(boxes)
+        if i < j and overlap(box, other)
+    }
+
+
+@given(boxes=st.lists(st.tuples(vectors(), vectors())))
+def test_batch_roundtrip(boxes):
+    batch = AABBBatch(boxes)
+    assert list(batch) == boxes
+    assert batch == AABBBatch.from_corners((low for low, _ in boxes), (high for _, high in boxes))
+    assert list(batch[1:]) == boxes[1:]
+
+
+@given(centers=st.lists(vectors(max_magnitude=1e10)), data=st.data())
+def test_from_centers(centers, data):
+    half_extents = data.draw(st.lists(vectors(max_magnitude=1e10),
+                                      min_size=len(centers), max_size=len(centers)))
+    batch = AABBBatch.from_centers(centers, half_extents)
+    assert list(batch) == [(c - h, c + h) for c, h in zip(centers, half_extents)]
+
+
+def test_mismatched():
+    with pytest.raises(ValueError):
+        AABBBatch.from_corners([(0, 0)], [])
+    with pytest.raises(ValueError):
+        AABBBatch.from_centers([(0, 0)], [(1, 1), (2, 2)])
+
+
+@given(box=st.tuples(vectors(), vectors()), offset=vectors())
+def test_move(box, offset):
+    batch = AABBBatch([box])
+    batch.move(0, offset)
+    low, high = box
+    assert batch[0] == (low + offset, high + offset)
+
+
+@given(boxes=st.lists(boxes()))
+def test_overlapping_pairs(boxes):
+    assert overlapping_pairs(AABBBatch(boxes)) == brute_force(boxes)
+
+
+@given(steps=st.lists(st.lists(boxes()), min_size=1, max_size=5))
+def test_sweep_and_prune(steps):
+    broadphase = SweepAndPrune()
+    previous = set()
+    for boxes in steps:
+        expected = brute_force(boxes)
+        added, removed = broadphase.update(AABBBatch(boxes))
+        assert broadphase.pairs == expected
+        assert added == expected - previous
+        assert removed == previous - expected
+        previous = expected
+
+
+@given(boxes=st.lists(boxes(), min_size=1), offsets=st.lists(st.lists(vectors(2), min_size=1)))
+def test_sweep_and_prune_moving(boxes, offsets):
+    batch = AABBBatch(boxes)
+    broadphase = SweepAndPrune()
+    broadphase.update(batch)
+    previous = brute_force(batch)
+    for step in offsets:
+        for i, offset in enumerate(step):
+            batch.move(i % len(batch), offset)
+        added, removed = broadphase.update(batch)
+        expected = brute_force(batch)
+        assert broadphase.pairs == expected
+        assert added == expected - previous
+        assert removed == previous - expected
+        previous = expected
+
+
+def test_sweep_and_prune_reset():
+    batch = AABBBatch([((0, 0), (1, 1)), ((0, 0), (1, 1))])
+    broadphase = SweepAndPrune()
+    assert broadphase.update(batch) == ({(0, 1)}, set())
+    broadphase.reset()
+    assert broadphase.pairs == set()
+    assert broadphase.update(batch) == ({(0, 1)}, set())
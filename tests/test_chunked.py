@@ -0,0 +1,165 @@
+import os
+import tempfile
+
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector2, Vector2Batch
+from ppb_vector.chunked import ChunkedVectors
+from utils import vectors
+
+chunk_sizes = st.integers(min_value=1, max_value=8)
+max_chunks = st.integers(min_value=1, max_value=4)
+
+
+def new_path():
+    return os.path.join(tempfile.mkdtemp(), 'vectors')
+
+
+@given(vs=st.lists(vectors()), chunk_size=chunk_sizes, max_chunks=max_chunks)
+def test_roundtrip(vs, chunk_size, max_chunks):
+    path = new_path()
+    with ChunkedVectors.create(path, vs, chunk_size=chunk_size, max_chunks=max_chunks) as store:
+        assert list(store) == vs
+        assert len(store.loaded) <= max_chunks
+
+    assert os.path.getsize(path) == 16 * len(vs)
+    with ChunkedVectors(path, chunk_size=chunk_size, max_chunks=max_chunks) as store:
+        assert len(store) == len(vs)
+        assert list(store) == vs
+        assert store[:] == Vector2Batch(vs)
+
+
+@given(vs=st.lists(vectors(), min_size=1), chunk_size=chunk_sizes, max_chunks=max_chunks,
+       updates=st.lists(st.tuples(st.integers(), vectors())))
+def test_updates(vs, chunk_size, max_chunks, updates):
+    """Updates survive evictions, and reopening the file."""
+    path = new_path()
+    expected = list(vs)
+    with ChunkedVectors.create(path, vs, chunk_size=chunk_size, max_chunks=max_chunks) as store:
+        for index, v in updates:
+            index %= len(vs)
+            store[index] = v
+            expected[index] = v
+            assert store[index] == v
+            assert len(store.loaded) <= max_chunks
+        assert list(store) == expected
+
+    with ChunkedVectors(path, chunk_size=chunk_size) as store:
+        assert list(store) == expected
+
+
+@given(vs=st.lists(vectors()), more=st.lists(vectors()), chunk_size=chunk_sizes)
+def test_extend(vs, more, chunk_size):
+    path = new_path()
+    ChunkedVectors.create(path, vs, chunk_size=chunk_size).close()
+    with ChunkedVectors(path, chunk_size=chunk_size, max_chunks=1) as store:
+        store.extend(more)
+        assert list(store) == vs + more
+    with ChunkedVectors(path, chunk_size=chunk_size) as store:
+        assert list(store) == vs + more
+
+
+@given(vs=st.lists(vectors()), chunk_size=chunk_sizes, max_chunks=max_chunks,
+       start=st.integers(-20, 20), stop=st.integers(-20, 20), step=st.sampled_from([1, 2, -1, -3]))
+def test_slices(vs, chunk_size, max_chunks, start, stop, step):
+    item = slice(start, stop, step)
+    with ChunkedVectors.create(new_path(), vs, chunk_size=chunk_size,
+                               max_chunks=max_chunks) as store:
+        assert list(store[item]) == vs[item]
+
+        replacement = [v * 2 for v in vs[item]]
+        store[item] = replacement
+        vs[item] = replacement
+        assert list(store) == vs
+
+
+def test_slice_length():
+    with ChunkedVectors.create(new_path(), [(0, 0)] * 4) as store:
+        with pytest.raises(ValueError):
+            store[1:3] = [(1, 1)]
+
+
+@given(vs=st.lists(vectors()), chunk_size=chunk_sizes)
+def test_chunks(vs, chunk_size):
+    with ChunkedVectors.create(new_path(), vs, chunk_size=chunk_size, max_chunks=1) as store:
+        chunks = list(store.chunks())
+        assert [start for start, _ in chunks] == list(range(0, len(vs), chunk_size))
+        for start, chunk in chunks:
+            assert list(chunk) == vs[start:start + chunk_size]
+
+
+@given(vs=st.lists(vectors(1e6)), chunk_size=chunk_sizes, max_chunks=max_chunks)
+def test_apply(vs, chunk_size, max_chunks):
+    def double(chunk):
+        for i, v in enumerate(chunk):
+            chunk[i] = v * 2
+
+    path = new_path()
+    with ChunkedVectors.create(path, vs, chunk_size=chunk_size, max_chunks=max_chunks) as store:
+        store.apply(double)
+    with ChunkedVectors(path, chunk_size=chunk_size) as store:
+        assert list(store) == [v * 2 for v in vs]
+
+
+def test_apply_length():
+    path = new_path()
+    with ChunkedVectors.create(path, [(1, 1)] * 5, chunk_size=2) as store:
+        with pytest.raises(ValueError):
+            store.apply(lambda chunk: chunk.append((0, 0)))
+        assert len(store) == 5
+    with ChunkedVectors(path, chunk_size=2) as store:
+        assert list(store) == [Vector2(1, 1)] * 5
+
+
+def test_single_precision():
+    path = new_path()
+    with ChunkedVectors.create(path, [(0.1, 0.5)] * 3, chunk_size=2, typecode='f') as store:
+        assert store[0] == Vector2(0.10000000149011612, 0.5)
+        assert store[1:].typecode == 'f'
+    assert os.path.getsize(path) == 3 * 8
+
+
+class Position(Vector2):
+    pass
+
+
+def test_element_type():
+    path = new_path()
+    with ChunkedVectors.create(path, [(0, 0), (1, 1)] * 3, chunk_size=4,
+                               element_type=Position) as store:
+        assert type(store[5]) is Position
+        assert store[1:].element_type is Position
+        assert all(type(v) is Position for v in store)
+    with ChunkedVectors(path, chunk_size=4) as store:
+        assert type(store[5]) is Vector2
+
+
+def test_index_error():
+    with ChunkedVectors.create(new_path(), [(0, 0), (1, 1)]) as store:
+        assert store[-1] == Vector2(1, 1)
+        for index in (2, -3):
+            with pytest.raises(IndexError):
+                store[index]
+            with pytest.raises(IndexError):
+                store[index] = (0, 0)
+
+
+@pytest.mark.parametrize("kwargs, error", [
+    ({'chunk_size': 0}, ValueError), ({'max_chunks': 0}, ValueError),
+    ({'typecode': 'i'}, ValueError), ({'element_type': tuple}, TypeError),
+], ids=["chunk_size", "max_chunks", "typecode", "element_type"])
+def test_invalid_arguments(kwargs, error):
+    with pytest.raises(error):
+        ChunkedVectors.create(new_path(), **kwargs)
+
+
+def test_invalid_file():
+    path = new_path()
+    with open(path, 'wb') as f:
+        f.write(b'\0' * 24)
+    with pytest.raises(ValueError):
+        ChunkedVectors(path)
+    with ChunkedVectors(path, typecode='f') as store:
+        assert len(store) == 3
@@ -0,0 +1,106 @@
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector2, Vector2Batch
+from ppb_vector.delta import decode_delta, encode_delta
+from utils import vectors
+
+precisions = st.floats(min_value=1e-3, max_value=10)
+
+
+@st.composite
+def snapshots(draw):
+    """Two snapshots of the same vectors, most of which moved a little, if at all."""
+    previous = draw(st.lists(vectors(1e4), max_size=50))
+    moves = st.one_of(st.just(Vector2(0, 0)), vectors(1), vectors(1e2), vectors(1e-12))
+    current = [v + draw(moves) for v in previous]
+    return previous, current
+
+
+def close(decoded, current, previous, precision):
+    """Check the error on a decoded vector."""
+    error = decoded - current
+    if decoded == previous:
+        return current.isclose(previous) or max(abs(error.x), abs(error.y)) <= precision
+    rounding = 1e-12 * max(current.length, previous.length)
+    return abs(error.x) <= precision + rounding and abs(error.y) <= precision + rounding
+
+
+@given(snapshot=snapshots(), precision=precisions)
+def test_roundtrip(snapshot, precision):
+    previous, current = snapshot
+    data = encode_delta(Vector2Batch(previous), Vector2Batch(current), precision)
+    decoded = decode_delta(Vector2Batch(previous), data, precision)
+    assert len(decoded) == len(current)
+    for d, c, p in zip(decoded, current, previous):
+        assert close(d, c, p, precision)
+
+
+@given(vs=st.lists(vectors()), precision=precisions)
+def test_unchanged(vs, precision):
+    batch = Vector2Batch(vs)
+    data = encode_delta(batch, Vector2Batch(vs), precision)
+    assert data == b'\0'
+    assert decode_delta(batch, data, precision) == batch
+
+
+@given(ticks=st.lists(st.lists(vectors(1), min_size=10, max_size=10), max_size=20),
+       precision=precisions)
+def test_no_drift(ticks, precision):
+    """Errors don't accumulate, when encoding against the receiver's state."""
+    exact = [Vector2(0, 0)] * 10
+    received = Vector2Batch(exact)
+    for moves in ticks:
+        exact = [v + move for v, move in zip(exact, moves)]
+        data = encode_delta(received, Vector2Batch(exact), precision)
+        received = decode_delta(received, data, precision)
+        for r, e in zip(received, exact):
+            assert abs(r.x - e.x) <= precision * (1 + 1e-9)
+            assert abs(r.y - e.y) <= precision * (1 + 1e-9)
+
+
+def test_tolerance():
+    previous = Vector2Batch([(1, 1), (1, 1)])
+    current = Vector2Batch([(1.5, 1), (1.05, 1)])
+    data = encode_delta(previous, current, 0.001, abs_tol=0.1)
+    assert list(decode_delta(previous, data, 0.001)) == [Vector2(1.5, 1), Vector2(1, 1)]
+
+    data = encode_delta(previous, current, 0.001)
+    assert decode_delta(previous, data, 0.001)[1].isclose((1.05, 1))
+
+
+def test_compact():
+    """Small moves take 3 bytes."""
+    previous = Vector2Batch([(i, -i) for i in range(1000)])
+    current = Vector2Batch(v + (0.1, -0.2) if i % 2 else v for i, v in enumerate(previous))
+    data = encode_delta(previous, current, 0.01)
+    assert len(data) == 2 + 3 * 500
+
+
+def test_typecode():
+    previous = Vector2Batch([(0, 0)], typecode='f')
+    data = encode_delta(previous, Vector2Batch([(1, 1)]), 0.25)
+    assert decode_delta(previous, data, 0.25) == Vector2Batch([(1, 1)], typecode='f')
+
+
+def test_mismatched():
+    with pytest.raises(ValueError):
+        encode_delta(Vector2Batch([(0, 0)]), Vector2Batch(), 0.1)
+
+
+@pytest.mark.parametrize("precision", [0, -1, float('nan'), float('inf')])
+def test_precision(precision):
+    batch = Vector2Batch([(0, 0)])
+    with pytest.raises(ValueError):
+        encode_delta(batch, batch, precision)
+    with pytest.raises(ValueError):
+        decode_delta(batch, b'\0', precision)
+
+
+@pytest.mark.parametrize("data", [
+    b'', b'\x01', b'\x01\x00\x02', b'\x01\x00\x02\x80', b'\x00\x00', b'\x01\x05\x02\x02',
+], ids=["empty", "no change", "truncated", "truncated integer", "extra", "out of range"])
+def test_invalid(data):
+    with pytest.raises(ValueError):
+        decode_delta(Vector2Batch([(0, 0), (1, 1)]), data, 0.1)
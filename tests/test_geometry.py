@@ -0,0 +1,131 @@
+from fractions import Fraction
+
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector2, Vector2Batch
+from ppb_vector.geometry import _orientation, centroid, contains, convex_hull, signed_area, winding
+from utils import angles, isclose, vectors
+
+# Whether to pass the vertices as a list, or as a batch
+containers = pytest.mark.parametrize("container", [list, Vector2Batch])
+
+SQUARE = [Vector2(0, 0), Vector2(2, 0), Vector2(2, 2), Vector2(0, 2)]
+
+
+def rectangles():
+    """Rectangles, as counter-clockwise lists of vertices, along with their area and center."""
+    def build(corner, width, height, angle):
+        u, v = Vector2(width, 0).rotate(angle), Vector2(0, height).rotate(angle)
+        vertices = [corner, corner + u, corner + u + v, corner + v]
+        return vertices, width * height, corner + (u + v) / 2
+
+    return st.builds(
+        build,
+        vectors(max_magnitude=1e3),
+        st.floats(min_value=1e-2, max_value=1e3),
+        st.floats(min_value=1e-2, max_value=1e3),
+        angles(),
+    )
+
+
+# Coordinates away from the boundary of SQUARE, where results are unspecified
+off_boundary = st.floats(min_value=-10, max_value=10).filter(
+    lambda x: min(abs(x), abs(x - 2)) > 1e-9,
+)
+
+
+@containers
+@given(rectangle=rectangles(), shift=st.integers(0, 3))
+def test_signed_area(container, rectangle, shift):
+    vertices, area, _ = rectangle
+    vertices = vertices[shift:] + vertices[:shift]
+    assert isclose(signed_area(container(vertices)), area, rel_tol=1e-6)
+    assert isclose(signed_area(container(reversed(vertices))), -area, rel_tol=1e-6)
+
+
+@containers
+@given(rectangle=rectangles())
+def test_winding(container, rectangle):
+    vertices, _, _ = rectangle
+    assert winding(container(vertices)) == 1
+    assert winding(container(reversed(vertices))) == -1
+
+
+@containers
+def test_degenerate(container):
+    for vertices in [[], [(1, 2)], [(1, 2), (3, 4)], [(0, 0), (1, 1), (2, 2)]]:
+        assert signed_area(container(vertices)) == 0
+        assert winding(container(vertices)) == 0
+        with pytest.raises(ValueError):
+            centroid(container(vertices))
+
+
+@containers
+@given(rectangle=rectangles(), shift=st.integers(0, 3))
+def test_centroid(container, rectangle, shift):
+    vertices, _, center = rectangle
+    vertices = vertices[shift:] + vertices[:shift]
+    assert centroid(container(vertices)).isclose(center, rel_to=vertices, rel_tol=1e-6)
+    assert centroid(container(reversed(vertices))).isclose(center, rel_to=vertices, rel_tol=1e-6)
+
+
+@containers
+@given(points=st.lists(st.builds(Vector2, off_boundary, off_boundary)))
+def test_contains_square(container, points):
+    expected = [0 < p.x < 2 and 0 < p.y < 2 for p in points]
+    assert contains(container(SQUARE), container(points)) == expected
+
+
+def test_contains_concave():
+    # A U shape, open upwards
+    polygon = [(0, 0), (3, 0), (3, 3), (2, 3), (2, 1), (1, 1), (1, 3), (0, 3)]
+    points = [(0.5, 2), (1.5, 2), (2.5, 2), (1.5, 0.5), (1.5, 4)]
+    assert contains(polygon, points) == [True, False, True, True, False]
+
+
+@containers
+@given(points=st.lists(vectors(max_magnitude=1e3)))
+def test_convex_hull(container, points):
+    hull = convex_hull(container(points))
+    assert isinstance(hull, Vector2Batch)
+    assert {tuple(v) for v in hull} <= {tuple(p) for p in points}
+    assert len({tuple(v) for v in hull}) == len(hull)
+
+    if len(hull) < 3:
+        return
+
+    # The hull is convex, counter-clockwise, and contains all points
+    for i, a in enumerate(hull):
+        b, c = hull[(i + 1) % len(hull)], hull[(i + 2) % len(hull)]
+        assert _orientation(*a, *b, *c) == 1
+        for p in points:
+            assert _orientation(*a, *b, *p) >= 0
+
+
+@given(a=vectors(), b=vectors(), c=vectors())
+def test_orientation(a, b, c):
+    expected = _orientation(*a, *b, *c)
+    assert _orientation(*b, *c, *a) == expected
+    assert _orientation(*b, *a, *c) == -expected
+
+    exact = (Fraction(b.x) - Fraction(a.x)) * (Fraction(c.y) - Fraction(a.y)) - \
+        (Fraction(b.y) - Fraction(a.y)) * (Fraction(c.x) - Fraction(a.x))
+    assert expected == (exact > 0) - (exact < 0)
+
+
+def test_convex_hull_collinear():
+    points = [(2, 2), (0, 0), (1, 1), (3, 3)]
+    assert list(convex_hull(points)) == [(0, 0), (3, 3)]
+
+
+class Position(Vector2):
+    pass
+
+
+@pytest.mark.parametrize("points", [[(0, 0), (1, 1)], [(0, 0), (2, 0), (1, 1), (0, 2)]])
+def test_convex_hull_element_type(points):
+    hull = convex_hull(Vector2Batch(points, element_type=Position))
+    assert hull.element_type is Position
+    assert convex_hull(points).element_type is Vector2
@@ -0,0 +1,134 @@
+import math
+
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import assume, given
+
+from ppb_vector import Vector2, Vector2Batch
+from ppb_vector.grid import grid_key, grid_neighbours, snap_to_grid, unique_within
+from utils import units, vectors
+
+cell_sizes = st.floats(min_value=1e-3, max_value=1e3)
+
+
+@given(v=vectors(1e6), cell_size=cell_sizes)
+def test_grid_key(v, cell_size):
+    i, j = grid_key(v, cell_size)
+    assert i <= v.x / cell_size < i + 1
+    assert j <= v.y / cell_size < j + 1
+    assert grid_key(tuple(v), cell_size) == (i, j)
+
+
+@given(v=vectors(1e6), cell_size=cell_sizes, direction=units(), t=st.floats(0, 1))
+def test_near_vectors(v, cell_size, direction, t):
+    """Vectors less than cell_size apart are in neighbouring cells."""
+    w = v + direction * (t * cell_size)
+    # Leave a margin for the rounding of distances, and of grid coordinates
+    assume(w.isclose(v, abs_tol=cell_size * (1 - 1e-6), rel_tol=0))
+    assert grid_key(w, cell_size) in grid_neighbours(grid_key(v, cell_size))
+
+
+def test_neighbours():
+    neighbours = grid_neighbours((0, 0))
+    assert neighbours[0] == (0, 0)
+    assert sorted(neighbours) == [(i, j) for i in (-1, 0, 1) for j in (-1, 0, 1)]
+
+
+@pytest.mark.parametrize("cell_size", [0, -1, math.nan, math.inf])
+def test_invalid_cell_size(cell_size):
+    with pytest.raises(ValueError):
+        grid_key((0, 0), cell_size)
+
+
+@pytest.mark.parametrize("vector", [Vector2(math.inf, 0), Vector2(0, math.nan)])
+def test_not_finite(vector):
+    with pytest.raises(ValueError):
+        grid_key(vector, 1)
+
+
+def greedy_unique(points, abs_tol):
+    """Reference implementation of unique_within, comparing all pairs."""
+    unique, indices = [], []
+    for p in points:
+        close = [i for i, u in enumerate(unique) if p.isclose(u, abs_tol=abs_tol, rel_tol=0)]
+        if not close:
+            close.append(len(unique))
+            unique.append(p)
+        indices.append(close[0])
+    return unique, indices
+
+
+@given(points=st.lists(vectors(10), max_size=50), abs_tol=st.floats(min_value=1e-3, max_value=5))
+def test_unique_within(points, abs_tol):
+    unique, indices = unique_within(points, abs_tol)
+    assert (list(unique), indices) == greedy_unique(points, abs_tol)
+
+    for p, i in zip(points, indices):
+        assert p.isclose(unique[i], abs_tol=abs_tol, rel_tol=0)
+    for i, u in enumerate(unique):
+        assert not any(u.isclose(w, abs_tol=abs_tol, rel_tol=0) for w in unique[i + 1:])
+
+
+def test_unique_rounded_distance():
+    """Points whose distance rounds to abs_tol are collapsed, even two cells of abs_tol apart."""
+    unique, indices = unique_within([(0, 1), (0, -1e-200)], 1)
+    assert indices == [0, 0]
+
+
+@given(points=st.lists(vectors(), max_size=50))
+def test_unique_exact(points):
+    unique, indices = unique_within(points + points, 0)
+    assert len(set(unique)) == len(unique) == len(set(points))
+    assert [unique[i] for i in indices] == points + points
+
+
+def test_unique_batch():
+    batch = Vector2Batch([(1, 1), (1.01, 1), (-1, 1)])
+    unique, indices = unique_within(batch, 0.1)
+    assert unique == Vector2Batch([(1, 1), (-1, 1)])
+    assert indices == [0, 0, 1]
+
+
+@given(points=st.lists(vectors(1e6), max_size=50), spacing=cell_sizes)
+def test_snap_to_grid(points, spacing):
+    nodes, indices = snap_to_grid(points, spacing)
+    assert len(set(nodes)) == len(nodes) == len(set(indices))
+    for p, i in zip(points, indices):
+        node = nodes[i]
+        assert abs(node.x - p.x) <= spacing / 2 * (1 + 1e-9) + 1e-9 * abs(p.x)
+        assert abs(node.y - p.y) <= spacing / 2 * (1 + 1e-9) + 1e-9 * abs(p.y)
+        assert math.isclose(node.x / spacing, round(node.x / spacing))
+        assert math.isclose(node.y / spacing, round(node.y / spacing))
+
+
+@pytest.mark.parametrize("abs_tol", [-1, math.nan, math.inf])
+def test_unique_invalid_tolerance(abs_tol):
+    with pytest.raises(ValueError):
+        unique_within([(0, 0)], abs_tol)
+
+
+@pytest.mark.parametrize("spacing", [0, -1, math.nan, math.inf])
+def test_snap_invalid_spacing(spacing):
+    with pytest.raises(ValueError):
+        snap_to_grid([(0, 0)], spacing)
+
+
+@pytest.mark.parametrize("vector", [Vector2(math.inf, 0), Vector2(0, math.nan)])
+@pytest.mark.parametrize("f, tolerance", [
+    (unique_within, 1), (unique_within, 0), (snap_to_grid, 1),
+])
+def test_not_finite_points(f, tolerance, vector):
+    with pytest.raises(ValueError):
+        f([(0, 0), vector], tolerance)
+
+
+class Position(Vector2):
+    pass
+
+
+@pytest.mark.parametrize("f, tolerance", [
+    (unique_within, 0), (unique_within, 1), (snap_to_grid, 1),
+])
+def test_element_type(f, tolerance):
+    unique, _ = f(Vector2Batch([(0, 0), (0.5, 0)], element_type=Position), tolerance)
+    assert all(type(v) is Position for v in unique)
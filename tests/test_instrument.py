@@ -0,0 +1,134 @@
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import instrument, Vector2
+from utils import vectors
+
+
+class V(Vector2):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def clean_instrumentation():
+    yield
+    instrument.disable()
+    instrument.reset()
+
+
+def test_disabled_by_default():
+    assert not instrument.is_enabled()
+    assert Vector2.__add__.__name__ == '__add__'
+    assert not hasattr(Vector2.__add__, '__wrapped__')
+
+
+def test_disable_restores_methods():
+    original = dict(vars(Vector2))
+    instrument.enable()
+    assert vars(Vector2)['__add__'] is not original['__add__']
+
+    instrument.disable()
+    assert dict(vars(Vector2)) == original
+
+
+def test_disabled_collects_nothing():
+    instrument.enable()
+    instrument.disable()
+    Vector2(1, 2) + Vector2(3, 4)
+    assert not instrument.snapshot().calls
+
+
+@given(x=vectors(), y=vectors())
+def test_count_calls(x: Vector2, y: Vector2):
+    with instrument.collect() as stats:
+        x + y
+        x.dot(y)
+        x.length
+
+    calls = stats.snapshot().calls
+    assert calls['__add__'] == calls['dot'] == calls['length'] == 1
+    assert calls['__sub__'] == 0
+
+
+def test_count_conversions():
+    with instrument.collect() as stats:
+        Vector2(1, 2) + (1, 2)
+        Vector2(1, 2) - [1, 2]
+        Vector2(1, 2) + {'x': 1, 'y': 2}
+        Vector2(1, 2) + Vector2(1, 2)
+
+    conversions = stats.snapshot().conversions
+    assert conversions[tuple] == conversions[list] == conversions[dict] == 1
+    assert conversions[Vector2] == 1
+
+
+def test_count_allocations():
+    with instrument.collect() as stats:
+        v = V(1, 2)
+        Vector2(v)  # Already a Vector2, no allocation
+        V(v)
+        -v
+        Vector2(3, 4)
+
+    allocations = stats.snapshot().allocations
+    assert allocations[V] == 2
+    assert allocations[Vector2] == 1
+
+
+def test_timing():
+    with instrument.collect(sample_every=2) as stats:
+        for _ in range(10):
+            Vector2(1, 0).rotate(10)
+
+    count, total = stats.snapshot().timings['rotate']
+    assert count == 5
+    assert total > 0
+    assert '__add__' not in stats.snapshot().timings
+
+
+def test_collect_is_scoped():
+    instrument.enable()
+    Vector2(1, 2).normalize()
+
+    with instrument.collect() as stats:
+        Vector2(1, 2).rotate(90)
+
+    assert instrument.is_enabled()
+    assert instrument.snapshot().calls['normalize'] == 1
+    assert instrument.snapshot().calls['rotate'] == 0
+    assert stats.snapshot().calls['rotate'] == 1
+    assert stats.snapshot().calls['normalize'] == 0
+
+
+def test_reset():
+    instrument.enable()
+    Vector2(1, 2).normalize()
+    instrument.reset()
+    assert not instrument.snapshot().calls
+
+
+@given(x=vectors(), y=vectors())
+def test_results_unchanged(x: Vector2, y: Vector2):
+    expected = (x + y, x - y, x * y, x.angle(y), x.length)
+    with instrument.collect(sample_every=1):
+        assert (x + y, x - y, x * y, x.angle(y), x.length) == expected
+
+
+def test_trace_conversions():
+    with instrument.collect(trace_conversions=True) as stats:
+        for _ in range(3):
+            Vector2(1, 2).isclose((1, 2))  # Converts (1, 2) once
+        Vector2(1, 2) + Vector2(3, 4)
+
+    call_sites = stats.snapshot().call_sites
+    assert sum(call_sites.values()) == 3
+    [((filename, _), count)] = call_sites.items()
+    assert filename == __file__
+    assert count == 3
+
+
+def test_trace_conversions_disabled():
+    with instrument.collect() as stats:
+        Vector2(1, 2) + (1, 2)
+
+    assert not stats.snapshot().call_sites
@@ -0,0 +1,129 @@
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector2, Vector2Batch
+from ppb_vector.integrate import euler, semi_implicit_euler, verlet
+from utils import vectors
+
+
+def reference_euler(x, v, a, dt, damping, max_speed):
+    return x + v * dt, ((v + a * dt) / (1 + damping * dt)).truncate(max_speed)
+
+
+def reference_semi_implicit_euler(x, v, a, dt, damping, max_speed):
+    v = ((v + a * dt) / (1 + damping * dt)).truncate(max_speed)
+    return x + v * dt, v
+
+
+def reference_verlet(x, previous, a, dt, damping, max_speed):
+    step = ((x - previous) / (1 + damping * dt) + a * dt * dt).truncate(max_speed * dt)
+    return x + step, x
+
+
+INTEGRATORS = [
+    (euler, reference_euler),
+    (semi_implicit_euler, reference_semi_implicit_euler),
+    (verlet, reference_verlet),
+]
+
+integrators = pytest.mark.parametrize(
+    "integrator, reference", INTEGRATORS, ids=lambda f: getattr(f, '__name__', None),
+)
+
+timesteps = st.floats(min_value=1e-3, max_value=1)
+dampings = st.floats(min_value=0, max_value=10)
+speeds = st.floats(min_value=1e-3, max_value=1e3)
+
+
+def particles(data, count=None):
+    if count is None:
+        count = data.draw(st.integers(0, 10))
+    return data.draw(st.lists(vectors(1e3), min_size=count, max_size=count))
+
+
+@integrators
+@given(data=st.data(), dt=timesteps, damping=dampings)
+def test_integrator(integrator, reference, data, dt, damping):
+    xs = particles(data)
+    vs = particles(data, len(xs))
+    accelerations = particles(data, len(xs))
+    max_speeds = data.draw(st.lists(speeds, min_size=len(xs), max_size=len(xs)))
+
+    positions, velocities = Vector2Batch(xs), Vector2Batch(vs)
+    integrator(positions, velocities, Vector2Batch(accelerations), dt,
+               damping=damping, max_speed=max_speeds)
+
+    results = zip(xs, vs, accelerations, max_speeds, positions, velocities)
+    for x, v, a, speed, new_x, new_v in results:
+        expected_x, expected_v = reference(x, v, a, dt, damping, speed)
+        assert new_x.isclose(expected_x, rel_to=[x, v, a], abs_tol=1e-6)
+        assert new_v.isclose(expected_v, rel_to=[x, v, a], abs_tol=1e-6)
+
+
+@integrators
+@given(data=st.data(), gravity=vectors(1e3), dt=timesteps)
+def test_uniform_acceleration(integrator, reference, data, gravity, dt):
+    xs = particles(data)
+    vs = particles(data, len(xs))
+
+    uniform = Vector2Batch(xs), Vector2Batch(vs)
+    integrator(*uniform, gravity, dt)
+    batched = Vector2Batch(xs), Vector2Batch(vs)
+    integrator(*batched, Vector2Batch([gravity] * len(xs)), dt)
+    assert uniform == batched
+
+
+@integrators
+@given(data=st.data(), dt=timesteps)
+def test_acceleration_view(integrator, reference, data, dt):
+    xs = particles(data)
+    vs = particles(data, len(xs))
+    accelerations = Vector2Batch(particles(data, 2 * len(xs)))
+
+    viewed = Vector2Batch(xs), Vector2Batch(vs)
+    integrator(*viewed, accelerations.view(slice(None, None, 2)), dt)
+    copied = Vector2Batch(xs), Vector2Batch(vs)
+    integrator(*copied, accelerations[::2], dt)
+    assert viewed == copied
+
+
+@integrators
+@given(data=st.data(), dt=timesteps, max_speed=speeds)
+def test_single_speed_limit(integrator, reference, data, dt, max_speed):
+    xs = particles(data)
+    vs = particles(data, len(xs))
+
+    single = Vector2Batch(xs), Vector2Batch(vs)
+    integrator(*single, (0, 0), dt, max_speed=max_speed)
+    per_particle = Vector2Batch(xs), Vector2Batch(vs)
+    integrator(*per_particle, (0, 0), dt, max_speed=[max_speed] * len(xs))
+    assert single == per_particle
+
+
+@integrators
+def test_mismatched(integrator, reference):
+    two, three = Vector2Batch([(0, 0)] * 2), Vector2Batch([(0, 0)] * 3)
+    with pytest.raises(ValueError):
+        integrator(two, three, (0, 0), 1)
+    with pytest.raises(ValueError):
+        integrator(two, Vector2Batch(two), three, 1)
+    with pytest.raises(ValueError):
+        integrator(two, Vector2Batch(two), (0, 0), 1, max_speed=[1, 2, 3])
+
+
+def test_free_fall():
+    """The integrators agree on the trajectory of a falling particle."""
+    gravity, dt, steps = Vector2(0, -10), 0.01, 100
+    trajectories = []
+    for integrator, _ in INTEGRATORS:
+        positions = Vector2Batch([(0, 0)])
+        # Verlet takes the previous position, rather than the velocity
+        other = Vector2Batch([(-dt, 0)] if integrator is verlet else [(1, 0)])
+        for _ in range(steps):
+            integrator(positions, other, gravity, dt)
+        trajectories.append(positions[0])
+
+    # After 1 s, the exact position is (1, -5)
+    for position in trajectories:
+        assert position.isclose(Vector2(1, -5), rel_tol=0.02)
@@ -0,0 +1,141 @@
+import math
+
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import assume, given
+
+from ppb_vector import Vector2, Vector2Batch
+from ppb_vector.interpolate import (
+    bezier, catmull_rom, flatten_bezier, flatten_catmull_rom, lerp, slerp,
+)
+from utils import angle_isclose, isclose, vectors
+
+ts = st.lists(st.floats(min_value=0, max_value=1))
+tolerances = st.floats(min_value=1e-2, max_value=10)
+
+
+@given(a=vectors(), b=vectors(), ts=ts)
+def test_lerp(a, b, ts):
+    result = lerp(a, b, ts)
+    assert isinstance(result, Vector2Batch)
+    assert list(result) == [a + (b - a) * t for t in ts]
+
+
+@given(a=vectors(), b=vectors())
+def test_lerp_ends(a, b):
+    start, end = lerp(a, b, [0, 1])
+    assert start == a
+    assert end.isclose(b, rel_to=[a, b])
+
+
+@given(a=vectors(1e10), b=vectors(1e10))
+def test_slerp_ends(a, b):
+    """slerp goes from a to b, as rotating a by a.angle(b) would"""
+    assume(a.length > 1e-10 and b.length > 1e-10)
+    start, end = slerp(a, b, [0, 1])
+    assert start.isclose(a)
+    assert end.isclose(a.rotate(a.angle(b)).scale_to(b.length), rel_to=[a, b])
+    assert end.isclose(b, rel_to=[a, b], rel_tol=1e-6)
+
+
+@given(a=vectors(1e10), b=vectors(1e10), ts=ts)
+def test_slerp(a, b, ts):
+    assume(a.length > 1e-10 and b.length > 1e-10)
+    angle = a.angle(b)
+    for t, v in zip(ts, slerp(a, b, ts)):
+        length = a.length + (b.length - a.length) * t
+        assert isclose(v.length, length, rel_to=[a.length, b.length])
+        if length > 1e-9 * max(a.length, b.length):
+            assert angle_isclose(a.angle(v), angle * t)
+
+
+@given(v=vectors(), ts=ts)
+def test_slerp_zero(v, ts):
+    zero = Vector2(0, 0)
+    assert slerp(zero, v, ts) == lerp(zero, v, ts)
+    assert slerp(v, zero, ts) == lerp(v, zero, ts)
+
+
+def test_slerp_rotate():
+    """slerp turns in the same direction as Vector2.rotate"""
+    a = Vector2(1, 0)
+    b = a.rotate(120)
+    [middle] = slerp(a, b, [0.5])
+    assert middle.isclose(a.rotate(60))
+
+
+@given(p0=vectors(1e3), p1=vectors(1e3), p2=vectors(1e3), p3=vectors(1e3), ts=ts)
+def test_bezier(p0, p1, p2, p3, ts):
+    """The Bernstein form agrees with de Casteljau's algorithm."""
+    for t, v in zip(ts, bezier(p0, p1, p2, p3, ts)):
+        a, b, c = p0 + (p1 - p0) * t, p1 + (p2 - p1) * t, p2 + (p3 - p2) * t
+        a, b = a + (b - a) * t, b + (c - b) * t
+        assert v.isclose(a + (b - a) * t, rel_to=[p0, p1, p2, p3])
+
+
+@given(p0=vectors(1e3), p1=vectors(1e3), p2=vectors(1e3), p3=vectors(1e3))
+def test_catmull_rom(p0, p1, p2, p3):
+    """Catmull-Rom segments interpolate their inner points, with the expected tangents."""
+    h = 1e-6
+    start, end, after_start, before_end = catmull_rom(p0, p1, p2, p3, [0, 1, h, 1 - h])
+    assert start.isclose(p1, rel_to=[p0, p1, p2, p3])
+    assert end.isclose(p2, rel_to=[p0, p1, p2, p3])
+    assert ((after_start - start) / h).isclose((p2 - p0) / 2, rel_to=[p0, p1, p2, p3],
+                                               abs_tol=1e-3, rel_tol=1e-3)
+    assert ((end - before_end) / h).isclose((p3 - p1) / 2, rel_to=[p0, p1, p2, p3],
+                                            abs_tol=1e-3, rel_tol=1e-3)
+
+
+def distance_to_polyline(p, polyline):
+    best = math.inf
+    for a, b in zip(polyline, polyline[1:]):
+        ab = b - a
+        t = 0.0 if not ab.dot(ab) else min(max((p - a).dot(ab) / ab.dot(ab), 0), 1)
+        best = min(best, (p - (a + ab * t)).length)
+    return best if len(polyline) > 1 else (p - polyline[0]).length
+
+
+@pytest.mark.parametrize("curve, flatten", [
+    (bezier, flatten_bezier), (catmull_rom, flatten_catmull_rom),
+], ids=["bezier", "catmull_rom"])
+@given(p0=vectors(1e2), p1=vectors(1e2), p2=vectors(1e2), p3=vectors(1e2), tolerance=tolerances)
+def test_flatten(curve, flatten, p0, p1, p2, p3, tolerance):
+    polyline = list(flatten(p0, p1, p2, p3, tolerance))
+    samples = curve(p0, p1, p2, p3, [i / 64 for i in range(65)])
+    assert polyline[0] == samples[0]
+    assert polyline[-1] == samples[-1]
+    for p in samples:
+        assert distance_to_polyline(p, polyline) <= tolerance * (1 + 1e-6) + 1e-9
+
+
+def test_flatten_adaptive():
+    """Tighter tolerances give more vertices."""
+    counts = [len(flatten_bezier((0, 0), (0, 10), (10, 10), (10, 0), tolerance))
+              for tolerance in [1, 0.1, 0.01, 0.001]]
+    assert counts == sorted(counts)
+    assert counts[0] < counts[-1]
+
+
+@pytest.mark.parametrize("tolerance", [0, -1, math.nan])
+def test_flatten_tolerance(tolerance):
+    with pytest.raises(ValueError):
+        flatten_bezier((0, 0), (0, 1), (1, 1), (1, 0), tolerance)
+
+
+class Position(Vector2):
+    pass
+
+
+@pytest.mark.parametrize("sample", [
+    lambda a, b: lerp(a, b, [0, 1]),
+    lambda a, b: slerp(a, b, [0, 1]),
+    lambda a, b: bezier(a, b, b, a, [0, 1]),
+    lambda a, b: catmull_rom(a, a, b, b, [0, 1]),
+    lambda a, b: flatten_bezier(a, b, b, a, 0.1),
+    lambda a, b: flatten_catmull_rom(a, a, b, b, 0.1),
+], ids=["lerp", "slerp", "bezier", "catmull_rom", "flatten_bezier", "flatten_catmull_rom"])
+def test_element_type(sample):
+    """Results are instances of the most derived vector class, as with Vector2.__add__."""
+    assert all(type(v) is Position for v in sample(Position(1, 0), (0, 1)))
+    assert all(type(v) is Position for v in sample(Vector2(1, 0), Position(0, 1)))
+    assert all(type(v) is Vector2 for v in sample((1, 0), (0, 1)))
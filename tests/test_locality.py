@@ -0,0 +1,140 @@
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector2, Vector2Batch
+from ppb_vector.locality import (
+    argsort_by_locality, hilbert_key, hilbert_keys, morton_key, morton_keys, reorder,
+)
+from utils import vectors
+
+bits = st.integers(min_value=1, max_value=32)
+
+
+def reference_hilbert(x, y, bits):
+    """Hilbert index of a cell, one bit at a time, as on Wikipedia."""
+    n, index = 1 << bits, 0
+    s = n >> 1
+    while s:
+        rx, ry = int(x & s > 0), int(y & s > 0)
+        index += s * s * ((3 * rx) ^ ry)
+        if not ry:
+            if rx:
+                x, y = n - 1 - x, n - 1 - y
+            x, y = y, x
+        s >>= 1
+    return index
+
+
+def reference_morton(x, y, bits):
+    return sum((x >> i & 1) << 2 * i | (y >> i & 1) << 2 * i + 1 for i in range(bits))
+
+
+@st.composite
+def cells(draw):
+    b = draw(bits)
+    return draw(st.integers(0, (1 << b) - 1)), draw(st.integers(0, (1 << b) - 1)), b
+
+
+def center(cell):
+    x, y, b = cell
+    return Vector2(x + 0.5, y + 0.5), (0, 0), (1 << b, 1 << b), b
+
+
+@given(cell=cells())
+def test_hilbert_key(cell):
+    assert hilbert_key(*center(cell)) == reference_hilbert(*cell)
+
+
+@given(cell=cells())
+def test_morton_key(cell):
+    assert morton_key(*center(cell)) == reference_morton(*cell)
+
+
+@pytest.mark.parametrize("bits", [1, 2, 3, 5])
+def test_hilbert_curve(bits):
+    """The Hilbert curve goes through all cells, each next to the previous one."""
+    size = 1 << bits
+    cells = [(x, y) for x in range(size) for y in range(size)]
+    keys = hilbert_keys([(x + 0.5, y + 0.5) for x, y in cells], (0, 0), (size, size), bits)
+    assert sorted(keys) == list(range(size * size))
+
+    path = [cell for _, cell in sorted(zip(keys, cells))]
+    assert path[0] == (0, 0) and path[-1] == (size - 1, 0)
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        assert abs(x1 - x2) + abs(y1 - y2) == 1
+
+
+@pytest.mark.parametrize("keys", [hilbert_keys, morton_keys])
+@given(points=st.lists(vectors(1e3)), low=vectors(1e3), size=vectors(1e3), bits=bits)
+def test_clamped(keys, points, low, size, bits):
+    """Points out of the bounds get the keys of the nearest point in them."""
+    high = low + (abs(size.x), abs(size.y))
+    clamped = [
+        (min(max(p.x, low.x), high.x), min(max(p.y, low.y), high.y)) for p in points
+    ]
+    assert keys(points, low, high, bits) == keys(clamped, low, high, bits)
+    assert all(0 <= key < 1 << 2 * bits for key in keys(points, low, high, bits))
+
+
+@pytest.mark.parametrize("curve", ['hilbert', 'morton'])
+@given(points=st.lists(vectors(1e3)), bits=bits)
+def test_argsort(curve, points, bits):
+    order = argsort_by_locality(points, curve=curve, bits=bits)
+    assert sorted(order) == list(range(len(points)))
+    if points:
+        keys = (hilbert_keys if curve == 'hilbert' else morton_keys)(
+            points, (min(p.x for p in points), min(p.y for p in points)),
+            (max(p.x for p in points), max(p.y for p in points)), bits,
+        )
+        assert [keys[i] for i in order] == sorted(keys)
+
+
+def test_argsort_locality():
+    """Sorting scattered points makes consecutive points closer."""
+    grid = [Vector2(x, y) for x in range(32) for y in range(32)]
+    scattered = [p for k in range(7) for p in grid[k::7]]
+    for curve in ['hilbert', 'morton']:
+        ordered = [scattered[i] for i in argsort_by_locality(scattered, curve=curve)]
+        before = sum((a - b).length for a, b in zip(scattered, scattered[1:]))
+        after = sum((a - b).length for a, b in zip(ordered, ordered[1:]))
+        assert after < before / 4
+
+
+@pytest.mark.parametrize("typecode", ['d', 'f'])
+@given(vs=st.lists(vectors(1e3)), data=st.data())
+def test_reorder(typecode, vs, data):
+    order = data.draw(st.permutations(range(len(vs))))
+    batch = Vector2Batch(vs, typecode=typecode)
+    expected = [batch[i] for i in order]
+    xs = batch.xs
+
+    reorder(batch, order)
+    assert list(batch) == expected
+    assert batch.xs is xs and batch.typecode == typecode
+
+
+@pytest.mark.parametrize("order", [[0, 1], [0, 1, 1], [0, 1, 3], [2, 1, 0, 3]])
+def test_reorder_invalid(order):
+    batch = Vector2Batch([(0, 0), (1, 1), (2, 2)])
+    with pytest.raises(ValueError):
+        reorder(batch, order)
+    assert batch == Vector2Batch([(0, 0), (1, 1), (2, 2)])
+
+
+@pytest.mark.parametrize("low, high, bits", [
+    ((0, 0), (1, 1), 0),
+    ((0, 0), (1, 1), 33),
+    ((1, 0), (0, 1), 16),
+    ((0, float('nan')), (1, 1), 16),
+])
+def test_invalid(low, high, bits):
+    with pytest.raises(ValueError):
+        hilbert_key((0.5, 0.5), low, high, bits)
+    with pytest.raises(ValueError):
+        morton_key((0.5, 0.5), low, high, bits)
+
+
+def test_invalid_curve():
+    with pytest.raises(ValueError):
+        argsort_by_locality([(0, 0)], curve='peano')
@@ -0,0 +1,132 @@
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import masks, Vector2, Vector2Batch
+from utils import lengths, vectors
+
+
+@st.composite
+def batch_and_mask(draw, min_size=0):
+    vs = draw(st.lists(vectors(), min_size=min_size))
+    mask = draw(st.lists(st.booleans(), min_size=len(vs), max_size=len(vs)))
+    return vs, mask
+
+
+@given(vs=st.lists(vectors()), length=lengths())
+def test_lengths(vs, length):
+    batch = Vector2Batch(vs)
+    assert masks.longer_than(batch, length) == [v.length > length for v in vs]
+    assert masks.shorter_than(batch, length) == [v.length < length for v in vs]
+    assert masks.longer_than(vs, length) == masks.longer_than(batch.view(), length)
+
+
+@given(vs=st.lists(vectors()), other=vectors(), data=st.data(),
+       abs_tol=st.floats(0, 1), rel_tol=st.floats(0, 1))
+def test_isclose(vs, other, data, abs_tol, rel_tol):
+    batch = Vector2Batch(vs)
+    tolerances = {'abs_tol': abs_tol, 'rel_tol': rel_tol}
+    assert masks.isclose(batch, other, **tolerances) == [v.isclose(other, **tolerances) for v in vs]
+
+    others = data.draw(st.lists(vectors(), min_size=len(vs), max_size=len(vs)))
+    assert masks.isclose(batch, Vector2Batch(others), **tolerances) == [
+        v.isclose(w, **tolerances) for v, w in zip(vs, others)
+    ]
+
+
+def test_isclose_defaults():
+    assert masks.isclose([(1, 0), (1, 1e-8)], Vector2(1, 0)) == [True, False]
+    with pytest.raises(ValueError):
+        masks.isclose([(0, 0)], (0, 0), abs_tol=-1)
+
+
+@given(vs=st.lists(vectors()), normal=vectors(), offset=st.floats(-1e3, 1e3))
+def test_half_plane(vs, normal, offset):
+    assert masks.half_plane(vs, normal, offset) == [v.dot(normal) > offset for v in vs]
+
+
+@given(data=batch_and_mask())
+def test_compress(data):
+    vs, mask = data
+    batch = Vector2Batch(vs)
+    selected = [v for v, m in zip(vs, mask) if m]
+    assert list(masks.compress(batch, mask)) == selected
+    assert list(batch.view(masks.indices(mask))) == selected
+
+
+def test_compress_typecode():
+    batch = Vector2Batch([(1, 2), (3, 4)], typecode='f')
+    assert masks.compress(batch, [False, True]).typecode == 'f'
+    assert masks.compress(list(batch), [False, True]).typecode == 'd'
+
+
+@given(data=batch_and_mask(), v=vectors())
+def test_where(data, v):
+    vs, mask = data
+    batch = Vector2Batch(vs)
+    negated = Vector2Batch(-w for w in vs)
+    assert list(masks.where(mask, batch, negated)) == [w if m else -w for w, m in zip(vs, mask)]
+    assert list(masks.where(mask, v, batch)) == [v if m else w for w, m in zip(vs, mask)]
+    assert list(masks.where(mask, batch.view(), v)) == [w if m else v for w, m in zip(vs, mask)]
+
+
+@given(data=batch_and_mask(), v=vectors())
+def test_update(data, v):
+    vs, mask = data
+    batch = Vector2Batch(vs)
+    masks.update(batch, mask, v)
+    assert list(batch) == [v if m else w for w, m in zip(vs, mask)]
+
+    batch = Vector2Batch(vs)
+    masks.update(batch, mask, Vector2Batch(-w for w in vs))
+    assert list(batch) == [-w if m else w for w, m in zip(vs, mask)]
+
+
+@given(data=batch_and_mask(), length=lengths())
+def test_transform(data, length):
+    vs, mask = data
+    batch = Vector2Batch(vs)
+    masks.transform(batch, mask, Vector2.truncate, length)
+    assert list(batch) == [w.truncate(length) if m else w for w, m in zip(vs, mask)]
+
+
+@pytest.mark.parametrize("call", [
+    lambda batch: masks.compress(batch, [True]),
+    lambda batch: masks.where([True], batch, (0, 0)),
+    lambda batch: masks.update(batch, [True, False, True], (0, 0)),
+    lambda batch: masks.update(batch, [True, False], Vector2Batch([(0, 0)])),
+    lambda batch: masks.transform(batch, [], Vector2.normalize),
+    lambda batch: masks.isclose(batch, Vector2Batch([(0, 0)])),
+], ids=["compress", "where", "update", "update values", "transform", "isclose"])
+def test_mismatched(call):
+    with pytest.raises(ValueError):
+        call(Vector2Batch([(1, 1), (2, 2)]))
+
+
+class A(Vector2):
+    pass
+
+
+class B(A):
+    pass
+
+
+class C(Vector2):
+    pass
+
+
+@pytest.mark.parametrize("a, b, expected", [
+    (A, B, B), (B, A, B), (A, C, A), (C, A, C), (A, Vector2, A), (Vector2, Vector2, Vector2),
+])
+def test_where_element_type(a, b, expected):
+    batch_a = Vector2Batch([(1, 1)], element_type=a)
+    batch_b = Vector2Batch([(2, 2)], element_type=b)
+    assert masks.where([True], batch_a, batch_b).element_type is expected
+    assert masks.where([True], batch_a, b(0, 0)).element_type is expected
+    assert masks.where([True], a(0, 0), batch_b.view()).element_type is expected
+    assert masks.where([True], batch_a, (0, 0)).element_type is a
+
+
+def test_compress_element_type():
+    batch = Vector2Batch([(1, 2), (3, 4)], element_type=A)
+    assert type(masks.compress(batch, [False, True])[0]) is A
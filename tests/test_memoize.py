@@ -0,0 +1,150 @@
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import memoize, Vector2
+from utils import angles, lengths, units, vectors
+
+
+class V(Vector2):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def clean_memoization():
+    yield
+    memoize.disable()
+
+
+CALLS = [
+    ('angle', lambda v, w, s: v.angle(w)),
+    ('dot', lambda v, w, s: v.dot(w)),
+    ('length', lambda v, w, s: v.length),
+    ('normalize', lambda v, w, s: v.normalize() if v.length else v),
+    ('reflect', lambda v, w, s: v.reflect(w.normalize()) if w.length > 1e-100 else v),
+    ('rotate', lambda v, w, s: v.rotate(s)),
+    ('scale_by', lambda v, w, s: v.scale_by(s)),
+    ('scale_to', lambda v, w, s: v.scale_to(abs(s)) if v.length else v),
+    ('truncate', lambda v, w, s: v.truncate(abs(s))),
+]
+
+
+def test_disabled_by_default():
+    assert not memoize.is_enabled()
+    assert not hasattr(Vector2.rotate, '__wrapped__')
+
+
+def test_disable_restores_methods():
+    original = dict(vars(Vector2))
+    memoize.enable()
+    assert vars(Vector2)['rotate'] is not original['rotate']
+    assert memoize.is_enabled('rotate') and memoize.is_enabled()
+
+    memoize.disable()
+    assert dict(vars(Vector2)) == original
+    assert not memoize.cache_info()
+
+
+def test_enable_some():
+    memoize.enable('rotate', 'normalize')
+    assert memoize.is_enabled('rotate') and not memoize.is_enabled('dot')
+    assert set(memoize.cache_info()) == {'rotate', 'normalize'}
+
+    memoize.disable('rotate')
+    assert set(memoize.cache_info()) == {'normalize'}
+
+
+def test_enable_invalid():
+    with pytest.raises(ValueError):
+        memoize.enable('rotate', '__add__')
+    assert not memoize.is_enabled()
+
+
+@pytest.mark.parametrize("name, call", CALLS, ids=[name for name, _ in CALLS])
+@given(v=vectors(1e10), w=vectors(1e10), s=angles())
+def test_same_results(name, call, v, w, s):
+    expected = call(v, w, s)
+    with memoize.memoized(name):
+        assert call(v, w, s) == expected
+        assert call(v, w, s) == expected
+        info = memoize.cache_info()[name]
+        assert info.hits == info.misses
+
+
+@given(v=units(), angle=angles())
+def test_subclass(v, angle):
+    with memoize.memoized('rotate'):
+        assert type(Vector2(v).rotate(angle)) is Vector2
+        assert type(V(v).rotate(angle)) is V
+        assert V(v).rotate(angle) == Vector2(v).rotate(angle)
+
+
+def test_statistics():
+    memoize.enable('rotate', maxsize=2)
+    v = Vector2(1, 2)
+    for angle in [10, 20, 10, 30, 20]:
+        v.rotate(angle)
+
+    info = memoize.cache_info()['rotate']
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (1, 4, 2, 2)
+
+    memoize.cache_clear()
+    info = memoize.cache_info()['rotate']
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+
+
+@given(v=vectors(1e10), length=lengths(max_value=1e10))
+def test_uncached_arguments(v, length):
+    with memoize.memoized('dot', 'truncate'):
+        assert v.dot([1, 2]) == v.dot((1, 2))
+        assert v.truncate(max_length=length) == v.truncate(length)
+        info = memoize.cache_info()
+    assert info['dot'].currsize == info['truncate'].currsize == 1
+
+
+def test_memoized_block():
+    memoize.enable('dot')
+    with memoize.memoized('dot', 'rotate'):
+        assert memoize.is_enabled('rotate')
+    assert memoize.is_enabled('dot') and not memoize.is_enabled('rotate')
+
+
+def test_subclass_argument():
+    with memoize.memoized('reflect'):
+        assert type(Vector2(1, 1).reflect((0, 1))) is Vector2
+        assert type(Vector2(1, 1).reflect(V(0, 1))) is V
+
+
+def test_error_not_repeated():
+    class Angle:
+        calls = 0
+
+        def __float__(self):
+            self.calls += 1
+            raise TypeError("Not an angle")
+
+    angle = Angle()
+    with memoize.memoized('rotate'):
+        with pytest.raises(TypeError):
+            Vector2(1, 0).rotate(angle)  # type: ignore
+    assert angle.calls == 1
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_with_instrumentation(reverse):
+    from ppb_vector import instrument
+
+    original = dict(vars(Vector2))
+    instrument.enable()
+    memoize.enable('rotate')
+    if reverse:
+        memoize.disable()
+        instrument.disable()
+    else:
+        instrument.disable()
+        Vector2(1, 0).rotate(30)
+        memoize.disable()
+
+    instrument.reset()
+    Vector2(1, 0).rotate(30)
+    assert not instrument.snapshot().calls
+    assert dict(vars(Vector2)) == original
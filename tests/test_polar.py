@@ -0,0 +1,117 @@
+import pickle
+from math import isclose
+
+import pytest  # type: ignore
+from hypothesis import assume, given, note
+
+from ppb_vector import PolarVector2, Vector2
+from utils import angle_isclose, angles, floats, lengths, vector_likes, vectors
+
+
+def polars():
+    return vectors().map(PolarVector2.from_vector)
+
+
+@given(v=vectors())
+def test_roundtrip(v: Vector2):
+    polar = PolarVector2.from_vector(v)
+    assert isclose(polar.length, v.length)
+    assert polar.to_vector() == v
+    assert PolarVector2(polar.length, polar.heading).to_vector().isclose(v)
+
+
+@given(v=vectors())
+def test_heading(v: Vector2):
+    assume(v.length > 1e-100)
+    assert angle_isclose(PolarVector2.from_vector(v).heading, Vector2(1, 0).angle(v))
+
+
+@given(length=lengths(), heading=angles())
+def test_heading_normalized(length: float, heading: float):
+    assert -180 < PolarVector2(length, heading).heading <= 180
+
+
+def test_negative_length():
+    with pytest.raises(ValueError):
+        PolarVector2(-1, 0)
+
+
+@pytest.mark.parametrize("vector_like", vector_likes(), ids=lambda x: type(x).__name__)
+def test_convert(vector_like):
+    assert PolarVector2.from_vector(vector_like) == vector_like
+
+
+@given(p=polars())
+def test_vector_like(p: PolarVector2):
+    assert Vector2(p) == (p.x, p.y) == tuple(p)
+    assert (p[0], p[1]) == (p['x'], p['y']) == (p.x, p.y)
+
+
+@given(length=lengths(), heading=angles(), angle=angles())
+def test_rotate(length: float, heading: float, angle: float):
+    p = PolarVector2(length, heading)
+    rotated = p.rotate(angle)
+    note(f"Rotated: {rotated}")
+    assert rotated.length == length
+    assert rotated.isclose(p.to_vector().rotate(angle), rel_tol=1e-6)
+
+
+@given(p=polars(), scalar=floats())
+def test_scale_by(p: PolarVector2, scalar: float):
+    scaled = p.scale_by(scalar)
+    assert isclose(scaled.length, abs(scalar) * p.length)
+    assert scaled.isclose(p.to_vector().scale_by(scalar), rel_tol=1e-6)
+
+
+@given(p=polars(), length=lengths())
+def test_scale_to(p: PolarVector2, length: float):
+    assume(p.length > 0)
+    scaled = p.scale_to(length)
+    assert scaled.length == length
+    assert scaled.heading == p.heading
+
+
+@given(p=polars(), length=lengths())
+def test_truncate(p: PolarVector2, length: float):
+    assert p.truncate(length).length == min(p.length, length)
+
+
+@given(p=polars())
+def test_normalize(p: PolarVector2):
+    assume(p.length > 0)
+    assert p.normalize() == PolarVector2(1, p.heading)
+
+
+def test_normalize_zero():
+    with pytest.raises(ZeroDivisionError):
+        PolarVector2(0, 42).normalize()
+
+
+@given(p=polars())
+def test_negation(p: PolarVector2):
+    assert (-p).length == p.length
+    assert (-p).isclose(-p.to_vector(), rel_tol=1e-6)
+
+
+@given(p=polars(), q=polars())
+def test_angle(p: PolarVector2, q: PolarVector2):
+    assume(p.length > 1e-100 and q.length > 1e-100)
+    expected = p.to_vector().angle(q)
+    assert angle_isclose(p.angle(q), expected)
+    assert angle_isclose(p.angle(q.to_vector()), expected)
+
+
+@given(p=polars(), v=vectors())
+def test_addition(p: PolarVector2, v: Vector2):
+    assert p + v == p.to_vector() + v == v + p
+
+
+@given(p=polars())
+def test_pickle(p: PolarVector2):
+    assert pickle.loads(pickle.dumps(p)) == p
+
+
+def test_frozen():
+    p = PolarVector2(1, 0)
+    with pytest.raises(AttributeError):
+        p.length = 2  # type: ignore
@@ -0,0 +1,130 @@
+import math
+
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector2, Vector2Batch
+from ppb_vector.quantize import Quantizer
+from utils import vectors
+
+precisions = st.floats(min_value=1e-3, max_value=1e3)
+sizes = st.floats(min_value=0, max_value=1e6)
+
+
+@st.composite
+def quantizers(draw):
+    low = draw(vectors(1e6))
+    high = low + (draw(sizes), draw(sizes))
+    return Quantizer(low, high, draw(precisions))
+
+
+def inside(draw, quantizer):
+    low, high = quantizer.low, quantizer.high
+    t, s = draw(st.floats(0, 1)), draw(st.floats(0, 1))
+    return Vector2(
+        min(low.x + (high.x - low.x) * t, high.x),
+        min(low.y + (high.y - low.y) * s, high.y),
+    )
+
+
+@st.composite
+def quantized(draw, max_size=20):
+    quantizer = draw(quantizers())
+    count = draw(st.integers(0, max_size))
+    return quantizer, [inside(draw, quantizer) for _ in range(count)]
+
+
+@given(q=quantized())
+def test_roundtrip(q):
+    quantizer, vs = q
+    low, high, precision = quantizer.low, quantizer.high, quantizer.precision
+    rounding = 1e-14 * max(low.length, high.length)
+    for v in vs:
+        w = quantizer.dequantize(quantizer.quantize(v))
+        assert abs(w.x - v.x) <= precision + rounding
+        assert abs(w.y - v.y) <= precision + rounding
+        assert w.isclose(v, abs_tol=precision * math.sqrt(2), rel_tol=1e-14, rel_to=[low, high])
+
+
+@given(q=quantized())
+def test_codes(q):
+    quantizer, vs = q
+    for v in vs:
+        qx, qy = quantizer.quantize(v)
+        assert 0 <= qx < 1 << quantizer.x_bits
+        assert 0 <= qy < 1 << quantizer.y_bits
+
+
+@given(quantizer=quantizers())
+def test_minimal_bits(quantizer):
+    """One bit less per coordinate would be too coarse for the precision."""
+    size = quantizer.high - quantizer.low
+    for bits, span in [(quantizer.x_bits, size.x), (quantizer.y_bits, size.y)]:
+        if bits:
+            assert (1 << (bits - 1)) - 1 < span / (2 * quantizer.precision)
+        else:
+            # Spans too small for span / (2 * precision) to be representable,
+            #  such as subnormal ones, also need no bits
+            assert span <= quantizer.precision
+
+
+@given(q=quantized())
+def test_pack(q):
+    quantizer, vs = q
+    for v in vs:
+        code = quantizer.pack(v)
+        assert 0 <= code < 1 << quantizer.bits
+        assert quantizer.unpack(code) == quantizer.dequantize(quantizer.quantize(v))
+
+
+@given(q=quantized(max_size=100))
+def test_encode(q):
+    quantizer, vs = q
+    data = quantizer.encode(vs)
+    assert len(data) == math.ceil(len(vs) * quantizer.bits / 8)
+    assert quantizer.encode(Vector2Batch(vs)) == data
+
+    decoded = quantizer.decode(data, len(vs))
+    assert decoded == Vector2Batch(quantizer.dequantize(quantizer.quantize(v)) for v in vs)
+
+
+def test_single_point():
+    quantizer = Quantizer((1, 2), (1, 2), precision=1)
+    assert quantizer.bits == 0
+    assert quantizer.quantize((1, 2)) == (0, 0)
+    assert quantizer.encode([(1, 2)] * 3) == b''
+    assert list(quantizer.decode(b'', 3)) == [Vector2(1, 2)] * 3
+
+
+@pytest.mark.parametrize("vector", [(-1, 0), (0, 11), (math.nan, 0), (math.inf, 0)])
+def test_out_of_bounds(vector):
+    quantizer = Quantizer((-0.5, 0), (10, 10), precision=0.1)
+    with pytest.raises(ValueError):
+        quantizer.quantize(vector)
+    with pytest.raises(ValueError):
+        quantizer.encode([(0, 0), vector])
+
+
+@pytest.mark.parametrize("low, high, precision", [
+    ((0, 0), (1, 1), 0),
+    ((0, 0), (1, 1), -1),
+    ((0, 0), (1, 1), math.nan),
+    ((0, 0), (1, 1), math.inf),
+    ((1, 0), (0, 1), 0.1),
+    ((0, 0), (1, math.nan), 0.1),
+    ((0, -math.inf), (1, 1), 0.1),
+    ((0, 0), (1e10, 1), 1e-10),
+])
+def test_invalid(low, high, precision):
+    with pytest.raises(ValueError):
+        Quantizer(low, high, precision)
+
+
+def test_decode_size():
+    quantizer = Quantizer((0, 0), (127, 63), precision=0.5)
+    data = quantizer.encode([(0, 0)] * 3)
+    with pytest.raises(ValueError):
+        quantizer.decode(data, 2)
+    with pytest.raises(ValueError):
+        quantizer.decode(data + b'\0', 3)
@@ -0,0 +1,110 @@
+import math
+
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector2, Vector2Batch
+from ppb_vector.reductions import bounding_box, mean, min_max_length, vsum, weighted_mean
+from utils import floats, vectors
+
+# Whether to pass the vectors as a list, or as a batch
+containers = pytest.mark.parametrize("container", [list, Vector2Batch])
+compensated = pytest.mark.parametrize("compensated", [False, True])
+
+
+@containers
+@compensated
+@given(vs=st.lists(vectors(max_magnitude=1e30)))
+def test_vsum(container, compensated, vs):
+    expected = sum(vs, Vector2(0, 0))
+    result = vsum(container(vs), compensated=compensated)
+    assert result.isclose(expected, rel_to=vs, rel_tol=1e-9 * len(vs))
+
+
+@containers
+@compensated
+@given(n=st.integers(min_value=1, max_value=1000))
+def test_vsum_cancellation(container, compensated, n):
+    """Compensated sums are exact on values that cancel out."""
+    vs = [Vector2(1e16, 1), Vector2(1, -1e16), Vector2(-1e16, 1e16)] * n + [Vector2(1, 1)]
+    result = vsum(container(vs), compensated=compensated)
+    if compensated:
+        assert result == (n + 1, n + 1)
+
+
+@containers
+def test_vsum_vector_likes(container):
+    assert vsum(container([(1, 2), [3, 4], {'x': 5, 'y': 6}])) == (9, 12)
+
+
+@containers
+def test_empty(container):
+    assert vsum(container()) == (0, 0)
+    for f in (mean, bounding_box, min_max_length):
+        with pytest.raises(ValueError):
+            f(container())
+
+
+@containers
+@compensated
+@given(vs=st.lists(vectors(max_magnitude=1e30), min_size=1))
+def test_mean(container, compensated, vs):
+    result = mean(container(vs), compensated=compensated)
+    assert result.isclose(sum(vs, Vector2(0, 0)) / len(vs), rel_to=vs, rel_tol=1e-9 * len(vs))
+
+
+@containers
+@compensated
+@given(data=st.data())
+def test_weighted_mean(container, compensated, data):
+    vs = data.draw(st.lists(vectors(max_magnitude=1e30), min_size=1))
+    weights = data.draw(st.lists(floats(1e10).filter(lambda w: w > 1e-10),
+                                 min_size=len(vs), max_size=len(vs)))
+    result = weighted_mean(container(vs), weights, compensated=compensated)
+    total = math.fsum(weights)
+    expected = sum(map(Vector2.scale_by, vs, weights), Vector2(0, 0)) / total
+    assert result.isclose(expected, rel_to=vs, rel_tol=1e-9 * len(vs))
+
+
+@containers
+@compensated
+def test_weighted_mean_mismatched(container, compensated):
+    with pytest.raises(ValueError):
+        weighted_mean(container([(1, 2), (3, 4)]), [1], compensated=compensated)
+
+    with pytest.raises(ValueError):
+        weighted_mean(container([(1, 2)]), [1, 2], compensated=compensated)
+
+    with pytest.raises(ValueError):
+        weighted_mean(container([(1, 2), (3, 4)]), [1, -1], compensated=compensated)
+
+
+@containers
+@given(vs=st.lists(vectors(), min_size=1))
+def test_bounding_box(container, vs):
+    low, high = bounding_box(container(vs))
+    assert low == (min(v.x for v in vs), min(v.y for v in vs))
+    assert high == (max(v.x for v in vs), max(v.y for v in vs))
+
+
+@containers
+@given(vs=st.lists(vectors(), min_size=1))
+def test_min_max_length(container, vs):
+    lengths = [v.length for v in vs]
+    assert min_max_length(container(vs)) == (min(lengths), max(lengths))
+
+
+class Position(Vector2):
+    pass
+
+
+@pytest.mark.parametrize("reduction", [
+    vsum, mean, lambda vs: weighted_mean(vs, [1, 2]), lambda vs: bounding_box(vs)[1],
+], ids=["vsum", "mean", "weighted_mean", "bounding_box"])
+def test_element_type(reduction):
+    points = [(0, 0), (3, 6)]
+    batch = Vector2Batch(points, element_type=Position)
+    assert type(reduction(batch)) is Position
+    assert type(reduction(batch[::-1])) is Position
+    assert type(reduction(points)) is Vector2
@@ -0,0 +1,156 @@
+import math
+
+import hypothesis.strategies as st
+import pytest  # type: ignore
+from hypothesis import assume, given
+
+from ppb_vector import Vector2, Vector2Batch
+from ppb_vector.segments import _intersect, Hit, intersections, raycast, SegmentBatch
+from utils import vectors
+
+
+def small_vectors():
+    """Vectors on a coarse grid, so that collinear and touching segments are frequent."""
+    coordinates = st.integers(-5, 5).map(float)
+    return st.builds(Vector2, coordinates, coordinates)
+
+
+def segment_batches(vectors=small_vectors):
+    return st.lists(st.tuples(vectors(), vectors())).map(SegmentBatch)
+
+
+def brute_force(segments):
+    result = []
+    for i, (a, b) in enumerate(segments):
+        for j in range(i + 1, len(segments)):
+            c, d = segments[j]
+            point = _intersect(a.x, a.y, b.x, b.y, c.x, c.y, d.x, d.y)
+            if point is not None:
+                result.append((i, j, Vector2(*point)))
+    return result
+
+
+@given(segments=st.lists(st.tuples(vectors(), vectors())))
+def test_batch_roundtrip(segments):
+    batch = SegmentBatch(segments)
+    assert list(batch) == segments
+    assert batch == SegmentBatch.from_endpoints((a for a, _ in segments), (b for _, b in segments))
+    assert list(batch[1:]) == segments[1:]
+
+
+def test_from_endpoints_mismatched():
+    with pytest.raises(ValueError):
+        SegmentBatch.from_endpoints([(0, 0), (1, 1)], [(1, 1)])
+
+
+@pytest.mark.parametrize("closed", [False, True])
+@given(vertices=st.lists(vectors()))
+def test_from_polyline(closed, vertices):
+    batch = SegmentBatch.from_polyline(vertices, closed=closed)
+    expected = list(zip(vertices, vertices[1:]))
+    if closed and vertices:
+        expected.append((vertices[-1], vertices[0]))
+    assert list(batch) == expected
+
+
+@given(segments=st.lists(st.tuples(vectors(), vectors()), min_size=1), data=st.data())
+def test_batch_mutation(segments, data):
+    batch = SegmentBatch(segments)
+    i = data.draw(st.integers(-len(segments), len(segments) - 1))
+    segment = data.draw(st.tuples(vectors(), vectors()))
+
+    batch[i] = segments[i] = segment
+    assert list(batch) == segments
+
+    del batch[i], segments[i]
+    assert list(batch) == segments
+
+    batch.insert(i, segment)
+    segments.insert(i, segment)
+    assert list(batch) == segments
+
+
+@pytest.mark.parametrize("a, b, c, d, expected", [
+    # Crossing
+    ((0, 0), (2, 2), (0, 2), (2, 0), (1, 1)),
+    # T junction
+    ((0, 0), (2, 0), (1, 0), (1, 1), (1, 0)),
+    # Common endpoint
+    ((0, 0), (1, 0), (1, 0), (1, 1), (1, 0)),
+    # Disjoint
+    ((0, 0), (1, 0), (2, 1), (2, 2), None),
+    # Parallel
+    ((0, 0), (1, 0), (0, 1), (1, 1), None),
+    # Collinear, disjoint
+    ((0, 0), (1, 0), (2, 0), (3, 0), None),
+    # Collinear, overlapping
+    ((0, 0), (2, 0), (1, 0), (3, 0), (1, 0)),
+    ((2, 0), (0, 0), (1, 0), (3, 0), (2, 0)),
+    ((0, 0), (3, 0), (1, 0), (2, 0), (1, 0)),
+    # Points
+    ((1, 1), (1, 1), (0, 0), (2, 2), (1, 1)),
+    ((1, 1), (1, 1), (1, 1), (1, 1), (1, 1)),
+    ((1, 1), (1, 1), (1, 2), (1, 2), None),
+])
+def test_intersect(a, b, c, d, expected):
+    assert _intersect(*a, *b, *c, *d) == expected
+
+
+@given(segments=segment_batches())
+def test_intersections(segments):
+    assert intersections(segments) == brute_force(segments)
+
+
+@given(segments=segment_batches(lambda: vectors(max_magnitude=1e3)))
+def test_intersections_general(segments):
+    assert intersections(segments) == brute_force(segments)
+
+
+def brute_force_raycast(segments, origin, direction):
+    # Cast along a long segment, and find the closest intersection
+    far = origin + direction * 1e6
+    hits = [
+        (Vector2(*point), i) for i, (a, b) in enumerate(segments)
+        for point in [_intersect(origin.x, origin.y, far.x, far.y, a.x, a.y, b.x, b.y)]
+        if point is not None
+    ]
+    return min(hits, key=lambda hit: ((hit[0] - origin).length, hit[1]), default=None)
+
+
+@given(segments=segment_batches(), origin=small_vectors(), direction=small_vectors())
+def test_raycast(segments, origin, direction):
+    assume(direction != (0, 0))
+    hit = raycast(segments, origin, direction)
+    expected = brute_force_raycast(segments, origin, direction)
+    if expected is None:
+        assert hit is None
+        return
+
+    assert isinstance(hit, Hit)
+    point, segment = expected
+    assert hit.segment == segment
+    assert hit.point.isclose(point)
+    assert math.isclose(hit.distance, (point - origin).length, abs_tol=1e-9)
+
+
+@given(segments=segment_batches(), origin=small_vectors(), direction=small_vectors(),
+       max_distance=st.floats(min_value=0, max_value=10))
+def test_raycast_max_distance(segments, origin, direction, max_distance):
+    assume(direction != (0, 0))
+    hit = raycast(segments, origin, direction)
+    limited = raycast(segments, origin, direction, max_distance=max_distance)
+    if hit is not None and hit.distance <= max_distance:
+        assert limited == hit
+    else:
+        assert limited is None
+
+
+def test_raycast_zero_direction():
+    with pytest.raises(ValueError):
+        raycast(SegmentBatch(), (0, 0), (0, 0))
+
+
+def test_raycast_batch_of_endpoints():
+    walls = SegmentBatch.from_endpoints(Vector2Batch([(1, -1), (3, -1)]), [(1, 1), (3, 1)])
+    assert raycast(walls, (0, 0), (1, 0)) == Hit(0, Vector2(1, 0), 1)
+    assert raycast(walls, (2, 0), (1, 0)) == Hit(1, Vector2(3, 0), 1)
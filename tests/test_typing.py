@@ -71,3 +71,48 @@ def test_binop_vectorlike(op, x: Vector2, y: Vector2):
 
     for y_like in vector_likes(y):
         assert op(x, y_like) == result
+
+
+class V3(V1, V2):
+    """Subclass of both V1 and V2."""
+
+    pass
+
+
+@pytest.mark.parametrize("op", BINARY_OPS)
+@given(x=vectors(), y=units())
+def test_binop_different_deterministic(op, x: Vector2, y: Vector2):
+    """Between unrelated subclasses, the type of the left operand wins."""
+    assert type(op(V1(x), V2(y))) is V1
+    assert type(op(V2(x), V1(y))) is V2
+
+
+@pytest.mark.parametrize("op", BINARY_OPS)
+@given(x=vectors(), y=units())
+def test_binop_diamond(op, x: Vector2, y: Vector2):
+    assert type(op(V3(x), V1(y))) is V3
+    assert type(op(V2(x), V3(y))) is V3
+
+
+@pytest.mark.parametrize("op", BINARY_OPS)
+@given(x=vectors(), y=units())
+def test_binop_vectorlike_type(op, x: Vector2, y: Vector2):
+    for y_like in vector_likes(y):
+        assert type(op(V1(x), y_like)) is V1
+
+
+def test_result_types_bounded():
+    """Resolving result types doesn't keep short-lived subclasses alive."""
+    import gc
+    import weakref
+    from ppb_vector import vector2
+
+    classes = [type(f'V{i}', (Vector2,), {}) for i in range(2 * vector2._RESULT_TYPES_MAXSIZE)]
+    for left, right in zip(classes, classes[1:]):
+        assert type(left(1, 2) + right(3, 4)) is left
+    assert len(vector2._result_types) <= vector2._RESULT_TYPES_MAXSIZE
+
+    first = weakref.ref(classes[0])
+    del classes, left, right
+    gc.collect()
+    assert first() is None
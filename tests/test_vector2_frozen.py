@@ -0,0 +1,37 @@
+from dataclasses import FrozenInstanceError
+
+import pytest  # type: ignore
+from hypothesis import given
+
+from ppb_vector import Vector2
+from utils import floats, vectors
+
+
+class V(Vector2):
+    pass
+
+
+@pytest.mark.parametrize("cls", [Vector2, V])
+@given(v=vectors(), value=floats())
+def test_assign_field(cls, v: Vector2, value: float):
+    v = cls(v)
+    with pytest.raises(FrozenInstanceError):
+        v.x = value  # type: ignore
+
+    with pytest.raises(FrozenInstanceError):
+        del v.y  # type: ignore
+
+
+@given(v=vectors())
+def test_assign_other(v: Vector2):
+    with pytest.raises(AttributeError):
+        v.z = 0  # type: ignore
+
+
+@given(v=vectors())
+def test_subclass_attributes(v: Vector2):
+    """Subclasses without __slots__ can have extra attributes."""
+    v = V(v)
+    v.z = 0  # type: ignore
+    assert v.z == 0  # type: ignore
+    del v.z  # type: ignore
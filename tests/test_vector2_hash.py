@@ -0,0 +1,49 @@
+from hypothesis import given
+
+from ppb_vector import PolarVector2, Vector2
+from utils import vector_likes, vectors
+
+
+class V(Vector2):
+    pass
+
+
+@given(x=vectors())
+def test_hash_equal(x: Vector2):
+    """Equal vectors, and hashable vector-likes, have equal hashes."""
+    assert hash(x) == hash(Vector2(x.x, x.y)) == hash(V(x))
+    for x_like in vector_likes(x):
+        try:
+            h = hash(x_like)
+        except TypeError:
+            continue
+        assert x == x_like
+        assert hash(x) == h
+
+
+@given(x=vectors())
+def test_hash_polar(x: Vector2):
+    polar = PolarVector2.from_vector(x)
+    assert hash(polar) == hash(polar.to_vector())
+    rebuilt = PolarVector2(polar.length, polar.heading)
+    assert hash(rebuilt) == hash(rebuilt.to_vector())
+    # Rebuilding may round the coordinates differently, but equality and
+    #  hashing must agree, and equality must be transitive through Vector2.
+    assert (polar == rebuilt) == (x == rebuilt) == (polar.to_vector() == rebuilt.to_vector())
+    if polar == rebuilt:
+        assert hash(polar) == hash(rebuilt)
+
+
+def test_hash_polar_rebuilt():
+    polar = PolarVector2.from_vector((3, 4))
+    rebuilt = PolarVector2(polar.length, polar.heading)
+    assert (polar == rebuilt) == (rebuilt == Vector2(3, 4))
+    assert ({polar: 1}.get(rebuilt) == 1) == (polar == rebuilt)
+
+
+def test_hash_keys():
+    vectors = {Vector2(1, 2): 'a', Vector2(0.0, 0.0): 'zero'}
+    assert vectors[(1, 2)] == 'a'
+    assert vectors[V(1.0, 2.0)] == 'a'
+    assert vectors[Vector2(-0.0, 0)] == 'zero'
+    assert {Vector2(1, 2), (1, 2), (1.0, 2.0), V(1, 2)} == {(1, 2)}
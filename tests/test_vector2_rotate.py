@@ -1,4 +1,6 @@
 import math
+from decimal import Decimal
+from fractions import Fraction
 from math import sqrt
 
 import hypothesis.strategies as st
@@ -195,3 +197,42 @@ def test_rotation_linearity(x, y, scalar, angle):
     note(f"Inner: {inner}")
     note(f"Outer: {outer}")
     assert inner.isclose(outer, rel_to=[x, scalar * x, y])
+
+
+table_angles = [
+    *range(-360, 361),
+    *(k * 360 / 64 for k in range(-64, 65)),
+    Decimal(90), Fraction(45, 8), -0.0, 0.0,
+]
+
+
+@pytest.mark.parametrize("angle", table_angles, ids=repr)
+def test_trig_table(angle):
+    """Cached values of Vector2._trig are exactly the computed ones."""
+    Vector2._trig(0.5)  # Fill the table
+    assert Vector2._trig(angle) == Vector2._compute_trig(angle)
+    assert [math.copysign(1, x) for x in Vector2._trig(angle)] == \
+        [math.copysign(1, x) for x in Vector2._compute_trig(angle)]
+
+
+@given(angle=angles())
+def test_trig_cached(angle: float):
+    assert Vector2._trig(angle) == Vector2._compute_trig(angle)
+
+
+class UnhashableAngle:
+    """A float-convertible angle which, defining __eq__ only, isn't hashable."""
+
+    def __init__(self, value):
+        self.value = value
+
+    def __float__(self):
+        return float(self.value)
+
+    def __eq__(self, other):
+        return float(self) == other
+
+
+@pytest.mark.parametrize("angle", [90, 0.5, -0.0], ids=repr)
+def test_rotate_unhashable_angle(angle):
+    assert Vector2(1, 2).rotate(UnhashableAngle(angle)) == Vector2(1, 2).rotate(angle)
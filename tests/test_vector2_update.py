@@ -1,3 +1,5 @@
+import dataclasses
+
 from hypothesis import given
 
 from ppb_vector import Vector2
@@ -17,3 +19,12 @@ def test_update_y(v: Vector2, y: float):
 @given(v=vectors(), x=floats(), y=floats())
 def test_update_xy(v: Vector2, x: float, y: float):
     assert v.update(x=x, y=y) == (x, y)
+
+
+@given(v=vectors(), x=floats())
+def test_dataclass(v: Vector2, x: float):
+    """Vector2 still works with the functions of the dataclasses module."""
+    assert dataclasses.is_dataclass(v)
+    assert [field.name for field in dataclasses.fields(v)] == ['x', 'y']
+    assert dataclasses.asdict(v) == v.asdict()
+    assert dataclasses.replace(v, x=x) == v.update(x=x)